@@ -0,0 +1,33 @@
+"""Add composite index on posts (subreddit_id, created_utc)
+
+Revision ID: 7c2e9a4b1d3f
+Revises: phase5_heavy_models
+Create Date: 2026-10-17 09:12:41.318204
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7c2e9a4b1d3f"
+down_revision: Union[str, Sequence[str], None] = "phase5_heavy_models"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Latest-posts-per-subreddit lookups (e.g. `data collect --comments-only`)
+    op.create_index(
+        "ix_posts_subreddit_id_created_utc",
+        "posts",
+        ["subreddit_id", "created_utc"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_posts_subreddit_id_created_utc", table_name="posts")
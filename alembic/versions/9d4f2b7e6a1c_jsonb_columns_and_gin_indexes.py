@@ -0,0 +1,137 @@
+"""Store JSON columns as JSONB and add GIN indexes on the filtered ones
+
+Revision ID: 9d4f2b7e6a1c
+Revises: 7c2e9a4b1d3f
+Create Date: 2026-10-17 14:05:22.906417
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "9d4f2b7e6a1c"
+down_revision: Union[str, Sequence[str], None] = "7c2e9a4b1d3f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# JSON columns stored as JSONB on PostgreSQL, by table
+JSONB_COLUMNS = {
+    "text_analysis": ["emotion_scores", "keywords", "entities", "topics"],
+    "topics": ["topic_words", "representative_posts"],
+    "subreddit_topic_profiles": [
+        "dominant_topics",
+        "topic_distribution",
+        "topic_sentiment_map",
+    ],
+    "community_overlaps": ["shared_topics"],
+    "political_dimensions_analyses": [
+        "economic_evidence",
+        "social_evidence",
+        "governance_evidence",
+    ],
+    "subreddit_political_dimensions": [
+        "economic_distribution",
+        "social_distribution",
+        "governance_distribution",
+        "dimension_correlation",
+        "political_clusters",
+        "cluster_sizes",
+    ],
+    "advanced_topics": ["top_words", "representative_docs", "embedding"],
+    "topic_evolution": ["word_changes", "merged_with", "split_into"],
+    "argument_structures": [
+        "components",
+        "relationships",
+        "main_claims",
+        "conclusions",
+        "fallacies_detected",
+    ],
+    "collection_jobs": ["config"],
+    "data_quality_metrics": ["tags"],
+    "system_metrics": ["tags"],
+    "user_metrics": ["detailed_metrics"],
+}
+
+# (table, column, jsonb_path_ops); path_ops only serves @> containment, the
+# default opclass is kept where queries test key existence (?, ?|, ?&)
+GIN_INDEXES = [
+    ("text_analysis", "keywords", True),
+    ("text_analysis", "entities", True),
+    ("text_analysis", "topics", True),
+    ("text_analysis", "emotion_scores", False),
+    ("topics", "topic_words", True),
+    ("subreddit_topic_profiles", "dominant_topics", True),
+    ("subreddit_topic_profiles", "topic_distribution", False),
+    ("political_dimensions_analyses", "economic_evidence", True),
+    ("subreddit_political_dimensions", "political_clusters", True),
+    ("advanced_topics", "top_words", True),
+    ("collection_jobs", "config", True),
+    ("data_quality_metrics", "tags", True),
+    ("system_metrics", "tags", True),
+    ("user_metrics", "detailed_metrics", False),
+]
+
+
+def _gin_index_name(table: str, column: str) -> str:
+    return f"ix_{table}_{column}_gin"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # SQLite has no JSONB or GIN; its JSON columns are left as they are
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    for table, columns in JSONB_COLUMNS.items():
+        for column in columns:
+            op.alter_column(
+                table,
+                column,
+                type_=postgresql.JSONB(),
+                existing_type=sa.JSON(),
+                postgresql_using=f"{column}::jsonb",
+            )
+
+    # Built concurrently so large tables stay writable; that cannot run inside
+    # the migration transaction
+    with op.get_context().autocommit_block():
+        for table, column, path_ops in GIN_INDEXES:
+            op.create_index(
+                _gin_index_name(table, column),
+                table,
+                [column],
+                unique=False,
+                postgresql_using="gin",
+                postgresql_ops={column: "jsonb_path_ops"} if path_ops else {},
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    with op.get_context().autocommit_block():
+        for table, column, _ in GIN_INDEXES:
+            op.drop_index(
+                _gin_index_name(table, column),
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+
+    for table, columns in JSONB_COLUMNS.items():
+        for column in columns:
+            op.alter_column(
+                table,
+                column,
+                type_=sa.JSON(),
+                existing_type=postgresql.JSONB(),
+                postgresql_using=f"{column}::json",
+            )
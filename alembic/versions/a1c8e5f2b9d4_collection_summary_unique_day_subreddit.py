@@ -0,0 +1,48 @@
+"""Make collection summaries unique per day and subreddit
+
+Revision ID: a1c8e5f2b9d4
+Revises: f3b9d6c2e8a5
+Create Date: 2026-10-17 17:48:13.602957
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a1c8e5f2b9d4"
+down_revision: Union[str, Sequence[str], None] = "f3b9d6c2e8a5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Keep the newest row of any duplicates so the unique index can be built
+    op.execute(
+        "DELETE FROM collection_summaries WHERE id NOT IN "
+        "(SELECT max(id) FROM collection_summaries GROUP BY date, subreddit_name)"
+    )
+    op.create_index(
+        "ix_collection_summaries_date_subreddit",
+        "collection_summaries",
+        ["date", "subreddit_name"],
+        unique=True,
+    )
+
+    # Covered by the leading column of the unique index
+    op.drop_index("ix_collection_summaries_date", table_name="collection_summaries")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(
+        "ix_collection_summaries_date",
+        "collection_summaries",
+        ["date"],
+        unique=False,
+    )
+    op.drop_index(
+        "ix_collection_summaries_date_subreddit", table_name="collection_summaries"
+    )
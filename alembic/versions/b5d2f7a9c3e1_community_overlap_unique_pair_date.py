@@ -0,0 +1,39 @@
+"""Make community overlap snapshots unique per subreddit pair and date
+
+Revision ID: b5d2f7a9c3e1
+Revises: a1c8e5f2b9d4
+Create Date: 2026-10-17 18:20:41.137852
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b5d2f7a9c3e1"
+down_revision: Union[str, Sequence[str], None] = "a1c8e5f2b9d4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Keep the newest row of any duplicates so the constraint can be added
+    op.execute(
+        "DELETE FROM community_overlaps WHERE id NOT IN "
+        "(SELECT max(id) FROM community_overlaps "
+        "GROUP BY subreddit_a_id, subreddit_b_id, analysis_date)"
+    )
+    # Batch mode so SQLite, which cannot ALTER TABLE ADD CONSTRAINT, works too
+    with op.batch_alter_table("community_overlaps") as batch_op:
+        batch_op.create_unique_constraint(
+            "uq_community_overlaps_pair_date",
+            ["subreddit_a_id", "subreddit_b_id", "analysis_date"],
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("community_overlaps") as batch_op:
+        batch_op.drop_constraint("uq_community_overlaps_pair_date", type_="unique")
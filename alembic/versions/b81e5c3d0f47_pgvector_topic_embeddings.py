@@ -0,0 +1,78 @@
+"""Store advanced topic embeddings as pgvector vectors with an HNSW index
+
+Revision ID: b81e5c3d0f47
+Revises: 9d4f2b7e6a1c
+Create Date: 2026-10-17 14:41:08.552930
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+from pgvector.sqlalchemy import Vector
+from sqlalchemy.dialects import postgresql
+
+from reddit_analyzer.models.advanced_topic import EMBEDDING_DIM
+from reddit_analyzer.models.base import HNSW_BUILD_PARAMS
+
+# revision identifiers, used by Alembic.
+revision: str = "b81e5c3d0f47"
+down_revision: Union[str, Sequence[str], None] = "9d4f2b7e6a1c"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _applies() -> bool:
+    # The model maps embedding to vector(n) on every PostgreSQL database
+    return op.get_bind().dialect.name == "postgresql"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if not _applies():
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS vector")
+    # JSON arrays print as '[x, y, ...]', which is also pgvector's text format
+    op.alter_column(
+        "advanced_topics",
+        "embedding",
+        type_=Vector(EMBEDDING_DIM),
+        existing_type=postgresql.JSONB(),
+        postgresql_using=f"embedding::text::vector({EMBEDDING_DIM})",
+    )
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_advanced_topics_embedding_hnsw",
+            "advanced_topics",
+            ["embedding"],
+            unique=False,
+            postgresql_using="hnsw",
+            postgresql_ops={"embedding": "vector_cosine_ops"},
+            postgresql_with=HNSW_BUILD_PARAMS,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if not _applies():
+        return
+
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_advanced_topics_embedding_hnsw",
+            table_name="advanced_topics",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+    op.alter_column(
+        "advanced_topics",
+        "embedding",
+        type_=postgresql.JSONB(),
+        existing_type=Vector(EMBEDDING_DIM),
+        postgresql_using="embedding::text::jsonb",
+    )
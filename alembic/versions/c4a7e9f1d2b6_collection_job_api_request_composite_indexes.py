@@ -0,0 +1,81 @@
+"""Replace single-column job/API request indexes with composite ones
+
+Revision ID: c4a7e9f1d2b6
+Revises: b81e5c3d0f47
+Create Date: 2026-10-17 15:12:37.284019
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c4a7e9f1d2b6"
+down_revision: Union[str, Sequence[str], None] = "b81e5c3d0f47"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_collection_jobs_status_type_created",
+        "collection_jobs",
+        ["status", "job_type", "created_at"],
+        unique=False,
+        postgresql_include=["items_collected", "items_stored"],
+    )
+    op.create_index(
+        "ix_collection_jobs_subreddit_status_started",
+        "collection_jobs",
+        ["subreddit_name", "status", "started_at"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_api_requests_endpoint_created",
+        "api_requests",
+        ["endpoint", "created_at"],
+        unique=False,
+        postgresql_include=["response_time_ms"],
+    )
+    op.create_index(
+        "ix_api_requests_status_code_created",
+        "api_requests",
+        ["status_code", "created_at"],
+        unique=False,
+    )
+
+    # Covered by the leading column of the composites above
+    op.drop_index("ix_collection_jobs_status", table_name="collection_jobs")
+    op.drop_index("ix_collection_jobs_subreddit_name", table_name="collection_jobs")
+    op.drop_index("ix_api_requests_endpoint", table_name="api_requests")
+    op.drop_index("ix_api_requests_status_code", table_name="api_requests")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(
+        "ix_api_requests_status_code", "api_requests", ["status_code"], unique=False
+    )
+    op.create_index(
+        "ix_api_requests_endpoint", "api_requests", ["endpoint"], unique=False
+    )
+    op.create_index(
+        "ix_collection_jobs_subreddit_name",
+        "collection_jobs",
+        ["subreddit_name"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_collection_jobs_status", "collection_jobs", ["status"], unique=False
+    )
+
+    op.drop_index("ix_api_requests_status_code_created", table_name="api_requests")
+    op.drop_index("ix_api_requests_endpoint_created", table_name="api_requests")
+    op.drop_index(
+        "ix_collection_jobs_subreddit_status_started", table_name="collection_jobs"
+    )
+    op.drop_index(
+        "ix_collection_jobs_status_type_created", table_name="collection_jobs"
+    )
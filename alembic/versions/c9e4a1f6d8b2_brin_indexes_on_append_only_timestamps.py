@@ -0,0 +1,90 @@
+"""Replace btree indexes on append-only timestamps with BRIN indexes
+
+Revision ID: c9e4a1f6d8b2
+Revises: b5d2f7a9c3e1
+Create Date: 2026-10-17 18:46:09.724410
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+from reddit_analyzer.models.collection_job import PARTITIONED_METRIC_TABLES
+
+# revision identifiers, used by Alembic.
+revision: str = "c9e4a1f6d8b2"
+down_revision: Union[str, Sequence[str], None] = "b5d2f7a9c3e1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column, btree index it replaces or None)
+BRIN_INDEXES = [
+    ("api_requests", "created_at", "ix_api_requests_created_at"),
+    ("system_metrics", "created_at", "ix_system_metrics_created_at"),
+    ("data_quality_metrics", "calculated_at", "ix_data_quality_metrics_calculated_at"),
+    ("text_analysis", "processed_at", None),
+    ("advanced_topics", "created_at", None),
+]
+
+PAGES_PER_RANGE = 32
+
+
+def _brin_index_name(table: str, column: str) -> str:
+    return f"ix_{table}_{column}_brin"
+
+
+def _concurrently(table: str) -> bool:
+    # Partitioned parents cannot build or drop indexes concurrently
+    return table not in PARTITIONED_METRIC_TABLES
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # SQLite has no BRIN; its models keep a btree under the new name
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    with op.get_context().autocommit_block():
+        for table, column, btree in BRIN_INDEXES:
+            op.create_index(
+                _brin_index_name(table, column),
+                table,
+                [column],
+                unique=False,
+                postgresql_using="brin",
+                postgresql_with={"pages_per_range": PAGES_PER_RANGE},
+                postgresql_concurrently=_concurrently(table),
+                if_not_exists=True,
+            )
+            if btree:
+                op.drop_index(
+                    btree,
+                    table_name=table,
+                    postgresql_concurrently=_concurrently(table),
+                    if_exists=True,
+                )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    with op.get_context().autocommit_block():
+        for table, column, btree in BRIN_INDEXES:
+            if btree:
+                op.create_index(
+                    btree,
+                    table,
+                    [column],
+                    unique=False,
+                    postgresql_concurrently=_concurrently(table),
+                    if_not_exists=True,
+                )
+            op.drop_index(
+                _brin_index_name(table, column),
+                table_name=table,
+                postgresql_concurrently=_concurrently(table),
+                if_exists=True,
+            )
@@ -0,0 +1,74 @@
+"""Replace btree indexes on mostly-NULL columns with partial indexes
+
+Revision ID: d2a7f4c8e1b6
+Revises: c9e4a1f6d8b2
+Create Date: 2026-10-17 19:21:37.402815
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "d2a7f4c8e1b6"
+down_revision: Union[str, Sequence[str], None] = "c9e4a1f6d8b2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column) pairs whose full btree index is replaced
+SPARSE_COLUMNS = [
+    ("user_metrics", "subreddit_name"),
+    ("topics", "subreddit_name"),
+    ("topics", "time_period"),
+    ("text_analysis", "post_id"),
+    ("text_analysis", "comment_id"),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    with op.get_context().autocommit_block():
+        for table, column in SPARSE_COLUMNS:
+            op.create_index(
+                f"ix_{table}_{column}_not_null",
+                table,
+                [column],
+                unique=False,
+                postgresql_where=sa.text(f"{column} IS NOT NULL"),
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+            op.drop_index(
+                f"ix_{table}_{column}",
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    with op.get_context().autocommit_block():
+        for table, column in SPARSE_COLUMNS:
+            op.create_index(
+                f"ix_{table}_{column}",
+                table,
+                [column],
+                unique=False,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+            op.drop_index(
+                f"ix_{table}_{column}_not_null",
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
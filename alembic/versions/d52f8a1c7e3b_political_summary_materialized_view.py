@@ -0,0 +1,50 @@
+"""Add materialized view of political dimension dashboard scalars
+
+Revision ID: d52f8a1c7e3b
+Revises: c4a7e9f1d2b6
+Create Date: 2026-10-17 15:48:10.731265
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d52f8a1c7e3b"
+down_revision: Union[str, Sequence[str], None] = "c4a7e9f1d2b6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # SQLite has no materialized views; dashboards read the base table there
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.execute("""
+        CREATE MATERIALIZED VIEW IF NOT EXISTS mv_subreddit_political_summary AS
+        SELECT id, subreddit_id, analysis_start_date, analysis_end_date,
+               avg_economic_score, avg_social_score, avg_governance_score,
+               political_diversity_index, avg_confidence_level, created_at,
+               (dimension_correlation->>'econ_soc')::float AS corr_econ_soc
+        FROM subreddit_political_dimensions
+        """)
+    # REFRESH ... CONCURRENTLY needs a unique index
+    op.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS ix_mv_subreddit_political_summary_id "
+        "ON mv_subreddit_political_summary (id)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_mv_subreddit_political_summary_subreddit_end "
+        "ON mv_subreddit_political_summary (subreddit_id, analysis_end_date)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_subreddit_political_summary")
@@ -0,0 +1,103 @@
+"""Store the remaining JSON columns as JSONB
+
+Revision ID: e67b3d9a4c10
+Revises: d52f8a1c7e3b
+Create Date: 2026-10-17 16:20:54.118302
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "e67b3d9a4c10"
+down_revision: Union[str, Sequence[str], None] = "d52f8a1c7e3b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# JSON columns not converted by 9d4f2b7e6a1c, by table
+JSONB_COLUMNS = {
+    "ml_predictions": [
+        "prediction",
+        "probability_distribution",
+        "feature_importance",
+        "actual_value",
+    ],
+    "subreddit_analytics": [
+        "top_topics",
+        "engagement_metrics",
+        "growth_metrics",
+        "user_distribution",
+        "content_distribution",
+    ],
+    # Added by phase5_heavy_models
+    "text_analysis": [
+        "entity_sentiment",
+        "argument_structure",
+        "emotion_intensity",
+        "stance_results",
+    ],
+}
+
+GIN_INDEXES = [
+    ("ml_predictions", "prediction"),
+    ("subreddit_analytics", "top_topics"),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # SQLite has no JSONB or GIN; its JSON columns are left as they are
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    for table, columns in JSONB_COLUMNS.items():
+        for column in columns:
+            op.alter_column(
+                table,
+                column,
+                type_=postgresql.JSONB(),
+                existing_type=sa.JSON(),
+                postgresql_using=f"{column}::jsonb",
+            )
+
+    with op.get_context().autocommit_block():
+        for table, column in GIN_INDEXES:
+            op.create_index(
+                f"ix_{table}_{column}_gin",
+                table,
+                [column],
+                unique=False,
+                postgresql_using="gin",
+                postgresql_ops={column: "jsonb_path_ops"},
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    with op.get_context().autocommit_block():
+        for table, column in GIN_INDEXES:
+            op.drop_index(
+                f"ix_{table}_{column}_gin",
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+
+    for table, columns in JSONB_COLUMNS.items():
+        for column in columns:
+            op.alter_column(
+                table,
+                column,
+                type_=sa.JSON(),
+                existing_type=postgresql.JSONB(),
+                postgresql_using=f"{column}::json",
+            )
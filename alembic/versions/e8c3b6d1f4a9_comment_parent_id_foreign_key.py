@@ -0,0 +1,95 @@
+"""Reference parent comments by id with an indexed foreign key
+
+Revision ID: e8c3b6d1f4a9
+Revises: d2a7f4c8e1b6
+Create Date: 2026-10-17 19:58:12.604173
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "e8c3b6d1f4a9"
+down_revision: Union[str, Sequence[str], None] = "d2a7f4c8e1b6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+FK_NAME = "fk_comments_parent_id_comments"
+INDEX_NAME = "ix_comments_parent_id_not_null"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # parent_id held Reddit fullnames: "t1_<id>" for replies, "t3_<id>" when
+    # the parent is the post. Keep bare comment ids, NULL for top level.
+    op.execute(
+        "UPDATE comments SET parent_id = substr(parent_id, 4) "
+        "WHERE parent_id LIKE 't1\\_%' ESCAPE '\\'"
+    )
+    op.execute(
+        "UPDATE comments SET parent_id = NULL "
+        "WHERE parent_id LIKE 't3\\_%' ESCAPE '\\'"
+    )
+    # Parents that were never collected cannot be referenced
+    op.execute(
+        "UPDATE comments SET parent_id = NULL WHERE parent_id IS NOT NULL "
+        "AND parent_id NOT IN (SELECT id FROM comments)"
+    )
+
+    if op.get_bind().dialect.name != "postgresql":
+        op.create_index(
+            INDEX_NAME,
+            "comments",
+            ["parent_id"],
+            unique=False,
+            sqlite_where=sa.text("parent_id IS NOT NULL"),
+        )
+        with op.batch_alter_table("comments") as batch_op:
+            batch_op.create_foreign_key(
+                FK_NAME, "comments", ["parent_id"], ["id"], ondelete="SET NULL"
+            )
+        return
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            INDEX_NAME,
+            "comments",
+            ["parent_id"],
+            unique=False,
+            postgresql_where=sa.text("parent_id IS NOT NULL"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+    # NOT VALID skips the full-table check under the ALTER's lock; VALIDATE
+    # then scans with a lock that still allows writes
+    op.execute(
+        f"ALTER TABLE comments ADD CONSTRAINT {FK_NAME} "
+        "FOREIGN KEY (parent_id) REFERENCES comments (id) "
+        "ON DELETE SET NULL NOT VALID"
+    )
+    op.execute(f"ALTER TABLE comments VALIDATE CONSTRAINT {FK_NAME}")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        with op.batch_alter_table("comments") as batch_op:
+            batch_op.drop_constraint(FK_NAME, type_="foreignkey")
+        op.drop_index(INDEX_NAME, table_name="comments")
+    else:
+        op.drop_constraint(FK_NAME, "comments", type_="foreignkey")
+        with op.get_context().autocommit_block():
+            op.drop_index(
+                INDEX_NAME,
+                table_name="comments",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+
+    op.execute(
+        "UPDATE comments SET parent_id = 't1_' || parent_id "
+        "WHERE parent_id IS NOT NULL"
+    )
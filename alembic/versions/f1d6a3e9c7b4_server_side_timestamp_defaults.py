@@ -0,0 +1,70 @@
+"""Default timestamp columns to the current UTC time on the server
+
+Revision ID: f1d6a3e9c7b4
+Revises: e8c3b6d1f4a9
+Create Date: 2026-10-17 20:34:51.218706
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "f1d6a3e9c7b4"
+down_revision: Union[str, Sequence[str], None] = "e8c3b6d1f4a9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Columns whose default moves from Python to the database, per table
+TIMESTAMP_COLUMNS = {
+    "users": ["created_at", "updated_at"],
+    "subreddits": ["created_at", "updated_at"],
+    "posts": ["created_at", "updated_at"],
+    "comments": ["created_at", "updated_at"],
+    "collection_jobs": ["created_at", "updated_at"],
+    "api_requests": ["created_at"],
+    "data_quality_metrics": ["calculated_at"],
+    "system_metrics": ["created_at"],
+    "collection_summaries": ["created_at"],
+    "text_analysis": ["processed_at"],
+    "topics": ["created_at"],
+    "user_metrics": ["calculated_at"],
+    "subreddit_analytics": ["calculated_at"],
+    "ml_predictions": ["predicted_at"],
+    "subreddit_topic_profiles": ["created_at"],
+    "community_overlaps": ["analysis_date"],
+    "political_dimensions_analyses": ["created_at"],
+    "subreddit_political_dimensions": ["created_at"],
+    "advanced_topics": ["created_at"],
+    "topic_evolution": ["created_at"],
+    "argument_structures": ["processed_at"],
+}
+
+
+def _set_defaults(default) -> None:
+    postgresql = op.get_bind().dialect.name == "postgresql"
+    for table, columns in TIMESTAMP_COLUMNS.items():
+        if postgresql:
+            # A partitioned parent passes the new default on to its partitions
+            for column in columns:
+                op.alter_column(table, column, server_default=default)
+            continue
+        # SQLite cannot ALTER a column default in place
+        with op.batch_alter_table(table) as batch_op:
+            for column in columns:
+                batch_op.alter_column(column, server_default=default)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name == "postgresql":
+        _set_defaults(sa.text("timezone('utc', now())"))
+    else:
+        _set_defaults(sa.text("CURRENT_TIMESTAMP"))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _set_defaults(None)
@@ -0,0 +1,148 @@
+"""Partition api_requests and system_metrics by month on created_at
+
+Revision ID: f3b9d6c2e8a5
+Revises: e67b3d9a4c10
+Create Date: 2026-10-17 17:02:48.519330
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from reddit_analyzer.models.collection_job import (
+    PARTITIONED_METRIC_TABLES,
+    _month_start,
+)
+
+# revision identifiers, used by Alembic.
+revision: str = "f3b9d6c2e8a5"
+down_revision: Union[str, Sequence[str], None] = "e67b3d9a4c10"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Secondary indexes per table as (name, columns, extra create_index kwargs).
+# Indexes on a partitioned parent cannot be built concurrently, so they are
+# dropped with the old table and recreated on the parent, which cascades them
+# to every partition.
+METRIC_INDEXES = {
+    "api_requests": [
+        ("ix_api_requests_id", ["id"], {}),
+        ("ix_api_requests_created_at", ["created_at"], {}),
+        ("ix_api_requests_task_id", ["task_id"], {}),
+        (
+            "ix_api_requests_endpoint_created",
+            ["endpoint", "created_at"],
+            {"postgresql_include": ["response_time_ms"]},
+        ),
+        (
+            "ix_api_requests_status_code_created",
+            ["status_code", "created_at"],
+            {},
+        ),
+    ],
+    "system_metrics": [
+        ("ix_system_metrics_id", ["id"], {}),
+        ("ix_system_metrics_metric_name", ["metric_name"], {}),
+        ("ix_system_metrics_component", ["component"], {}),
+        ("ix_system_metrics_worker_name", ["worker_name"], {}),
+        ("ix_system_metrics_created_at", ["created_at"], {}),
+        (
+            "ix_system_metrics_tags_gin",
+            ["tags"],
+            {
+                "postgresql_using": "gin",
+                "postgresql_ops": {"tags": "jsonb_path_ops"},
+            },
+        ),
+    ],
+}
+
+# Future months created up front; later ones come from
+# ensure_metric_partitions
+MONTHS_AHEAD = 2
+
+
+def _create_indexes(table: str) -> None:
+    for name, columns, kwargs in METRIC_INDEXES[table]:
+        op.create_index(name, table, columns, unique=False, **kwargs)
+
+
+def _partition_table(table: str) -> None:
+    staging = f"{table}_partitioned"
+
+    # Rows without a timestamp would only ever land in the DEFAULT partition
+    op.execute(f"UPDATE {table} SET created_at = now() WHERE created_at IS NULL")
+
+    # The partition key has to be part of the primary key
+    op.execute(
+        f"CREATE TABLE {staging} (LIKE {table} INCLUDING DEFAULTS) "
+        "PARTITION BY RANGE (created_at)"
+    )
+    op.execute(f"ALTER TABLE {staging} ALTER COLUMN created_at SET NOT NULL")
+    op.execute(
+        f"ALTER TABLE {staging} ADD CONSTRAINT {staging}_pkey "
+        "PRIMARY KEY (id, created_at)"
+    )
+    op.execute(f"CREATE TABLE {table}_default PARTITION OF {staging} DEFAULT")
+
+    # One partition per month from the oldest row through MONTHS_AHEAD, so
+    # existing history can later be dropped month by month too
+    bind = op.get_bind()
+    oldest = bind.execute(sa.text(f"SELECT min(created_at)::date FROM {table}"))
+    oldest = oldest.scalar()
+    today = bind.execute(sa.text("SELECT current_date")).scalar()
+    month = _month_start(oldest or today)
+    last = _month_start(today, MONTHS_AHEAD)
+    while month <= last:
+        end = _month_start(month, 1)
+        op.execute(
+            f"CREATE TABLE {table}_{month:%Y_%m} PARTITION OF {staging} "
+            f"FOR VALUES FROM ('{month}') TO ('{end}')"
+        )
+        month = end
+
+    op.execute(f"INSERT INTO {staging} SELECT * FROM {table}")
+    op.execute(f"ALTER SEQUENCE {table}_id_seq OWNED BY {staging}.id")
+    op.drop_table(table)
+
+    op.execute(f"ALTER TABLE {staging} RENAME TO {table}")
+    op.execute(f"ALTER TABLE {table} RENAME CONSTRAINT {staging}_pkey TO {table}_pkey")
+    _create_indexes(table)
+
+
+def _unpartition_table(table: str) -> None:
+    staging = f"{table}_unpartitioned"
+
+    op.execute(f"CREATE TABLE {staging} (LIKE {table} INCLUDING DEFAULTS)")
+    op.execute(f"ALTER TABLE {staging} ALTER COLUMN created_at DROP NOT NULL")
+    op.execute(f"ALTER TABLE {staging} ADD CONSTRAINT {staging}_pkey PRIMARY KEY (id)")
+    op.execute(f"INSERT INTO {staging} SELECT * FROM {table}")
+    op.execute(f"ALTER SEQUENCE {table}_id_seq OWNED BY {staging}.id")
+
+    # Dropping the parent drops every partition with it
+    op.drop_table(table)
+
+    op.execute(f"ALTER TABLE {staging} RENAME TO {table}")
+    op.execute(f"ALTER TABLE {table} RENAME CONSTRAINT {staging}_pkey TO {table}_pkey")
+    _create_indexes(table)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Declarative partitioning is PostgreSQL-only; SQLite keeps plain tables
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    for table in PARTITIONED_METRIC_TABLES:
+        _partition_table(table)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    for table in PARTITIONED_METRIC_TABLES:
+        _unpartition_table(table)
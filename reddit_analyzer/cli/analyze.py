@@ -10,6 +10,7 @@ from rich.panel import Panel
 from rich.text import Text
 import json
 import numpy as np
+from sqlalchemy import select
 
 from reddit_analyzer.database import get_session
 from reddit_analyzer.models import (
@@ -18,6 +19,12 @@ from reddit_analyzer.models import (
     Comment,
     SubredditPoliticalDimensions,
 )
+from reddit_analyzer.models.political_analysis import (
+    POLITICAL_SUMMARY_COLUMNS,
+    political_summary_table,
+    refresh_political_summary,
+    upsert_community_overlaps,
+)
 from reddit_analyzer.services.topic_analyzer import TopicAnalyzer
 from reddit_analyzer.services.political_dimensions_analyzer import (
     PoliticalDimensionsAnalyzer,
@@ -378,6 +385,9 @@ def analyze_overlap(
     include_topics: bool = typer.Option(
         True, "--include-topics", help="Include shared topics analysis"
     ),
+    save_snapshot: bool = typer.Option(
+        False, "--save", "-s", help="Save overlap snapshot to database"
+    ),
 ):
     """Compare community overlap between two subreddits."""
     # Validate subreddits
@@ -420,9 +430,9 @@ def analyze_overlap(
                 .all()
             )
 
-            # Get unique authors
-            authors1 = set(p.author.username for p in posts1 if p.author)
-            authors2 = set(p.author.username for p in posts2 if p.author)
+            # Get unique authors by foreign key, without loading each User
+            authors1 = {p.author_id for p in posts1 if p.author_id is not None}
+            authors2 = {p.author_id for p in posts2 if p.author_id is not None}
 
             # Calculate overlap
             shared_authors = authors1 & authors2
@@ -481,8 +491,15 @@ def analyze_overlap(
                     },
                 }
 
+            if save_snapshot:
+                _save_overlap_snapshot(
+                    session, sub1.id, sub2.id, overlap_data, topic_data
+                )
+
     # Display results
     _display_overlap_analysis(sub1.name, sub2.name, overlap_data, topic_data)
+    if save_snapshot:
+        console.print("\n[green]Overlap snapshot saved to database.[/green]")
 
 
 def _display_topic_analysis_report(
@@ -935,18 +952,18 @@ def political_compass(
     if not sub:
         raise typer.Exit(1)
 
-    # Check if we have existing analysis
+    # Check if we have existing analysis; only the scalar summary is needed
     with get_session() as session:
-        recent_analysis = (
-            session.query(SubredditPoliticalDimensions)
-            .filter(
-                SubredditPoliticalDimensions.subreddit_id == sub.id,
-                SubredditPoliticalDimensions.analysis_end_date
-                >= datetime.utcnow() - timedelta(days=7),
+        summary = political_summary_table(session.get_bind().dialect.name)
+        recent_analysis = session.execute(
+            select(*(summary.c[name] for name in POLITICAL_SUMMARY_COLUMNS))
+            .where(
+                summary.c.subreddit_id == sub.id,
+                summary.c.analysis_end_date >= datetime.utcnow() - timedelta(days=7),
             )
-            .order_by(SubredditPoliticalDimensions.created_at.desc())
-            .first()
-        )
+            .order_by(summary.c.created_at.desc())
+            .limit(1)
+        ).first()
 
         if recent_analysis:
             _display_political_compass(subreddit, recent_analysis)
@@ -1140,7 +1157,7 @@ def _display_political_dimensions_analysis(
         console.print(cluster_table)
 
 
-def _display_political_compass(subreddit: str, analysis: SubredditPoliticalDimensions):
+def _display_political_compass(subreddit: str, analysis):
     """Display ASCII political compass visualization."""
     console.print(f"\n[bold]Political Compass for r/{subreddit}[/bold]")
     console.print(
@@ -1289,6 +1306,34 @@ def _create_simple_histogram(values: List[float], bins: int = 5) -> str:
     return histogram.strip()
 
 
+def _save_overlap_snapshot(
+    session,
+    subreddit_a_id: int,
+    subreddit_b_id: int,
+    overlap_data: Dict,
+    topic_data: Optional[Dict],
+):
+    """Save today's overlap snapshot, replacing one saved earlier today."""
+    # Same pair in either argument order maps to the same snapshot
+    subreddit_a_id, subreddit_b_id = sorted((subreddit_a_id, subreddit_b_id))
+    today = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+
+    upsert_community_overlaps(
+        session,
+        [
+            {
+                "subreddit_a_id": subreddit_a_id,
+                "subreddit_b_id": subreddit_b_id,
+                "analysis_date": today,
+                "user_overlap_count": overlap_data["shared_authors"],
+                "user_overlap_percentage": overlap_data["overlap_percentage"],
+                "shared_topics": topic_data["shared_topics"] if topic_data else None,
+            }
+        ],
+    )
+    session.commit()
+
+
 def _save_political_dimensions_analysis(
     subreddit_id: int,
     analyses: List[Dict],
@@ -1345,6 +1390,7 @@ def _save_political_dimensions_analysis(
 
         session.add(political_dims)
         session.commit()
+        refresh_political_summary(session)
 
 
 if __name__ == "__main__":
@@ -1,8 +1,9 @@
 """NLP analysis CLI commands."""
 
 import typer
-from rich.console import Console
+from rich.console import Console, Group
 from rich.table import Table
+from rich.text import Text
 from rich.progress import (
     Progress,
     SpinnerColumn,
@@ -10,10 +11,15 @@ from rich.progress import (
     BarColumn,
     TaskProgressColumn,
 )
-from typing import Optional
+from typing import List, Optional
+from collections import Counter
 from datetime import datetime
-from sqlalchemy import func
+from sqlalchemy import func, select
+from sqlalchemy.orm.attributes import set_committed_value
+import heapq
 import logging
+import re
+import numpy as np
 
 from reddit_analyzer.cli.utils.auth_manager import cli_auth
 from reddit_analyzer.models.post import Post
@@ -23,10 +29,121 @@ from reddit_analyzer.models.topic import Topic
 from reddit_analyzer.database import get_db
 from reddit_analyzer.services.nlp_service import get_nlp_service
 
+# Optional multi-pattern matcher for keyword counting
+try:
+    import ahocorasick
+
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 nlp_app = typer.Typer(help="NLP analysis commands")
 console = Console()
 logger = logging.getLogger(__name__)
 
+# Number of posts handed to the NLP service per batched analysis call; large
+# enough for the service to parse each batch across multiple processes
+ANALYZE_BATCH_SIZE = 256
+
+# Subcommands that need the spaCy model and benefit from loading it early
+PRELOAD_COMMANDS = frozenset({"analyze", "topics", "keywords"})
+
+# Rows fetched per round-trip when streaming NLP exports
+EXPORT_YIELD_PER = 500
+
+# Emotion score updates written per commit when backfilling a subreddit
+EMOTION_COMMIT_BATCH_SIZE = 100
+
+# Prebuilt emotion bars, indexed by length (20 cells for intensity, 50 for share)
+_INTENSITY_BARS = tuple("█" * i for i in range(21))
+_DISTRIBUTION_BARS = tuple("█" * i for i in range(51))
+
+
+def _save_emotion_updates(db, updates: List[dict]) -> None:
+    """Write queued emotion score updates in one bulk statement and commit."""
+    if not updates:
+        return
+    try:
+        db.bulk_update_mappings(TextAnalysis, updates)
+        db.commit()
+    except Exception as e:
+        logger.error(f"Failed to save emotion analysis: {e}")
+        db.rollback()
+    updates.clear()
+
+
+def _top_analyzed_keywords(
+    db, subreddit_id: int, cutoff_date: datetime, top_n: int = 10
+) -> List[tuple]:
+    """Count keywords across up to 100 recent analyses of a subreddit's posts."""
+    recent = (
+        select(TextAnalysis.keywords)
+        .join(Post, Post.id == TextAnalysis.post_id)
+        .where(Post.subreddit_id == subreddit_id)
+        .where(Post.created_at >= cutoff_date)
+        .limit(100)
+    )
+
+    if db.get_bind().dialect.name != "postgresql":
+        keyword_freq = Counter()
+        for (keywords,) in db.execute(recent):
+            if keywords:
+                keyword_freq.update(keywords)
+        return keyword_freq.most_common(top_n)
+
+    # Let PostgreSQL unnest and aggregate the keyword arrays (JSONB there)
+    elements = select(
+        func.jsonb_array_elements_text(recent.subquery().c.keywords).label("keyword")
+    ).subquery()
+    freq = func.count().label("freq")
+    stmt = (
+        select(elements.c.keyword, freq)
+        .group_by(elements.c.keyword)
+        .order_by(freq.desc())
+        .limit(top_n)
+    )
+    return [tuple(row) for row in db.execute(stmt)]
+
+
+def _count_keyword_occurrences(text: str, keywords: List[str]) -> Counter:
+    """Count substring occurrences of each keyword in already lowercased text."""
+    counts = Counter({keyword: 0 for keyword in keywords})
+    if not AHOCORASICK_AVAILABLE:
+        for keyword in keywords:
+            counts[keyword] = text.count(keyword.lower())
+        return counts
+
+    # One pass over the text finds every keyword at once. Keywords that only
+    # differ in case share an entry and all receive its count.
+    by_lower = {}
+    for keyword in keywords:
+        by_lower.setdefault(keyword.lower(), []).append(keyword)
+    automaton = ahocorasick.Automaton()
+    for needle in by_lower:
+        automaton.add_word(needle, needle)
+    automaton.make_automaton()
+
+    # Matches come ordered by end position; like str.count, skip any that
+    # overlap the previous counted match of the same keyword
+    needle_counts = Counter()
+    last_end = {}
+    for end, needle in automaton.iter(text):
+        if end - len(needle) >= last_end.get(needle, -1):
+            needle_counts[needle] += 1
+            last_end[needle] = end
+    for needle, originals in by_lower.items():
+        for keyword in originals:
+            counts[keyword] = needle_counts[needle]
+    return counts
+
+
+@nlp_app.callback()
+def nlp_callback(ctx: typer.Context):
+    """NLP analysis commands."""
+    # Start loading spaCy while the command runs its database queries
+    if ctx.invoked_subcommand in PRELOAD_COMMANDS:
+        get_nlp_service().preload_in_background()
+
 
 @nlp_app.command("analyze")
 @cli_auth.require_auth()
@@ -44,6 +161,7 @@ def analyze_posts(
     try:
         db = next(get_db())
         nlp_service = get_nlp_service()
+        nlp_service.clear_preprocess_cache()
 
         # Build query for posts
         query = db.query(Post)
@@ -62,9 +180,10 @@ def analyze_posts(
 
         # Filter posts based on analysis status
         if not reanalyze:
-            # Get posts without analysis
-            analyzed_post_ids = db.query(TextAnalysis.post_id).subquery()
-            query = query.filter(~Post.id.in_(analyzed_post_ids))
+            # Get posts without analysis (anti-join on the indexed post_id)
+            query = query.outerjoin(
+                TextAnalysis, TextAnalysis.post_id == Post.id
+            ).filter(TextAnalysis.post_id.is_(None))
 
         # Apply limit unless --all is specified
         if not all_posts:
@@ -91,28 +210,35 @@ def analyze_posts(
             analyzed_count = 0
             failed_count = 0
 
-            for post in posts:
-                try:
-                    # Combine title and body for analysis
-                    full_text = f"{post.title}"
-                    if post.selftext:
-                        full_text += f"\n\n{post.selftext}"
+            for start in range(0, len(posts), ANALYZE_BATCH_SIZE):
+                batch = posts[start : start + ANALYZE_BATCH_SIZE]
+
+                # Combine title and body for analysis
+                texts = [
+                    f"{post.title}\n\n{post.selftext}" if post.selftext else post.title
+                    for post in batch
+                ]
 
-                    # Analyze text
-                    result = nlp_service.analyze_text(full_text, post_id=post.id)
+                try:
+                    # Analyze the whole batch in one spaCy pass
+                    results = nlp_service.analyze_batch(
+                        texts, post_ids=[post.id for post in batch]
+                    )
 
-                    if result.get("sentiment"):
-                        analyzed_count += 1
-                    else:
-                        failed_count += 1
+                    for result in results:
+                        if result.get("sentiment"):
+                            analyzed_count += 1
+                        else:
+                            failed_count += 1
 
                 except Exception as e:
                     console.print(
-                        f"⚠️  Failed to analyze post {post.id}: {e}", style="yellow"
+                        f"⚠️  Failed to analyze posts {batch[0].id}..{batch[-1].id}: {e}",
+                        style="yellow",
                     )
-                    failed_count += 1
+                    failed_count += len(batch)
 
-                progress.update(task, advance=1)
+                progress.update(task, advance=len(batch))
 
         console.print(f"✅ Successfully analyzed {analyzed_count} posts", style="green")
         if failed_count > 0:
@@ -136,6 +262,7 @@ def show_topics(
     try:
         db = next(get_db())
         nlp_service = get_nlp_service()
+        nlp_service.clear_preprocess_cache()
 
         # Find subreddit
         subreddit_obj = (
@@ -147,9 +274,9 @@ def show_topics(
             console.print(f"❌ Subreddit r/{subreddit} not found", style="red")
             raise typer.Exit(1)
 
-        # Get posts with text
+        # Get posts with text (only the columns used below)
         posts = (
-            db.query(Post)
+            db.query(Post.title, Post.selftext)
             .filter(Post.subreddit_id == subreddit_obj.id)
             .filter(Post.selftext != "")
             .limit(1000)
@@ -178,7 +305,10 @@ def show_topics(
 
         # Fit topic model
         with console.status("[cyan]Training topic model..."):
-            success = nlp_service.fit_topic_model(texts, num_topics=num_topics)
+            # Crossposts and bot posts repeat verbatim; fit each text only once
+            success = nlp_service.fit_topic_model(
+                list(dict.fromkeys(texts)), num_topics=num_topics
+            )
             if not success:
                 console.print("❌ Failed to train topic model", style="red")
                 return
@@ -190,13 +320,23 @@ def show_topics(
             console.print("❌ No topics discovered", style="red")
             return
 
+        # Lowercase and tokenize the sample candidates once, reusing the texts
+        # already built for the topic model, instead of redoing it per topic
+        sample_candidates = posts[:100]  # Check first 100 posts
+        post_token_sets = [
+            set(re.findall(r"\w+", text.lower()))
+            for text in texts[: len(sample_candidates)]
+        ]
+
         # Display topics
         console.print(f"\n📚 Topic Analysis for r/{subreddit}")
         console.print("═" * 50)
 
+        # Collect every topic's output and render it in a single pass
+        renderables = []
         for i, topic in enumerate(topics):
             # Topic header
-            console.print(f"\n[bold cyan]Topic {i + 1}[/bold cyan]")
+            renderables.append(f"\n[bold cyan]Topic {i + 1}[/bold cyan]")
 
             # Keywords table
             keywords_table = Table(show_header=False, box=None)
@@ -206,16 +346,15 @@ def show_topics(
             for word, weight in topic.get("words", [])[:num_words]:
                 keywords_table.add_row(word, f"{weight:.3f}")
 
-            console.print(keywords_table)
+            renderables.append(keywords_table)
 
             # Find sample posts for this topic
             # This is a simplified approach - in production, you'd use the topic model's predictions
             sample_posts = []
             topic_words = [w[0] for w in topic.get("words", [])[:5]]
 
-            for post in posts[:100]:  # Check first 100 posts
-                text_lower = f"{post.title} {post.selftext}".lower()
-                word_count = sum(1 for word in topic_words if word in text_lower)
+            for post, tokens in zip(sample_candidates, post_token_sets):
+                word_count = sum(1 for word in topic_words if word in tokens)
                 if word_count >= 2:  # At least 2 topic words
                     sample_posts.append(
                         post.title[:60] + "..." if len(post.title) > 60 else post.title
@@ -224,23 +363,33 @@ def show_topics(
                         break
 
             if sample_posts:
-                console.print("\n[dim]Sample posts:[/dim]")
+                renderables.append("\n[dim]Sample posts:[/dim]")
                 for j, title in enumerate(sample_posts, 1):
-                    console.print(f"  {j}. {title}", style="dim")
+                    renderables.append(Text(f"  {j}. {title}", style="dim"))
+
+        console.print(Group(*renderables))
 
         # Save topics to database
         console.print("\n💾 Saving topics to database...")
 
-        for i, topic_data in enumerate(topics):
-            topic = Topic(
-                subreddit_id=subreddit_obj.id,
-                topic_id=i,
-                keywords=[w[0] for w in topic_data.get("words", [])[:20]],
-                keyword_weights=[w[1] for w in topic_data.get("words", [])[:20]],
-                coherence_score=topic_data.get("coherence", 0.0),
-                created_at=datetime.utcnow(),
-            )
-            db.add(topic)
+        created_at = datetime.utcnow()
+        db.bulk_insert_mappings(
+            Topic,
+            [
+                {
+                    "topic_id": f"lda_{subreddit_obj.name}_{i}",
+                    "topic_name": f"Topic {i}",
+                    "subreddit_name": subreddit_obj.name,
+                    "model_type": "lda",
+                    "topic_words": topic_data.get("words", [])[:20],
+                    "document_count": len(posts),
+                    "time_period": created_at.date(),
+                    "coherence_score": topic_data.get("coherence", 0.0),
+                    "created_at": created_at,
+                }
+                for i, topic_data in enumerate(topics)
+            ],
+        )
 
         db.commit()
         console.print("✅ Topics saved successfully", style="green")
@@ -263,6 +412,7 @@ def extract_keywords(
     try:
         db = next(get_db())
         nlp_service = get_nlp_service()
+        nlp_service.clear_preprocess_cache()
 
         # Find subreddit
         subreddit_obj = (
@@ -280,7 +430,7 @@ def extract_keywords(
         cutoff_date = datetime.utcnow() - timedelta(days=days)
 
         posts = (
-            db.query(Post)
+            db.query(Post.title, Post.selftext)
             .filter(Post.subreddit_id == subreddit_obj.id)
             .filter(Post.created_at >= cutoff_date)
             .all()
@@ -307,7 +457,11 @@ def extract_keywords(
 
         # Extract keywords
         with console.status("[cyan]Analyzing keywords..."):
-            keywords = nlp_service.extract_keywords(all_texts, num_keywords=top_n)
+            # Repeated texts would only inflate the document, so extract from
+            # unique ones; occurrence counts below still use every post
+            keywords = nlp_service.extract_keywords(
+                list(dict.fromkeys(all_texts)), num_keywords=top_n
+            )
 
         if not keywords:
             console.print("❌ No keywords extracted", style="red")
@@ -328,52 +482,26 @@ def extract_keywords(
 
         # Count keyword occurrences (simplified - in production use TF-IDF scores)
         combined_text = " ".join(all_texts).lower()
-        keyword_counts = []
-
-        for keyword in keywords:
-            count = combined_text.count(keyword.lower())
-            keyword_counts.append((keyword, count))
+        keyword_counts = _count_keyword_occurrences(combined_text, keywords)
 
-        # Sort by count and display
-        keyword_counts.sort(key=lambda x: x[1], reverse=True)
-
-        for i, (keyword, count) in enumerate(keyword_counts[:top_n], 1):
+        for i, (keyword, count) in enumerate(keyword_counts.most_common(top_n), 1):
             keywords_table.add_row(str(i), keyword, f"{count:,}")
 
         console.print(keywords_table)
 
         # Show trending keywords from TextAnalysis if available
-        keyword_analysis = (
-            db.query(TextAnalysis.keywords)
-            .join(Post)
-            .filter(Post.subreddit_id == subreddit_obj.id)
-            .filter(Post.created_at >= cutoff_date)
-            .limit(100)
-            .all()
-        )
-
-        if keyword_analysis:
-            # Aggregate keywords from analyses
-            all_analyzed_keywords = []
-            for analysis in keyword_analysis:
-                if analysis.keywords:
-                    all_analyzed_keywords.extend(analysis.keywords)
+        keyword_freq = _top_analyzed_keywords(db, subreddit_obj.id, cutoff_date)
 
-            if all_analyzed_keywords:
-                # Count frequency
-                from collections import Counter
+        if keyword_freq:
+            console.print("\n📈 Trending Keywords (from NLP analysis)")
+            trending_table = Table()
+            trending_table.add_column("Keyword", style="cyan")
+            trending_table.add_column("Frequency", style="green")
 
-                keyword_freq = Counter(all_analyzed_keywords)
+            for keyword, freq in keyword_freq:
+                trending_table.add_row(keyword, str(freq))
 
-                console.print("\n📈 Trending Keywords (from NLP analysis)")
-                trending_table = Table()
-                trending_table.add_column("Keyword", style="cyan")
-                trending_table.add_column("Frequency", style="green")
-
-                for keyword, freq in keyword_freq.most_common(10):
-                    trending_table.add_row(keyword, str(freq))
-
-                console.print(trending_table)
+            console.print(trending_table)
 
     except Exception as e:
         console.print(f"❌ Keyword extraction failed: {e}", style="red")
@@ -427,7 +555,7 @@ def analyze_emotions(
                 )
 
                 for emotion, intensity in sorted_emotions:
-                    bar = "█" * int(intensity * 20)
+                    bar = _INTENSITY_BARS[max(0, min(20, int(intensity * 20)))]
                     emotion_table.add_row(emotion.capitalize(), f"{intensity:.1%}", bar)
 
                 console.print(emotion_table)
@@ -452,29 +580,37 @@ def analyze_emotions(
                 console.print(f"❌ Subreddit r/{subreddit} not found", style="red")
                 raise typer.Exit(1)
 
-            # Get all text analyses for this subreddit
-            all_analyses = (
+            # Stream the subreddit's text analyses (capped at 1000) and split
+            # them by whether they already have emotion data as they arrive
+            analyses_with_emotions = []
+            analyses_without_emotions = []
+
+            for analysis in (
                 db.query(TextAnalysis)
                 .join(Post)
                 .filter(Post.subreddit_id == subreddit_obj.id)
                 .limit(1000)
-                .all()
-            )
-
-            if not all_analyses:
-                console.print(f"📭 No posts found for r/{subreddit}", style="yellow")
-                return
-
-            # Check which analyses have emotion data
-            analyses_with_emotions = []
-            analyses_without_emotions = []
-
-            for analysis in all_analyses:
+                .yield_per(100)
+            ):
                 if analysis.emotion_scores and any(analysis.emotion_scores.values()):
                     analyses_with_emotions.append(analysis)
                 else:
                     analyses_without_emotions.append(analysis)
 
+            if not analyses_with_emotions and not analyses_without_emotions:
+                console.print(f"📭 No posts found for r/{subreddit}", style="yellow")
+                return
+
+            # Fetch the analyzed posts in one query instead of one per analysis
+            post_ids = [
+                analysis.post_id
+                for analysis in analyses_with_emotions + analyses_without_emotions
+            ]
+            posts_by_id = {
+                post.id: post
+                for post in db.query(Post).filter(Post.id.in_(post_ids)).all()
+            }
+
             # If we have analyses without emotions, analyze them now
             if analyses_without_emotions:
                 console.print(
@@ -496,22 +632,28 @@ def analyze_emotions(
                         "Analyzing emotions...", total=len(analyses_without_emotions)
                     )
 
+                    updates = []
                     for analysis in analyses_without_emotions:
                         try:
                             # Get the post text
-                            post = (
-                                db.query(Post)
-                                .filter(Post.id == analysis.post_id)
-                                .first()
-                            )
+                            post = posts_by_id.get(analysis.post_id)
                             if post:
                                 text = f"{post.title} {post.selftext or ''}"
                                 emotions = emotion_analyzer.analyze_emotions(text)
 
-                                # Update the analysis with emotion scores
-                                analysis.emotion_scores = emotions
+                                # Queue the update; keep the loaded object in sync
+                                # for the summary without marking it dirty
+                                updates.append(
+                                    {"id": analysis.id, "emotion_scores": emotions}
+                                )
+                                set_committed_value(
+                                    analysis, "emotion_scores", emotions
+                                )
                                 analyses_with_emotions.append(analysis)
 
+                                if len(updates) >= EMOTION_COMMIT_BATCH_SIZE:
+                                    _save_emotion_updates(db, updates)
+
                             progress.update(task, advance=1)
                         except Exception as e:
                             logger.warning(
@@ -519,15 +661,12 @@ def analyze_emotions(
                             )
                             progress.update(task, advance=1)
 
-                # Commit the updates
-                try:
-                    db.commit()
-                    console.print(
-                        f"✅ Emotion analysis complete for {len(analyses_without_emotions)} posts"
-                    )
-                except Exception as e:
-                    logger.error(f"Failed to save emotion analysis: {e}")
-                    db.rollback()
+                    # Commit the remaining updates
+                    _save_emotion_updates(db, updates)
+
+                console.print(
+                    f"✅ Emotion analysis complete for {len(analyses_without_emotions)} posts"
+                )
 
             # Use all analyses that now have emotions
             analyses = analyses_with_emotions
@@ -539,19 +678,28 @@ def analyze_emotions(
                 )
                 return
 
-            # Aggregate emotions
-            emotion_totals = {}
-            emotion_counts = {}
+            # Aggregate emotions into an (analyses x emotions) score matrix,
+            # tracking which analyses reported each emotion
+            emotions = list(
+                dict.fromkeys(
+                    emotion
+                    for analysis in analyses
+                    for emotion in analysis.emotion_scores
+                )
+            )
+            emotion_index = {emotion: j for j, emotion in enumerate(emotions)}
+            scores = np.zeros((len(analyses), len(emotions)))
+            reported = np.zeros((len(analyses), len(emotions)), dtype=bool)
 
-            for analysis in analyses:
+            for i, analysis in enumerate(analyses):
                 for emotion, intensity in analysis.emotion_scores.items():
-                    emotion_totals[emotion] = emotion_totals.get(emotion, 0) + intensity
-                    emotion_counts[emotion] = emotion_counts.get(emotion, 0) + 1
+                    scores[i, emotion_index[emotion]] = intensity
+                    reported[i, emotion_index[emotion]] = True
 
-            # Calculate averages
+            # Calculate averages over the analyses that reported each emotion
+            averages = scores.sum(axis=0) / np.maximum(reported.sum(axis=0), 1)
             emotion_averages = {
-                emotion: total / emotion_counts[emotion]
-                for emotion, total in emotion_totals.items()
+                emotion: float(averages[j]) for j, emotion in enumerate(emotions)
             }
 
             # Display results
@@ -573,51 +721,42 @@ def analyze_emotions(
                 emotion_averages.items(), key=lambda x: x[1], reverse=True
             ):
                 percentage = (avg / total_intensity) * 100 if total_intensity > 0 else 0
-                bar = "█" * int(percentage / 2)
+                bar = _DISTRIBUTION_BARS[max(0, min(50, int(percentage / 2)))]
                 dist_table.add_row(
                     emotion.capitalize(), f"{avg:.1%}", f"{bar} {percentage:.1f}%"
                 )
 
             console.print(dist_table)
 
-            # Find most emotional posts
-            most_emotional = []
+            # Find most emotional posts, keeping only the top 5 by intensity
+            candidates = []
             for analysis in analyses:
                 if analysis.emotion_scores:
                     max_emotion = max(
                         analysis.emotion_scores.items(), key=lambda x: x[1]
                     )
                     if max_emotion[1] > 0.7:  # High intensity
-                        post = (
-                            db.query(Post).filter(Post.id == analysis.post_id).first()
-                        )
+                        post = posts_by_id.get(analysis.post_id)
                         if post:
-                            most_emotional.append(
-                                {
-                                    "title": (
-                                        post.title[:60] + "..."
-                                        if len(post.title) > 60
-                                        else post.title
-                                    ),
-                                    "emotion": max_emotion[0],
-                                    "intensity": max_emotion[1],
-                                }
-                            )
+                            candidates.append((max_emotion, post))
 
-            if most_emotional:
-                # Sort by intensity and show top 5
-                most_emotional.sort(key=lambda x: x["intensity"], reverse=True)
+            most_emotional = heapq.nlargest(5, candidates, key=lambda x: x[0][1])
 
+            if most_emotional:
                 emotional_table = Table(title="🎭 Most Emotional Posts")
                 emotional_table.add_column("Post", style="cyan", max_width=60)
                 emotional_table.add_column("Dominant Emotion", style="green")
                 emotional_table.add_column("Intensity", style="yellow")
 
-                for post_info in most_emotional[:5]:
+                for (emotion, intensity), post in most_emotional:
                     emotional_table.add_row(
-                        post_info["title"],
-                        post_info["emotion"].capitalize(),
-                        f"{post_info['intensity']:.1%}",
+                        (
+                            post.title[:60] + "..."
+                            if len(post.title) > 60
+                            else post.title
+                        ),
+                        emotion.capitalize(),
+                        f"{intensity:.1%}",
                     )
 
                 console.print(emotional_table)
@@ -656,20 +795,45 @@ def export_nlp_data(
             console.print(f"❌ Subreddit r/{subreddit} not found", style="red")
             raise typer.Exit(1)
 
-        # Get posts with NLP analysis
-        results = (
-            db.query(Post, TextAnalysis)
+        # Select only the exported columns and stream them, skipping ORM hydration
+        stmt = (
+            select(
+                Post.id,
+                Post.title,
+                Post.selftext,
+                Post.created_at,
+                Post.score,
+                Post.num_comments,
+                Post.url,
+                TextAnalysis.sentiment_score,
+                TextAnalysis.sentiment_label,
+                TextAnalysis.confidence_score,
+                TextAnalysis.keywords,
+                TextAnalysis.entities,
+                TextAnalysis.emotion_scores,
+                TextAnalysis.language,
+                TextAnalysis.readability_score,
+                TextAnalysis.processed_at,
+            )
             .join(TextAnalysis, Post.id == TextAnalysis.post_id)
-            .filter(Post.subreddit_id == subreddit_obj.id)
+            .where(Post.subreddit_id == subreddit_obj.id)
             .limit(limit)
-            .all()
         )
 
-        if not results:
+        if db.execute(stmt.limit(1)).first() is None:
             console.print(f"📭 No NLP data found for r/{subreddit}", style="yellow")
             return
 
-        console.print(f"📤 Exporting {len(results)} records to {output}...")
+        if format.lower() not in ("csv", "json"):
+            console.print(
+                f"❌ Unsupported format: {format}. Use 'csv' or 'json'", style="red"
+            )
+            return
+
+        console.print(f"📤 Exporting NLP data for r/{subreddit} to {output}...")
+
+        rows = db.execute(stmt, execution_options={"yield_per": EXPORT_YIELD_PER})
+        exported = 0
 
         if format.lower() == "csv":
             import csv
@@ -692,12 +856,12 @@ def export_nlp_data(
                 writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
                 writer.writeheader()
 
-                for post, analysis in results:
+                for row in rows:
                     # Get dominant emotion
                     dominant_emotion = ""
-                    if analysis.emotion_scores:
+                    if row.emotion_scores:
                         emotion_sorted = sorted(
-                            analysis.emotion_scores.items(),
+                            row.emotion_scores.items(),
                             key=lambda x: x[1],
                             reverse=True,
                         )
@@ -708,79 +872,72 @@ def export_nlp_data(
 
                     writer.writerow(
                         {
-                            "post_id": post.id,
-                            "title": post.title,
-                            "created_at": post.created_at.isoformat(),
-                            "score": post.score,
-                            "num_comments": post.num_comments,
-                            "sentiment_score": analysis.sentiment_score,
-                            "sentiment_label": analysis.sentiment_label,
-                            "confidence": analysis.confidence_score,
+                            "post_id": row.id,
+                            "title": row.title,
+                            "created_at": row.created_at.isoformat(),
+                            "score": row.score,
+                            "num_comments": row.num_comments,
+                            "sentiment_score": row.sentiment_score,
+                            "sentiment_label": row.sentiment_label,
+                            "confidence": row.confidence_score,
                             "keywords": (
-                                ";".join(analysis.keywords[:5])
-                                if analysis.keywords
-                                else ""
+                                ";".join(row.keywords[:5]) if row.keywords else ""
                             ),
                             "dominant_emotion": dominant_emotion,
-                            "language": analysis.language,
-                            "readability": analysis.readability_score,
+                            "language": row.language,
+                            "readability": row.readability_score,
                         }
                     )
+                    exported += 1
 
-        elif format.lower() == "json":
+        else:
             import json
+            import textwrap
 
-            export_data = []
-            for post, analysis in results:
-                export_data.append(
-                    {
+            # Write the array incrementally instead of building it in memory
+            with open(output, "w", encoding="utf-8") as jsonfile:
+                jsonfile.write("[")
+                for row in rows:
+                    record = {
                         "post": {
-                            "id": post.id,
-                            "title": post.title,
+                            "id": row.id,
+                            "title": row.title,
                             "body": (
-                                post.selftext[:200] + "..."
-                                if post.selftext and len(post.selftext) > 200
-                                else post.selftext
+                                row.selftext[:200] + "..."
+                                if row.selftext and len(row.selftext) > 200
+                                else row.selftext
                             ),
-                            "created_at": post.created_at.isoformat(),
-                            "score": post.score,
-                            "num_comments": post.num_comments,
-                            "url": post.url,
+                            "created_at": row.created_at.isoformat(),
+                            "score": row.score,
+                            "num_comments": row.num_comments,
+                            "url": row.url,
                         },
                         "nlp_analysis": {
                             "sentiment": {
-                                "score": analysis.sentiment_score,
-                                "label": analysis.sentiment_label,
-                                "confidence": analysis.confidence_score,
+                                "score": row.sentiment_score,
+                                "label": row.sentiment_label,
+                                "confidence": row.confidence_score,
                             },
-                            "keywords": (
-                                analysis.keywords[:10] if analysis.keywords else []
-                            ),
-                            "entities": (
-                                analysis.entities[:10] if analysis.entities else []
-                            ),
+                            "keywords": row.keywords[:10] if row.keywords else [],
+                            "entities": row.entities[:10] if row.entities else [],
                             "emotions": (
-                                analysis.emotion_scores
-                                if analysis.emotion_scores
-                                else {}
+                                row.emotion_scores if row.emotion_scores else {}
                             ),
-                            "language": analysis.language,
-                            "readability_score": analysis.readability_score,
-                            "processed_at": analysis.processed_at.isoformat(),
+                            "language": row.language,
+                            "readability_score": row.readability_score,
+                            "processed_at": row.processed_at.isoformat(),
                         },
                     }
-                )
-
-            with open(output, "w", encoding="utf-8") as jsonfile:
-                json.dump(export_data, jsonfile, indent=2, ensure_ascii=False)
-
-        else:
-            console.print(
-                f"❌ Unsupported format: {format}. Use 'csv' or 'json'", style="red"
-            )
-            return
+                    jsonfile.write(",\n" if exported else "\n")
+                    jsonfile.write(
+                        textwrap.indent(
+                            json.dumps(record, indent=2, ensure_ascii=False), "  "
+                        )
+                    )
+                    exported += 1
+                jsonfile.write("\n]")
 
-        console.print(f"✅ Exported {len(results)} records to {output}", style="green")
+        console.print(f"✅ Exported {exported} records to {output}", style="green")
 
     except Exception as e:
         console.print(f"❌ Export failed: {e}", style="red")
@@ -2,10 +2,12 @@
 
 import os
 import json
+import time
+import jwt
 import typer
 from pathlib import Path
 from typing import Optional
-from functools import wraps
+from functools import cached_property, wraps
 from rich.console import Console
 
 from reddit_analyzer.utils.auth import get_auth_service
@@ -14,16 +16,33 @@ from reddit_analyzer.database import get_db
 
 console = Console()
 
+# Longest time a passed require_auth check is trusted before re-checking
+AUTH_REVERIFY_SECONDS = 300
+
 
 class CLIAuth:
     """CLI Authentication manager."""
 
+    # Parsed token file, reused while its (mtime_ns, size) stay unchanged
+    _token_cache: Optional[dict] = None
+    _token_stat: Optional[tuple] = None
+
+    # (access_token, user, exp) from the last successful lookup in this
+    # process; a miss once the token's exp (epoch seconds) has passed
+    _user_cache: Optional[tuple] = None
+
+    # time.monotonic() deadline until which require_auth trusts _user_cache
+    _verified_until: Optional[float] = None
+
     def __init__(self, skip_auth: bool = False):
         self.skip_auth = skip_auth
         self.config_dir = Path.home() / ".reddit-analyzer"
         self.token_file = self.config_dir / "tokens.json"
-        self.config_dir.mkdir(exist_ok=True)
-        self.auth_service = get_auth_service()
+
+    @cached_property
+    def auth_service(self):
+        """Authentication service, built on first use."""
+        return get_auth_service()
 
     def login(self, username: str, password: str) -> bool:
         """Authenticate user and store tokens."""
@@ -51,6 +70,8 @@ class CLIAuth:
     def logout(self) -> bool:
         """Logout and remove stored tokens."""
         try:
+            self._user_cache = None
+            self._verified_until = None
             if self.token_file.exists():
                 self.token_file.unlink()
             console.print("👋 Logged out successfully", style="green")
@@ -61,21 +82,36 @@ class CLIAuth:
 
     def _store_tokens(self, tokens: dict):
         """Securely store authentication tokens."""
+        self._verified_until = None
+        # Created only when there is something to write, not on import
+        self.config_dir.mkdir(exist_ok=True)
         with open(self.token_file, "w") as f:
             json.dump(tokens, f, indent=2)
         os.chmod(self.token_file, 0o600)  # Read/write for owner only
 
     def get_current_user(self) -> Optional[User]:
         """Get current authenticated user."""
-        if not self.token_file.exists():
-            return None
-
         try:
-            with open(self.token_file, "r") as f:
-                tokens = json.load(f)
+            tokens = self.get_stored_tokens()
+            if not tokens:
+                return None
+
+            # Skip the DB round-trip when this token was already resolved
+            # and has not expired since
+            access_token = tokens["access_token"]
+            if (
+                self._user_cache
+                and self._user_cache[0] == access_token
+                and time.time() < self._user_cache[2]
+            ):
+                return self._user_cache[1]
+            self._user_cache = None
 
             db = next(get_db())
-            user = self.auth_service.get_current_user(tokens["access_token"], db)
+            user = self.auth_service.get_current_user(access_token, db)
+            exp = self._token_exp(access_token)
+            if user and exp is not None:
+                self._user_cache = (access_token, user, exp)
             return user
         except Exception:
             return None
@@ -85,27 +121,31 @@ class CLIAuth:
 
     def get_access_token(self) -> Optional[str]:
         """Get current access token."""
-        if not self.token_file.exists():
-            return None
-
-        try:
-            with open(self.token_file, "r") as f:
-                tokens = json.load(f)
-            return tokens.get("access_token")
-        except Exception:
-            return None
+        tokens = self.get_stored_tokens()
+        return tokens.get("access_token") if tokens else None
 
     def get_stored_tokens(self) -> Optional[dict]:
         """Get stored authentication tokens."""
-        if not self.token_file.exists():
+        try:
+            st = os.stat(self.token_file)
+        except OSError:
             return None
 
+        # Only re-read and re-parse the file when it has changed on disk
+        stat_key = (st.st_mtime_ns, st.st_size)
+        if stat_key == self._token_stat:
+            return self._token_cache
+
         try:
             with open(self.token_file, "r") as f:
-                return json.load(f)
+                tokens = json.load(f)
         except Exception:
             return None
 
+        self._token_cache = tokens
+        self._token_stat = stat_key
+        return tokens
+
     def require_auth(self, required_role: UserRole = None):
         """Decorator to require authentication for CLI commands."""
 
@@ -116,22 +156,29 @@ class CLIAuth:
                 if self.skip_auth:
                     return func(*args, **kwargs)
 
-                # Check if we have tokens first
-                tokens = self.get_stored_tokens()
-                if not tokens:
-                    console.print(
-                        "❌ Authentication required. Run 'reddit-analyzer auth login'",
-                        style="red",
-                    )
-                    raise typer.Exit(1)
-
-                user = self.get_current_user()
+                # Nested decorated calls reuse a check that just passed
+                user = self._recently_verified_user()
                 if not user:
-                    console.print(
-                        "❌ Authentication required. Run 'reddit-analyzer auth login'",
-                        style="red",
-                    )
-                    raise typer.Exit(1)
+                    # Check if we have tokens first
+                    tokens = self.get_stored_tokens()
+                    if not tokens:
+                        console.print(
+                            "❌ Authentication required. "
+                            "Run 'reddit-analyzer auth login'",
+                            style="red",
+                        )
+                        raise typer.Exit(1)
+
+                    user = self.get_current_user()
+                    if not user:
+                        console.print(
+                            "❌ Authentication required. "
+                            "Run 'reddit-analyzer auth login'",
+                            style="red",
+                        )
+                        raise typer.Exit(1)
+
+                    self._mark_verified(tokens.get("access_token"))
 
                 if required_role and not self.auth_service.require_role(
                     user, required_role
@@ -147,6 +194,33 @@ class CLIAuth:
 
         return decorator
 
+    def _recently_verified_user(self) -> Optional[User]:
+        """Return the cached user if require_auth verified it recently."""
+        if self._verified_until is None or time.monotonic() >= self._verified_until:
+            return None
+        return self._user_cache[1] if self._user_cache else None
+
+    @staticmethod
+    def _token_exp(access_token: str) -> Optional[float]:
+        """Expiry of a token the auth service already verified, or None."""
+        try:
+            # Signature was already checked by the auth service; only read exp
+            payload = jwt.decode(access_token, options={"verify_signature": False})
+            return float(payload["exp"])
+        except Exception:
+            return None
+
+    def _mark_verified(self, access_token: Optional[str]):
+        """Trust the cached user until the token expires, capped at a few minutes."""
+        if not self._user_cache or self._user_cache[0] != access_token:
+            return
+
+        remaining = self._user_cache[2] - time.time()
+        if remaining > 0:
+            self._verified_until = time.monotonic() + min(
+                AUTH_REVERIFY_SECONDS, remaining
+            )
+
     def auth_status(self):
         """Display current authentication status."""
         user = self.get_current_user()
@@ -1,33 +1,41 @@
 """CLI-specific database utilities with quiet mode support."""
 
+import atexit
+
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
 from contextlib import contextmanager
+from functools import lru_cache
 
 from reddit_analyzer.config import get_config
+from reddit_analyzer.database import get_dialect_options
 
 config = get_config()
 
 
+@lru_cache(maxsize=4)
 def get_cli_engine(echo=False):
-    """Get database engine with echo control for CLI."""
-    return create_engine(
+    """Get database engine with echo control for CLI (one per echo setting)."""
+    engine = create_engine(
         config.DATABASE_URL,
-        poolclass=StaticPool,
-        connect_args=(
-            {"check_same_thread": False} if "sqlite" in config.DATABASE_URL else {}
-        ),
         echo=echo,  # Control SQLAlchemy echo
+        **get_dialect_options(config.DATABASE_URL),
     )
+    # Close pooled connections cleanly when the CLI process exits
+    atexit.register(engine.dispose)
+    return engine
+
+
+@lru_cache(maxsize=4)
+def get_cli_sessionmaker(echo=False):
+    """Get the session factory bound to the CLI engine for this echo setting."""
+    return sessionmaker(autocommit=False, autoflush=False, bind=get_cli_engine(echo))
 
 
 @contextmanager
 def get_cli_session(echo=False):
     """Get database session for CLI with echo control."""
-    engine = get_cli_engine(echo=echo)
-    Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-    session = Session()
+    session = get_cli_sessionmaker(echo)()
     try:
         yield session
     finally:
@@ -12,6 +12,7 @@ from reddit_analyzer.models.subreddit import Subreddit
 from reddit_analyzer.models.text_analysis import TextAnalysis
 from reddit_analyzer.database import get_db
 from sqlalchemy import func
+from sqlalchemy.orm import load_only
 
 viz_app = typer.Typer(help="Visualization commands")
 console = Console()
@@ -140,10 +141,18 @@ def show_sentiment(
             console.print(f"❌ Subreddit r/{subreddit} not found", style="red")
             raise typer.Exit(1)
 
-        # Get posts with sentiment data from TextAnalysis table
+        # Get posts with sentiment data from TextAnalysis table, skipping the
+        # analysis JSON columns this chart never reads
         posts_with_sentiment = (
             db.query(Post, TextAnalysis)
             .join(TextAnalysis, Post.id == TextAnalysis.post_id)
+            .options(
+                load_only(
+                    TextAnalysis.sentiment_label,
+                    TextAnalysis.sentiment_score,
+                    TextAnalysis.confidence_score,
+                )
+            )
             .filter(Post.subreddit_id == subreddit_obj.id)
             .limit(1000)
             .all()
@@ -1,11 +1,96 @@
+import gzip
 import json
 import time
 import hashlib
-from typing import Any, Dict, Optional
+import socket
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
 from dataclasses import dataclass
 import redis
 from reddit_analyzer.config import get_settings
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+# Connection pools shared by every RedisCache pointed at the same server
+_connection_pools: Dict[str, redis.BlockingConnectionPool] = {}
+_connection_pools_lock = threading.Lock()
+
+
+def _get_connection_pool(redis_url: str) -> redis.BlockingConnectionPool:
+    with _connection_pools_lock:
+        pool = _connection_pools.get(redis_url)
+        if pool is None:
+            keepalive_options = {}
+            if hasattr(socket, "TCP_KEEPIDLE"):  # Not available on every platform
+                keepalive_options[socket.TCP_KEEPIDLE] = 60
+
+            # Blocks (up to timeout) rather than opening unbounded connections
+            pool = redis.BlockingConnectionPool.from_url(
+                redis_url,
+                max_connections=32,
+                timeout=5,
+                decode_responses=False,  # We'll handle encoding ourselves
+                socket_timeout=5.0,
+                socket_connect_timeout=5.0,
+                socket_keepalive=True,
+                socket_keepalive_options=keepalive_options,
+                retry_on_timeout=True,
+                health_check_interval=30,
+            )
+            _connection_pools[redis_url] = pool
+        return pool
+
+
+# Writes every KEYS[i] = ARGV[i + 1] with a TTL of ARGV[1] in a single call
+_SET_MANY_SCRIPT = """
+for i = 1, #KEYS do
+    redis.call('SET', KEYS[i], ARGV[i + 1], 'EX', ARGV[1])
+end
+return #KEYS
+"""
+
+# zstd contexts are reusable but not safe to share between threads
+_zstd_local = threading.local()
+
+
+def _zstd_compress(data: bytes) -> bytes:
+    compressor = getattr(_zstd_local, "compressor", None)
+    if compressor is None:
+        compressor = _zstd_local.compressor = zstandard.ZstdCompressor(level=3)
+    return compressor.compress(data)
+
+
+def _zstd_decompress(data: bytes) -> bytes:
+    decompressor = getattr(_zstd_local, "decompressor", None)
+    if decompressor is None:
+        decompressor = _zstd_local.decompressor = zstandard.ZstdDecompressor()
+    return decompressor.decompress(data)
+
+
+def _dumps(value: Any) -> bytes:
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(value, default=str).encode("utf-8")
+
+
+def _loads(value: bytes) -> Any:
+    if ORJSON_AVAILABLE:
+        return orjson.loads(value)
+    return json.loads(value.decode("utf-8"))
+
 
 @dataclass
 class CacheConfig:
@@ -13,23 +98,25 @@ class CacheConfig:
     max_key_length: int = 250
     compress_threshold: int = 1024  # Compress values larger than 1KB
     key_prefix: str = "reddit_analyzer"
+    l1_max_entries: int = 1024  # In-process read cache size; 0 disables it
+    l1_ttl: float = 5.0  # Seconds an in-process copy may lag behind Redis
 
 
 class RedisCache:
     def __init__(self, config: Optional[CacheConfig] = None):
         self.config = config or CacheConfig()
+        self._key_prefix = f"{self.config.key_prefix}:"
+        # Longest raw key that still fits under max_key_length once prefixed
+        self._max_unhashed = self.config.max_key_length - len(self._key_prefix)
         settings = get_settings()
 
+        # Small LRU of raw values read from Redis: key -> (bytes, expires_at)
+        self._l1: "OrderedDict[str, tuple]" = OrderedDict()
+        self._l1_lock = threading.Lock()
+
         # Parse Redis URL
         redis_url = settings.redis_url
-        self.redis_client = redis.from_url(
-            redis_url,
-            decode_responses=False,  # We'll handle encoding ourselves
-            socket_timeout=5.0,
-            socket_connect_timeout=5.0,
-            retry_on_timeout=True,
-            health_check_interval=30,
-        )
+        self.redis_client = redis.Redis(connection_pool=_get_connection_pool(redis_url))
 
         # Test connection
         try:
@@ -37,46 +124,97 @@ class RedisCache:
         except redis.ConnectionError as e:
             raise ConnectionError(f"Failed to connect to Redis: {e}")
 
-    def _generate_key(self, key: str) -> str:
-        full_key = f"{self.config.key_prefix}:{key}"
+        # Sent via EVALSHA, falling back to EVAL once if the server lacks it
+        self._set_many_script = self.redis_client.register_script(_SET_MANY_SCRIPT)
 
+    def _generate_key(self, key: str) -> str:
         # Hash long keys to avoid Redis key length limits
-        if len(full_key) > self.config.max_key_length:
-            key_hash = hashlib.sha256(full_key.encode()).hexdigest()
-            full_key = f"{self.config.key_prefix}:hash:{key_hash}"
-
-        return full_key
+        if len(key) > self._max_unhashed:
+            return self._hash_key(self._key_prefix + key)
+
+        return self._key_prefix + key
+
+    def _hash_key(self, full_key: str) -> str:
+        # Only needs to spread keys, not resist attackers; BLAKE2b-128 is
+        # faster than SHA-256 and half the length
+        key_hash = hashlib.blake2b(full_key.encode(), digest_size=16).hexdigest()
+        return f"{self._key_prefix}hash:{key_hash}"
+
+    def _generate_keys(self, keys: List[str]) -> List[str]:
+        """Build Redis keys for a batch, hashing only the ones over the limit."""
+        prefix = self._key_prefix
+        max_unhashed = self._max_unhashed
+        return [
+            prefix + key if len(key) <= max_unhashed else self._hash_key(prefix + key)
+            for key in keys
+        ]
 
     def _serialize_value(self, value: Any) -> bytes:
-        serialized = json.dumps(value, default=str).encode("utf-8")
+        serialized = _dumps(value)
 
         # Optionally compress large values
         if len(serialized) > self.config.compress_threshold:
-            import gzip
-
-            compressed = gzip.compress(serialized)
+            if ZSTD_AVAILABLE:
+                tag, compressed = b"ZSTD:", _zstd_compress(serialized)
+            else:
+                tag, compressed = b"GZIP:", gzip.compress(serialized)
             # Only use compression if it actually reduces size
             if len(compressed) < len(serialized):
-                return b"GZIP:" + compressed
+                return tag + compressed
 
         return serialized
 
     def _deserialize_value(self, value: bytes) -> Any:
+        if value.startswith(b"ZSTD:"):
+            return _loads(_zstd_decompress(value[5:]))
+
+        # Entries written before zstd was available
         if value.startswith(b"GZIP:"):
-            import gzip
+            return _loads(gzip.decompress(value[5:]))
 
-            decompressed = gzip.decompress(value[5:])
-            return json.loads(decompressed.decode("utf-8"))
+        return _loads(value)
 
-        return json.loads(value.decode("utf-8"))
+    def _l1_get(self, key: str) -> Optional[bytes]:
+        with self._l1_lock:
+            entry = self._l1.get(key)
+            if entry is None:
+                return None
 
-    async def get(self, key: str) -> Optional[Any]:
-        try:
-            redis_key = self._generate_key(key)
-            value = self.redis_client.get(redis_key)
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._l1[key]
+                return None
+
+            self._l1.move_to_end(key)
+            return value
+
+    def _l1_put(self, key: str, value: bytes) -> None:
+        if self.config.l1_max_entries <= 0:
+            return
 
+        with self._l1_lock:
+            self._l1[key] = (value, time.monotonic() + self.config.l1_ttl)
+            self._l1.move_to_end(key)
+            while len(self._l1) > self.config.l1_max_entries:
+                self._l1.popitem(last=False)
+
+    def _l1_discard(self, *keys: str) -> None:
+        with self._l1_lock:
+            for key in keys:
+                self._l1.pop(key, None)
+
+    def get(self, key: str) -> Optional[Any]:
+        try:
+            # Raw bytes are cached so every caller gets its own decoded copy
+            value = self._l1_get(key)
             if value is None:
-                return None
+                redis_key = self._generate_key(key)
+                value = self.redis_client.get(redis_key)
+
+                if value is None:
+                    return None
+
+                self._l1_put(key, value)
 
             return self._deserialize_value(value)
 
@@ -84,7 +222,7 @@ class RedisCache:
             print(f"Cache get error for key {key}: {e}")
             return None
 
-    async def set(
+    def set(
         self,
         key: str,
         value: Any,
@@ -93,6 +231,7 @@ class RedisCache:
         xx: bool = False,
     ) -> bool:
         try:
+            self._l1_discard(key)
             redis_key = self._generate_key(key)
             serialized_value = self._serialize_value(value)
             ttl = ttl or self.config.default_ttl
@@ -103,12 +242,13 @@ class RedisCache:
 
             return bool(result)
 
-        except (redis.RedisError, json.JSONEncodeError) as e:
+        except (redis.RedisError, TypeError, ValueError) as e:
             print(f"Cache set error for key {key}: {e}")
             return False
 
-    async def delete(self, key: str) -> bool:
+    def delete(self, key: str) -> bool:
         try:
+            self._l1_discard(key)
             redis_key = self._generate_key(key)
             result = self.redis_client.delete(redis_key)
             return result > 0
@@ -117,7 +257,7 @@ class RedisCache:
             print(f"Cache delete error for key {key}: {e}")
             return False
 
-    async def exists(self, key: str) -> bool:
+    def exists(self, key: str) -> bool:
         try:
             redis_key = self._generate_key(key)
             return bool(self.redis_client.exists(redis_key))
@@ -126,7 +266,7 @@ class RedisCache:
             print(f"Cache exists error for key {key}: {e}")
             return False
 
-    async def ttl(self, key: str) -> int:
+    def ttl(self, key: str) -> int:
         try:
             redis_key = self._generate_key(key)
             return self.redis_client.ttl(redis_key)
@@ -135,8 +275,9 @@ class RedisCache:
             print(f"Cache TTL error for key {key}: {e}")
             return -1
 
-    async def expire(self, key: str, ttl: int) -> bool:
+    def expire(self, key: str, ttl: int) -> bool:
         try:
+            self._l1_discard(key)
             redis_key = self._generate_key(key)
             return bool(self.redis_client.expire(redis_key, ttl))
 
@@ -144,8 +285,9 @@ class RedisCache:
             print(f"Cache expire error for key {key}: {e}")
             return False
 
-    async def increment(self, key: str, amount: int = 1) -> Optional[int]:
+    def increment(self, key: str, amount: int = 1) -> Optional[int]:
         try:
+            self._l1_discard(key)
             redis_key = self._generate_key(key)
             return self.redis_client.incrby(redis_key, amount)
 
@@ -153,13 +295,28 @@ class RedisCache:
             print(f"Cache increment error for key {key}: {e}")
             return None
 
-    async def get_many(self, keys: list) -> Dict[str, Any]:
+    def get_many(self, keys: list) -> Dict[str, Any]:
         try:
-            redis_keys = [self._generate_key(key) for key in keys]
-            values = self.redis_client.mget(redis_keys)
+            # Only ask Redis for the keys the in-process cache can't answer
+            raw_values = {}
+            misses = []
+            for key in keys:
+                value = self._l1_get(key)
+                if value is None:
+                    misses.append(key)
+                else:
+                    raw_values[key] = value
+
+            if misses:
+                values = self.redis_client.mget(self._generate_keys(misses))
+                for key, value in zip(misses, values):
+                    if value is not None:
+                        self._l1_put(key, value)
+                        raw_values[key] = value
 
             result = {}
-            for key, value in zip(keys, values):
+            for key in keys:
+                value = raw_values.get(key)
                 if value is not None:
                     try:
                         result[key] = self._deserialize_value(value)
@@ -172,34 +329,47 @@ class RedisCache:
             print(f"Cache get_many error: {e}")
             return {}
 
-    async def set_many(
-        self, mapping: Dict[str, Any], ttl: Optional[int] = None
-    ) -> bool:
+    def set_many(self, mapping: Dict[str, Any], ttl: Optional[int] = None) -> bool:
         try:
-            ttl = ttl or self.config.default_ttl
-            pipe = self.redis_client.pipeline()
+            if not mapping:
+                return True
 
-            for key, value in mapping.items():
-                redis_key = self._generate_key(key)
-                serialized_value = self._serialize_value(value)
-                pipe.set(redis_key, serialized_value, ex=ttl)
+            self._l1_discard(*mapping)
+            ttl = ttl or self.config.default_ttl
+            redis_keys = self._generate_keys(list(mapping))
+            args = [ttl]
+            args.extend(self._serialize_value(value) for value in mapping.values())
 
-            results = pipe.execute()
-            return all(results)
+            # One EVALSHA frame for the whole batch instead of a SET per key
+            written = self._set_many_script(keys=redis_keys, args=args)
+            return written == len(redis_keys)
 
-        except (redis.RedisError, json.JSONEncodeError) as e:
+        except (redis.RedisError, TypeError, ValueError) as e:
             print(f"Cache set_many error: {e}")
             return False
 
-    async def flush_pattern(self, pattern: str) -> int:
+    def flush_pattern(self, pattern: str) -> int:
         try:
-            full_pattern = self._generate_key(pattern)
-            keys = self.redis_client.keys(full_pattern)
+            # Patterns can match anything held locally, so start over
+            with self._l1_lock:
+                self._l1.clear()
 
-            if keys:
-                return self.redis_client.delete(*keys)
+            full_pattern = self._generate_key(pattern)
 
-            return 0
+            # SCAN walks the keyspace incrementally instead of blocking the
+            # server like KEYS; UNLINK reclaims the memory in the background
+            pipe = self.redis_client.pipeline(transaction=False)
+            cursor = 0
+            while True:
+                cursor, keys = self.redis_client.scan(
+                    cursor=cursor, match=full_pattern, count=1000
+                )
+                if keys:
+                    pipe.unlink(*keys)
+                if cursor == 0:
+                    break
+
+            return sum(pipe.execute())
 
         except redis.RedisError as e:
             print(f"Cache flush_pattern error: {e}")
@@ -223,7 +393,7 @@ class RedisCache:
             print(f"Cache stats error: {e}")
             return {}
 
-    async def health_check(self) -> Dict[str, Any]:
+    def health_check(self) -> Dict[str, Any]:
         try:
             start_time = time.time()
 
@@ -232,13 +402,13 @@ class RedisCache:
             test_value = {"timestamp": time.time(), "test": True}
 
             # Set operation
-            await self.set(test_key, test_value, ttl=60)
+            self.set(test_key, test_value, ttl=60)
 
             # Get operation
-            retrieved_value = await self.get(test_key)
+            retrieved_value = self.get(test_key)
 
             # Delete operation
-            await self.delete(test_key)
+            self.delete(test_key)
 
             response_time = time.time() - start_time
 
@@ -0,0 +1,206 @@
+"""
+Read-through Redis cache for Subreddit and User rows looked up by id.
+
+Importing this module also registers session hooks that delete the cached
+keys of Subreddit/User rows updated or deleted by a committed transaction.
+``reddit_analyzer.models`` imports it, so the hooks are active in every
+process that uses the models. Bulk ``query(...).update()``/``delete()`` and
+Core ``update()`` statements bypass the session's flush; code that writes
+these tables that way must call ``EntityCache.invalidate()`` for the ids.
+"""
+
+import enum
+import logging
+import time
+from datetime import datetime
+from typing import Any, Dict, Iterable, Optional
+
+from sqlalchemy import DateTime, Enum, event
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from reddit_analyzer.core.cache import RedisCache, get_cache
+from reddit_analyzer.dataloaders import load_first
+from reddit_analyzer.models import Subreddit, User
+
+logger = logging.getLogger(__name__)
+
+# Seconds a cached row may be served; writes also delete the key on commit
+ENTITY_CACHE_TTL = 600
+
+# Seconds to wait after a failed Redis setup before trying again; until then
+# lookups go straight to the database and commits skip invalidation
+ENTITY_CACHE_RETRY_SECONDS = 60
+
+# Key prefix per cached model, e.g. "subreddit:42"
+_KEY_PREFIXES = {Subreddit: "subreddit", User: "user"}
+
+# Never copied into Redis; reading them on a cached instance raises
+_EXCLUDED_COLUMNS = {User: {"password_hash"}}
+
+
+def _key(model, entity_id: int) -> str:
+    return f"{_KEY_PREFIXES[model]}:{entity_id}"
+
+
+def _cached_columns(model):
+    excluded = _EXCLUDED_COLUMNS.get(model, set())
+    return [c for c in model.__table__.columns if c.key not in excluded]
+
+
+def _to_cache(instance) -> Dict[str, Any]:
+    values = {}
+    for column in _cached_columns(type(instance)):
+        value = getattr(instance, column.key)
+        # Stored as JSON: datetimes as ISO strings, enums by value
+        if isinstance(value, datetime):
+            value = value.isoformat()
+        elif isinstance(value, enum.Enum):
+            value = value.value
+        values[column.key] = value
+    return values
+
+
+def _from_cache(model, values: Dict[str, Any]):
+    """Rebuild a detached instance from its cached column values."""
+    instance = model()
+    for column in _cached_columns(model):
+        value = values.get(column.key)
+        if value is not None and isinstance(column.type, DateTime):
+            value = datetime.fromisoformat(value)
+        elif value is not None and isinstance(column.type, Enum):
+            value = column.type.enum_class(value)
+        setattr(instance, column.key, value)
+    # Clean, detached state with an identity, as if loaded by a query
+    make_transient_to_detached(instance)
+    return instance
+
+
+class EntityCache:
+    """
+    Batch lookups of Subreddit/User rows by id through Redis.
+
+    All ids are fetched with one MGET; only the misses are loaded from the
+    database, in one ``IN (...)`` query, and written back with one batched
+    SET. Returned instances are detached, so relationships must be queried
+    separately.
+    """
+
+    def __init__(self, cache: RedisCache, ttl: int = ENTITY_CACHE_TTL):
+        self.cache = cache
+        self.ttl = ttl
+
+    def get_many(self, session, model, ids: Iterable[int]) -> Dict[int, Any]:
+        """
+        Look up ``model`` rows by id.
+
+        Args:
+            session: SQLAlchemy session used for cache misses
+            model: ``Subreddit`` or ``User``
+            ids: Primary keys to look up
+
+        Returns:
+            Dictionary mapping each id that exists to its instance
+        """
+        ids = list(dict.fromkeys(i for i in ids if i is not None))
+        cached = self.cache.get_many([_key(model, i) for i in ids])
+
+        found = {}
+        missing = []
+        for entity_id in ids:
+            values = cached.get(_key(model, entity_id))
+            if values is None:
+                missing.append(entity_id)
+            else:
+                found[entity_id] = _from_cache(model, values)
+
+        if missing:
+            loaded = load_first(session, model.id, missing)
+            self.cache.set_many(
+                {_key(model, i): _to_cache(row) for i, row in loaded.items()},
+                ttl=self.ttl,
+            )
+            found.update(loaded)
+
+        return found
+
+    def invalidate(self, model, ids: Iterable[int]) -> None:
+        """
+        Drop cached rows so the next lookup reads the database.
+
+        Needed after bulk updates or deletes, which the commit hooks do not
+        see.
+        """
+        for entity_id in ids:
+            self.cache.delete(_key(model, entity_id))
+
+
+_entity_cache: Optional[EntityCache] = None
+# time.monotonic() before which Redis setup is not retried
+_disabled_until = 0.0
+
+
+def get_entity_cache() -> Optional[EntityCache]:
+    """
+    Shared entity cache, or None when Redis is unavailable.
+
+    A failed setup is remembered for ``ENTITY_CACHE_RETRY_SECONDS``, so an
+    outage costs one connection attempt per window rather than one per
+    lookup or commit.
+    """
+    global _entity_cache, _disabled_until
+    if _entity_cache is None:
+        if time.monotonic() < _disabled_until:
+            return None
+        try:
+            _entity_cache = EntityCache(get_cache())
+        except Exception as e:
+            # Unreachable or unconfigured Redis; commits must not fail on it
+            _disabled_until = time.monotonic() + ENTITY_CACHE_RETRY_SECONDS
+            logger.warning(
+                f"Entity cache disabled for {ENTITY_CACHE_RETRY_SECONDS}s: {e}"
+            )
+            return None
+    return _entity_cache
+
+
+def get_subreddits(session, ids: Iterable[int]) -> Dict[int, Subreddit]:
+    """Subreddits by id, through the entity cache when Redis is available."""
+    entity_cache = get_entity_cache()
+    if entity_cache is None:
+        return load_first(session, Subreddit.id, ids)
+    return entity_cache.get_many(session, Subreddit, ids)
+
+
+def get_users(session, ids: Iterable[int]) -> Dict[int, User]:
+    """Users by id, through the entity cache when Redis is available."""
+    entity_cache = get_entity_cache()
+    if entity_cache is None:
+        return load_first(session, User.id, ids)
+    return entity_cache.get_many(session, User, ids)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changed_entities(session, flush_context):
+    """Remember cached rows changed in this transaction."""
+    changed = session.info.setdefault("entity_cache_changed", set())
+    for instance in list(session.dirty) + list(session.deleted):
+        if type(instance) in _KEY_PREFIXES and instance.id is not None:
+            changed.add((type(instance), instance.id))
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_changed_entities(session):
+    """Delete the Redis keys of rows changed by the committed transaction."""
+    changed = session.info.pop("entity_cache_changed", None)
+    if not changed:
+        return
+    entity_cache = get_entity_cache()
+    if entity_cache is None:
+        return  # Keys expire after ENTITY_CACHE_TTL regardless
+    for model, entity_id in changed:
+        entity_cache.invalidate(model, [entity_id])
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_changed_entities(session):
+    session.info.pop("entity_cache_changed", None)
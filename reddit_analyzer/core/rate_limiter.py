@@ -1,6 +1,8 @@
 import asyncio
 import time
-from typing import Dict
+from bisect import bisect_right
+from collections import defaultdict, deque
+from typing import Deque, Dict, Tuple
 from dataclasses import dataclass
 from asyncio import Lock
 
@@ -17,74 +19,56 @@ class RateLimitConfig:
 class RateLimiter:
     def __init__(self, config: RateLimitConfig):
         self.config = config
-        self.requests: Dict[str, list] = {}
-        self.locks: Dict[str, Lock] = {}
-        self.retry_delays: Dict[str, float] = {}
+        self.requests: Dict[str, Deque[float]] = defaultdict(deque)
+        self.locks: Dict[str, Lock] = defaultdict(Lock)
+        self.retry_delays: Dict[str, float] = defaultdict(
+            lambda: self.config.initial_delay
+        )
+
+        # Sliding window lengths in seconds
+        self._window = 60
+        self._burst_window = 10
 
     async def acquire(self, endpoint: str = "default") -> bool:
-        if endpoint not in self.locks:
-            self.locks[endpoint] = Lock()
+        granted, _ = await self._try_acquire(endpoint)
+        return granted
 
+    async def _try_acquire(self, endpoint: str) -> Tuple[bool, float]:
+        """Record a request if allowed; otherwise return how long to wait."""
+        # defaultdict creates the lock atomically, so concurrent first calls
+        # for an endpoint can never end up holding different locks
         async with self.locks[endpoint]:
             current_time = time.time()
+            window = self.requests[endpoint]
 
-            if endpoint not in self.requests:
-                self.requests[endpoint] = []
-
-            # Clean old requests (older than 1 minute)
-            minute_ago = current_time - 60
-            self.requests[endpoint] = [
-                req_time
-                for req_time in self.requests[endpoint]
-                if req_time > minute_ago
-            ]
+            # Clean old requests (older than 1 minute); timestamps are appended
+            # in order, so expired ones are always at the left
+            minute_ago = current_time - self._window
+            while window and window[0] <= minute_ago:
+                window.popleft()
 
-            # Check rate limits
-            if len(self.requests[endpoint]) >= self.config.requests_per_minute:
-                return False
+            # Check rate limits; a slot frees up when the oldest request expires
+            if len(window) >= self.config.requests_per_minute:
+                return False, window[0] + self._window - current_time
 
             # Check burst limit (requests in last 10 seconds)
-            ten_seconds_ago = current_time - 10
-            recent_requests = [
-                req_time
-                for req_time in self.requests[endpoint]
-                if req_time > ten_seconds_ago
-            ]
+            burst_start = bisect_right(window, current_time - self._burst_window)
 
-            if len(recent_requests) >= self.config.burst_limit:
-                return False
+            if len(window) - burst_start >= self.config.burst_limit:
+                return False, window[burst_start] + self._burst_window - current_time
 
             # Record this request
-            self.requests[endpoint].append(current_time)
-            return True
+            window.append(current_time)
+            return True, 0.0
 
     async def wait_if_needed(self, endpoint: str = "default") -> None:
-        while not await self.acquire(endpoint):
-            # Calculate delay based on current rate limit status
-            current_time = time.time()
-            minute_ago = current_time - 60
-
-            if endpoint in self.requests:
-                recent_requests = [
-                    req_time
-                    for req_time in self.requests[endpoint]
-                    if req_time > minute_ago
-                ]
-
-                if recent_requests:
-                    # Wait until the oldest request expires
-                    oldest_request = min(recent_requests)
-                    wait_time = max(0, oldest_request + 60 - current_time + 1)
-                    await asyncio.sleep(wait_time)
-                else:
-                    await asyncio.sleep(1)
-            else:
-                await asyncio.sleep(1)
+        while True:
+            granted, delay = await self._try_acquire(endpoint)
+            if granted:
+                return
+            await asyncio.sleep(max(delay, 0))
 
     async def exponential_backoff(self, endpoint: str, attempt: int) -> None:
-        if endpoint not in self.retry_delays:
-            self.retry_delays[endpoint] = self.config.initial_delay
-
         delay = self.retry_delays[endpoint] * (self.config.backoff_factor**attempt)
         delay = min(delay, 300)  # Max 5 minutes
 
@@ -93,7 +77,7 @@ class RateLimiter:
 
     def reset_endpoint(self, endpoint: str) -> None:
         if endpoint in self.requests:
-            self.requests[endpoint] = []
+            self.requests[endpoint].clear()
         if endpoint in self.retry_delays:
             self.retry_delays[endpoint] = self.config.initial_delay
 
@@ -1,33 +1,62 @@
 """Database configuration and connection management."""
 
 from contextlib import contextmanager
+from functools import lru_cache
 
 from sqlalchemy import create_engine, MetaData
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
-import redis
+from sqlalchemy.pool import QueuePool, StaticPool
 
 from reddit_analyzer.config import get_config
 
 config = get_config()
 
+
+def get_dialect_options(database_url):
+    """Get dialect-specific engine and pool options for the given database URL."""
+    if "sqlite" in database_url:
+        # A single shared connection; only SQLite needs (and tolerates) this
+        return {
+            "poolclass": StaticPool,
+            "connect_args": {"check_same_thread": False},
+        }
+
+    # Server databases get a real pool so concurrent work isn't serialized
+    options = {
+        "poolclass": QueuePool,
+        "pool_size": 5,
+        "max_overflow": 10,
+        "pool_pre_ping": True,
+        "pool_recycle": 1800,
+    }
+
+    if database_url.startswith(("postgresql://", "postgresql+psycopg2://")):
+        # psycopg2 fast execution helpers: batch executemany() calls (e.g. the
+        # per-row inserts during collection) into paged multi-statement
+        # round-trips instead of one round-trip per row.
+        options.update(
+            executemany_mode="values_plus_batch",
+            executemany_batch_page_size=500,
+        )
+
+    return options
+
+
 # SQLAlchemy setup
 engine = create_engine(
     config.DATABASE_URL,
-    poolclass=StaticPool,
-    connect_args=(
-        {"check_same_thread": False} if "sqlite" in config.DATABASE_URL else {}
-    ),
     echo=False,  # Disable SQLAlchemy echo - use logging config instead
+    **get_dialect_options(config.DATABASE_URL),
 )
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Keep instances loaded after commit so CLI loops that touch freshly committed
+# rows (e.g. post.id / post.title in the NLP pass) don't re-SELECT each one.
+SessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
+)
 Base = declarative_base()
 
-# Redis setup
-redis_client = redis.from_url(config.REDIS_URL)
-
 # Metadata for migrations
 metadata = MetaData()
 
@@ -41,9 +70,14 @@ def get_db():
         db.close()
 
 
+@lru_cache(maxsize=1)
 def get_redis():
-    """Get Redis client."""
-    return redis_client
+    """Get Redis client, created on first use."""
+    # redis-py takes a noticeable share of CLI start-up to import, and most
+    # commands never talk to Redis
+    import redis
+
+    return redis.from_url(config.REDIS_URL)
 
 
 def create_tables():
@@ -0,0 +1,53 @@
+"""Batch loaders that replace one-query-per-id ORM lookups in loops."""
+
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List
+
+# Keys per IN (...) query; stays under SQLite's bound-parameter limit
+IN_BATCH_SIZE = 500
+
+
+def load_grouped(session, column, keys: Iterable[Any], *criteria) -> Dict[Any, List]:
+    """
+    Load every row whose ``column`` is in ``keys`` and group the rows by key.
+
+    Issues one ``WHERE column IN (...)`` query per ``IN_BATCH_SIZE`` keys
+    instead of one query per key. Rows within a group keep primary-key order.
+
+    Args:
+        session: SQLAlchemy session
+        column: Mapped column to match keys against, e.g. ``Post.author_id``
+        keys: Key values to load
+        *criteria: Extra filter expressions applied to every batch
+
+    Returns:
+        Dictionary mapping each key that matched to its list of rows
+    """
+    entity = column.class_
+    primary_key = entity.__mapper__.primary_key
+    unique_keys = list(dict.fromkeys(k for k in keys if k is not None))
+
+    grouped = defaultdict(list)
+    for start in range(0, len(unique_keys), IN_BATCH_SIZE):
+        batch = unique_keys[start : start + IN_BATCH_SIZE]
+        rows = (
+            session.query(entity)
+            .filter(column.in_(batch), *criteria)
+            .order_by(*primary_key)
+            .all()
+        )
+        for row in rows:
+            grouped[getattr(row, column.key)].append(row)
+    return dict(grouped)
+
+
+def load_first(session, column, keys: Iterable[Any], *criteria) -> Dict[Any, Any]:
+    """
+    Load the first row per key, batched like ``load_grouped``.
+
+    Replaces ``query.filter(column == key).first()`` inside a loop.
+    """
+    return {
+        key: rows[0]
+        for key, rows in load_grouped(session, column, keys, *criteria).items()
+    }
@@ -6,14 +6,18 @@ into categories such as discussion, meme, news, question, etc.
 """
 
 import logging
+import re
+import tempfile
+from itertools import chain
+from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
 import numpy as np
+import pandas as pd
 from datetime import datetime
 import joblib
 
-from sklearn.ensemble import RandomForestClassifier, GradientBoostingClassifier
+from sklearn.ensemble import RandomForestClassifier
 from sklearn.linear_model import LogisticRegression
-from sklearn.svm import SVC
 from sklearn.naive_bayes import MultinomialNB
 from sklearn.metrics import (
     accuracy_score,
@@ -26,15 +30,271 @@ from sklearn.preprocessing import StandardScaler, LabelEncoder
 
 # Optional transformers for BERT-based classification
 try:
-    from transformers import pipeline
+    from transformers import AutoTokenizer, AutoModelForSequenceClassification
+    import torch
 
     TRANSFORMERS_AVAILABLE = True
 except ImportError:
     TRANSFORMERS_AVAILABLE = False
     logging.warning("Transformers library not available. BERT classification disabled.")
 
+# Optional ONNX export/runtime for faster tree-ensemble prediction
+try:
+    import onnxruntime
+    from skl2onnx import convert_sklearn
+    from skl2onnx.common.data_types import FloatTensorType
+
+    ONNX_AVAILABLE = True
+except ImportError:
+    ONNX_AVAILABLE = False
+
+# Optional treelite compilation of tree ensembles into a native library
+try:
+    import treelite
+    import tl2cgen
+
+    TREELITE_AVAILABLE = True
+except ImportError:
+    TREELITE_AVAILABLE = False
+
+# Optional LightGBM, the default model when installed
+try:
+    import lightgbm as lgb
+
+    LIGHTGBM_AVAILABLE = True
+except ImportError:
+    LIGHTGBM_AVAILABLE = False
+
+# Optional lz4 codec for fast model file compression
+try:
+    import lz4  # noqa: F401
+
+    LZ4_AVAILABLE = True
+except ImportError:
+    LZ4_AVAILABLE = False
+
+# Optional numba JIT for the numeric feature kernel
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Optional multi-pattern matcher for the keyword features
+try:
+    import ahocorasick
+
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Below this many rows, sklearn predicts on one thread instead of n_jobs
+PARALLEL_PREDICT_MIN_ROWS = 256
+
+# Tree-ensemble model types that can be exported to ONNX or compiled by treelite
+_TREE_MODEL_TYPES = frozenset({"random_forest", "gradient_boost"})
+
+# Feature schema: column order of the matrix built by prepare_features
+FEATURE_NAMES: Tuple[str, ...] = (
+    # Content features
+    "title_length",
+    "content_length",
+    "title_word_count",
+    "content_word_count",
+    "title_questions",
+    "content_questions",
+    "has_question_words",
+    "starts_with_question",
+    "has_news_words",
+    "has_news_phrases",
+    "has_discussion_words",
+    "has_discussion_phrases",
+    "has_meme_words",
+    "exclamation_count",
+    "has_caps_words",
+    "has_advice_words",
+    "starts_with_advice",
+    "has_story_words",
+    "has_story_phrases",
+    "has_image_words",
+    "has_video_words",
+    "has_media_url",
+    "has_external_url",
+    # Sentiment features
+    "sentiment_compound",
+    "sentiment_positive",
+    "sentiment_negative",
+    "is_positive_sentiment",
+    "is_negative_sentiment",
+    # Text complexity
+    "avg_word_length",
+    "avg_sentence_length",
+    "readability_score",
+    "entity_count",
+    "keyword_count",
+    # Metadata features
+    "is_stickied",
+    "is_locked",
+    "is_nsfw",
+    "is_spoiler",
+    "is_oc",
+    "flair_length",
+    "is_self_post",
+    # Subreddit features
+    "subreddit_is_meme",
+    "subreddit_is_news",
+    "subreddit_is_help",
+    "subreddit_is_pics",
+    "subreddit_is_video",
+    # Engagement features
+    "log_score",
+    "upvote_ratio",
+    "log_comments",
+    "gilded",
+    "log_author_comment_karma",
+    "log_author_link_karma",
+    "author_is_gold",
+)
+FEATURE_IDX = {name: i for i, name in enumerate(FEATURE_NAMES)}
+
+# Column blocks filled by _build_feature_matrix
+_N_FEATURES = len(FEATURE_NAMES)
+_METADATA_START = FEATURE_IDX["is_stickied"]
+_SUBREDDIT_START = FEATURE_IDX["subreddit_is_meme"]
+_ENGAGEMENT_START = FEATURE_IDX["log_score"]
+_N_SUBREDDIT_FEATURES = _ENGAGEMENT_START - _SUBREDDIT_START
+
+# Metadata and engagement columns other than the subreddit flags are numeric
+# and filled by _fill_numeric_features; log_* columns are log1p-transformed
+_NUMERIC_COLUMNS = np.array(
+    list(range(_METADATA_START, _SUBREDDIT_START))
+    + list(range(_ENGAGEMENT_START, _N_FEATURES))
+)
+_NUMERIC_LOG1P = np.array(
+    [FEATURE_NAMES[i].startswith("log_") for i in _NUMERIC_COLUMNS]
+)
+
+# Keyword groups used by _fill_content_features (substring matches)
+_QUESTION_WORDS = ("how", "what", "why", "when", "where", "who")
+_QUESTION_PREFIXES = ("how to", "what is", "why does")
+_NEWS_WORDS = ("breaking", "news", "report", "update", "announcement")
+_NEWS_PHRASES = ("according to", "reported", "sources say")
+_DISCUSSION_WORDS = ("discussion", "thoughts", "opinion", "debate")
+_DISCUSSION_PHRASES = ("what do you think", "your thoughts", "discussion")
+_MEME_WORDS = ("meme", "funny", "lol", "humor", "joke")
+_ADVICE_WORDS = ("advice", "help", "need help", "suggestions")
+_ADVICE_PREFIXES = ("need advice", "help me", "looking for advice")
+_STORY_WORDS = ("story", "happened", "experience", "today")
+_STORY_PHRASES = ("so today", "this happened", "long story")
+_IMAGE_WORDS = ("image", "pic", "photo", "picture")
+_VIDEO_WORDS = ("video", "clip", "watch")
+_MEDIA_DOMAINS = ("imgur", "youtube", "reddit.com/gallery")
+
+
+def _any_of(words: Tuple[str, ...]) -> str:
+    """Regex alternation matching any of the given literal words."""
+    return "|".join(re.escape(word) for word in words)
+
+
+# Keyword groups checked against every lowercased title / content text
+_TITLE_KEYWORD_GROUPS = (
+    _QUESTION_WORDS,
+    _NEWS_WORDS,
+    _DISCUSSION_WORDS,
+    _DISCUSSION_PHRASES,
+    _MEME_WORDS,
+    _ADVICE_WORDS,
+    _STORY_WORDS,
+    _IMAGE_WORDS,
+    _VIDEO_WORDS,
+)
+_CONTENT_KEYWORD_GROUPS = (_NEWS_PHRASES, _STORY_PHRASES)
+
+# Alternations for the remaining vectorized pandas string checks
+_QUESTION_PREFIXES_RE = _any_of(_QUESTION_PREFIXES)
+_ADVICE_PREFIXES_RE = _any_of(_ADVICE_PREFIXES)
+_MEDIA_DOMAINS_RE = _any_of(_MEDIA_DOMAINS)
+
+
+def _keyword_automaton(groups: Tuple[Tuple[str, ...], ...]):
+    """Aho-Corasick automaton mapping each keyword to a bitmask of its groups."""
+    automaton = ahocorasick.Automaton()
+    for bit, words in enumerate(groups):
+        for word in words:
+            automaton.add_word(word, automaton.get(word, 0) | (1 << bit))
+    automaton.make_automaton()
+    return automaton
+
+
+if AHOCORASICK_AVAILABLE:
+    _TITLE_AUTOMATON = _keyword_automaton(_TITLE_KEYWORD_GROUPS)
+    _CONTENT_AUTOMATON = _keyword_automaton(_CONTENT_KEYWORD_GROUPS)
+else:
+    _TITLE_AUTOMATON = _CONTENT_AUTOMATON = None
+
+
+def _keyword_flags(
+    texts: pd.Series, groups: Tuple[Tuple[str, ...], ...], automaton
+) -> np.ndarray:
+    """
+    Flag which keyword groups occur (as substrings) in each text.
+
+    With pyahocorasick each text is scanned once for every group; otherwise
+    each group is one vectorized regex search over the whole column.
+
+    Returns:
+        Boolean array of shape (len(groups), len(texts))
+    """
+    if automaton is None:
+        return np.array([texts.str.contains(_any_of(words)) for words in groups])
+
+    def scan(text: str) -> int:
+        mask = 0
+        for _, bits in automaton.iter(text):
+            mask |= bits
+        return mask
+
+    masks = np.fromiter(map(scan, texts), dtype=np.int64, count=len(texts))
+    return (masks >> np.arange(len(groups))[:, None]) & 1 == 1
+
+
+# Marks a label key that is absent from an item, as opposed to set to None
+_MISSING = object()
+
+# _auto_labels title rules, in priority order (substring matches)
+_AUTO_LABEL_TITLE_RULES = (
+    ("question", re.compile(_any_of(("?", "how", "what", "why", "help me")))),
+    ("meme", re.compile(_any_of(("meme", "funny", "lol", "humor")))),
+    ("news", re.compile(_any_of(("breaking", "news", "report")))),
+    ("advice", re.compile(_any_of(("advice", "suggestions", "help")))),
+    ("story", re.compile(_any_of(("story", "happened", "experience")))),
+)
+_IMAGE_URL_RE = re.compile(_any_of(("imgur", "i.redd.it")))
+_VIDEO_URL_RE = re.compile(_any_of(("youtube", "streamable")))
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(parallel=True, cache=True)
+    def _fill_numeric_features(out, raw, columns, log1p_mask):
+        """Write raw numeric values into out's columns, log-transforming some."""
+        for i in prange(raw.shape[0]):
+            for j in range(raw.shape[1]):
+                value = raw[i, j]
+                if log1p_mask[j]:
+                    value = np.log1p(value)
+                out[i, columns[j]] = value
+
+else:
+
+    def _fill_numeric_features(out, raw, columns, log1p_mask):
+        """Write raw numeric values into out's columns, log-transforming some."""
+        raw[:, log1p_mask] = np.log1p(raw[:, log1p_mask])
+        out[:, columns] = raw
+
 
 class ContentClassifier:
     """
@@ -46,23 +306,37 @@ class ContentClassifier:
 
     def __init__(
         self,
-        model_type: str = "random_forest",
+        model_type: Optional[str] = None,
         categories: Optional[List[str]] = None,
         use_transformers: bool = False,
-        normalize_features: bool = True,
+        normalize_features: Optional[bool] = None,
+        batch_size: int = 32,
+        lazy: bool = False,
     ):
         """
         Initialize the content classifier.
 
         Args:
-            model_type: Type of model ('random_forest', 'logistic', 'svm', 'bert')
+            model_type: Type of model ('lightgbm', 'random_forest', 'logistic',
+                'svm', 'naive_bayes', 'gradient_boost', 'bert'); defaults to
+                'lightgbm' when LightGBM is installed, else 'random_forest'
             categories: List of content categories to classify
             use_transformers: Whether to use transformer-based models
-            normalize_features: Whether to normalize features
+            normalize_features: Whether to normalize features; defaults to
+                True except for LightGBM, whose histogram splits are unaffected
+                by feature scale
+            batch_size: Number of texts per BERT forward pass
+            lazy: Defer building the model until fit(), e.g. before load_model()
         """
+        if model_type is None:
+            model_type = "lightgbm" if LIGHTGBM_AVAILABLE else "random_forest"
+        if normalize_features is None:
+            normalize_features = model_type != "lightgbm"
+
         self.model_type = model_type
         self.use_transformers = use_transformers and TRANSFORMERS_AVAILABLE
         self.normalize_features = normalize_features
+        self.batch_size = batch_size
 
         # Default categories if none provided
         if categories is None:
@@ -83,10 +357,19 @@ class ContentClassifier:
 
         # Initialize components
         self.model = None
-        self.scaler = StandardScaler() if normalize_features else None
+        # copy=False: prepare_features returns a fresh array, scaled in place
+        self.scaler = StandardScaler(copy=False) if normalize_features else None
         self.label_encoder = LabelEncoder()
-        self.transformer_pipeline = None
-        self.feature_names = []
+        # label_encoder.classes_ as plain strings, indexed by encoded label
+        self._classes: Tuple[str, ...] = ()
+        self.bert_tokenizer = None
+        self.bert_model = None
+        self.device = "cpu"
+        self._ort_session = None
+        self._tl_predictor = None
+        # Bytes of the compiled library behind _tl_predictor, for save_model
+        self._tl_lib: Optional[bytes] = None
+        self.feature_names = list(FEATURE_NAMES)
         self.is_fitted = False
 
         # Performance metrics
@@ -94,16 +377,33 @@ class ContentClassifier:
         self.validation_metrics = {}
 
         # Initialize the selected model
-        self._initialize_model()
+        if not lazy:
+            self._initialize_model()
 
     def _initialize_model(self):
         """Initialize the machine learning model based on type."""
-        if self.model_type == "random_forest":
+        if self.model_type == "lightgbm":
+            if not LIGHTGBM_AVAILABLE:
+                raise ValueError("LightGBM is not installed")
+            # Class count and multiclass objective are inferred by fit()
+            self.model = lgb.LGBMClassifier(
+                n_estimators=300,
+                num_leaves=31,
+                learning_rate=0.05,
+                colsample_bytree=0.9,
+                n_jobs=-1,
+                random_state=42,
+                verbose=-1,
+            )
+        elif self.model_type == "random_forest":
+            # Shallow trees on half-size bootstrap samples keep prediction cheap
             self.model = RandomForestClassifier(
-                n_estimators=100,
-                max_depth=15,
-                min_samples_split=5,
-                min_samples_leaf=2,
+                n_estimators=200,
+                max_depth=10,
+                min_samples_leaf=5,
+                max_features="sqrt",
+                bootstrap=True,
+                max_samples=0.5,
                 random_state=42,
                 n_jobs=-1,
             )
@@ -112,10 +412,16 @@ class ContentClassifier:
                 random_state=42, max_iter=1000, multi_class="ovr"
             )
         elif self.model_type == "svm":
-            self.model = SVC(kernel="rbf", random_state=42, probability=True)
+            from sklearn.svm import SVC
+
+            # No Platt scaling: it cross-validates the SVC five more times in
+            # fit; predict turns decision_function scores into probabilities
+            self.model = SVC(kernel="rbf", random_state=42)
         elif self.model_type == "naive_bayes":
             self.model = MultinomialNB()
         elif self.model_type == "gradient_boost":
+            from sklearn.ensemble import GradientBoostingClassifier
+
             self.model = GradientBoostingClassifier(
                 n_estimators=100, max_depth=6, random_state=42
             )
@@ -133,17 +439,25 @@ class ContentClassifier:
         try:
             # Use a pre-trained model for text classification
             model_name = "microsoft/DialoGPT-medium"  # Can be changed to other models
-            self.transformer_pipeline = pipeline(
-                "text-classification",
-                model=model_name,
-                tokenizer=model_name,
-                max_length=512,
-                truncation=True,
-            )
-            logger.info("BERT classifier initialized")
+            self.bert_tokenizer = AutoTokenizer.from_pretrained(model_name)
+            if self.bert_tokenizer.pad_token is None:
+                # GPT-style tokenizers have no pad token; batching needs one
+                self.bert_tokenizer.pad_token = self.bert_tokenizer.eos_token
+
+            model = AutoModelForSequenceClassification.from_pretrained(model_name)
+            model.config.pad_token_id = self.bert_tokenizer.pad_token_id
+
+            self.device = "cuda" if torch.cuda.is_available() else "cpu"
+            model = model.to(self.device).eval()
+            if self.device == "cuda":
+                model = model.half()
+            self.bert_model = model
+            logger.info(f"BERT classifier initialized on {self.device}")
         except Exception as e:
             logger.warning(f"Failed to initialize BERT model: {e}")
             # Fallback to traditional model
+            self.bert_tokenizer = None
+            self.bert_model = None
             self.model_type = "random_forest"
             self._initialize_model()
 
@@ -157,219 +471,213 @@ class ContentClassifier:
             data: List of Reddit post/comment dictionaries
 
         Returns:
-            Tuple of (feature_matrix, label_array)
+            Tuple of (float32 feature_matrix, label_array)
         """
         if not data:
             return np.array([]), np.array([])
 
-        features = []
-        labels = []
-
-        for item in data:
-            # Extract various feature types
-            content_features = self._extract_content_features(item)
-            metadata_features = self._extract_metadata_features(item)
-            engagement_features = self._extract_engagement_features(item)
-
-            # Combine features
-            item_features = content_features + metadata_features + engagement_features
-
-            # Extract label
-            label = self._extract_label(item)
-
-            if label is not None:
-                features.append(item_features)
-                labels.append(label)
-
-        if not features:
+        # The text frame is shared by auto-labelling and feature extraction
+        text = self._text_frame(data)
+        labels = self._extract_labels(data, text)
+        kept = [i for i, label in enumerate(labels) if label is not None]
+        if not kept:
             return np.array([]), np.array([])
 
-        # Convert to numpy arrays
-        X = np.array(features)
-        y = np.array(labels)
+        if len(kept) < len(data):
+            data = [data[i] for i in kept]
+            labels = [labels[i] for i in kept]
+            text = text.iloc[kept].reset_index(drop=True)
 
-        # Store feature names
-        if not self.feature_names:
-            self.feature_names = self._get_feature_names()
+        X = self._build_feature_matrix(data, text)
+        y = np.array(labels)
 
         return X, y
 
-    def _extract_content_features(self, item: Dict[str, Any]) -> List[float]:
-        """Extract content-based features."""
-        title = item.get("title", "") or ""
-        content = item.get("selftext", "") or item.get("body", "") or ""
-        url = item.get("url", "") or ""
+    def _build_feature_matrix(
+        self, items: List[Dict[str, Any]], text: Optional[pd.DataFrame] = None
+    ) -> np.ndarray:
+        """Build the float32 feature matrix for items, one row per item."""
+        n_items = len(items)
+        if text is None:
+            text = self._text_frame(items)
+
+        # float32 halves the memory moved through scaling, fit and predict;
+        # each feature group writes straight into its block of columns
+        X = np.empty((n_items, _N_FEATURES), dtype=np.float32)
+
+        # Text features are computed column-wise over the batch
+        self._fill_content_features(items, text, X[:, :_METADATA_START])
+
+        # Numeric metadata and engagement values go through one kernel
+        raw = np.fromiter(
+            chain.from_iterable(self._numeric_values(item) for item in items),
+            dtype=np.float64,
+            count=n_items * len(_NUMERIC_COLUMNS),
+        ).reshape(n_items, len(_NUMERIC_COLUMNS))
+        _fill_numeric_features(X, raw, _NUMERIC_COLUMNS, _NUMERIC_LOG1P)
+
+        X[:, _SUBREDDIT_START:_ENGAGEMENT_START] = np.fromiter(
+            chain.from_iterable(
+                self._extract_subreddit_features(item) for item in items
+            ),
+            dtype=np.float32,
+            count=n_items * _N_SUBREDDIT_FEATURES,
+        ).reshape(n_items, _N_SUBREDDIT_FEATURES)
+
+        return X
+
+    def _text_frame(self, items: List[Dict[str, Any]]) -> pd.DataFrame:
+        """Title, content and URL text of each item, plus lowercased copies."""
+        title = pd.Series([item.get("title", "") or "" for item in items], dtype=str)
+        content = pd.Series(
+            [item.get("selftext", "") or item.get("body", "") or "" for item in items],
+            dtype=str,
+        )
+
+        # Lowercase once; keyword checks and auto-labels are substring tests
+        return pd.DataFrame(
+            {
+                "title": title,
+                "content": content,
+                "url": pd.Series(
+                    [item.get("url", "") or "" for item in items], dtype=str
+                ),
+                "title_lower": title.str.lower(),
+                "content_lower": content.str.lower(),
+            }
+        )
+
+    def _fill_content_features(
+        self, items: List[Dict[str, Any]], text: pd.DataFrame, out: np.ndarray
+    ):
+        """Write content-based features for all items into out's columns."""
+        title = text["title"]
+        content = text["content"]
+        url = text["url"]
+        title_lower = text["title_lower"]
+        content_lower = text["content_lower"]
+        has_url = url.str.len().to_numpy() > 0
+
+        # Title words are split once and shared by the count and caps check;
+        # content words are only counted, so no lists are built for them
+        title_words = title.str.split()
+
+        (
+            question_words,
+            news_words,
+            discussion_words,
+            discussion_phrases,
+            meme_words,
+            advice_words,
+            story_words,
+            image_words,
+            video_words,
+        ) = _keyword_flags(title_lower, _TITLE_KEYWORD_GROUPS, _TITLE_AUTOMATON)
+        news_phrases, story_phrases = _keyword_flags(
+            content_lower, _CONTENT_KEYWORD_GROUPS, _CONTENT_AUTOMATON
+        )
 
-        features = [
+        columns = [
             # Basic text features
-            len(title),
-            len(content),
-            len(title.split()),
-            len(content.split()),
+            title.str.len(),
+            content.str.len(),
+            title_words.str.len(),
+            content.str.count(r"\S+"),
             # Question indicators
-            title.count("?"),
-            content.count("?"),
-            (
-                1
-                if any(
-                    word in title.lower()
-                    for word in ["how", "what", "why", "when", "where", "who"]
-                )
-                else 0
-            ),
-            1 if title.lower().startswith(("how to", "what is", "why does")) else 0,
+            title.str.count(r"\?"),
+            content.str.count(r"\?"),
+            question_words,
+            title_lower.str.match(_QUESTION_PREFIXES_RE),
             # News indicators
-            (
-                1
-                if any(
-                    word in title.lower()
-                    for word in ["breaking", "news", "report", "update", "announcement"]
-                )
-                else 0
-            ),
-            (
-                1
-                if any(
-                    word in content.lower()
-                    for word in ["according to", "reported", "sources say"]
-                )
-                else 0
-            ),
+            news_words,
+            news_phrases,
             # Discussion indicators
-            (
-                1
-                if any(
-                    word in title.lower()
-                    for word in ["discussion", "thoughts", "opinion", "debate"]
-                )
-                else 0
-            ),
-            (
-                1
-                if any(
-                    word in title.lower()
-                    for word in ["what do you think", "your thoughts", "discussion"]
-                )
-                else 0
-            ),
+            discussion_words,
+            discussion_phrases,
             # Meme/humor indicators
-            (
-                1
-                if any(
-                    word in title.lower()
-                    for word in ["meme", "funny", "lol", "humor", "joke"]
-                )
-                else 0
-            ),
-            title.count("!"),
-            (
-                1
-                if any(
-                    caps_word in title
-                    for caps_word in title.split()
-                    if caps_word.isupper() and len(caps_word) > 2
-                )
-                else 0
-            ),
+            meme_words,
+            title.str.count("!"),
+            [
+                any(word.isupper() and len(word) > 2 for word in words)
+                for words in title_words
+            ],
             # Advice indicators
-            (
-                1
-                if any(
-                    word in title.lower()
-                    for word in ["advice", "help", "need help", "suggestions"]
-                )
-                else 0
-            ),
-            (
-                1
-                if title.lower().startswith(
-                    ("need advice", "help me", "looking for advice")
-                )
-                else 0
-            ),
+            advice_words,
+            title_lower.str.match(_ADVICE_PREFIXES_RE),
             # Story indicators
-            (
-                1
-                if any(
-                    word in title.lower()
-                    for word in ["story", "happened", "experience", "today"]
-                )
-                else 0
-            ),
-            (
-                1
-                if any(
-                    word in content.lower()
-                    for word in ["so today", "this happened", "long story"]
-                )
-                else 0
-            ),
+            story_words,
+            story_phrases,
             # Media indicators
-            (
-                1
-                if any(
-                    word in title.lower()
-                    for word in ["image", "pic", "photo", "picture"]
-                )
-                else 0
-            ),
-            (
-                1
-                if any(word in title.lower() for word in ["video", "clip", "watch"])
-                else 0
-            ),
-            (
-                1
-                if url
-                and any(
-                    domain in url
-                    for domain in ["imgur", "youtube", "reddit.com/gallery"]
-                )
-                else 0
-            ),
-            (
-                1 if url and not url.startswith("https://www.reddit.com") else 0
-            ),  # External link
+            image_words,
+            video_words,
+            url.str.contains(_MEDIA_DOMAINS_RE),
+            # External link
+            has_url & ~url.str.startswith("https://www.reddit.com").to_numpy(),
         ]
 
         # Sentiment features (if available)
-        sentiment = item.get("sentiment", {})
-        features.extend(
+        sentiments = [item.get("sentiment", {}) for item in items]
+        columns.extend(
             [
-                sentiment.get("compound_score", 0),
-                sentiment.get("positive_score", 0),
-                sentiment.get("negative_score", 0),
-                1 if sentiment.get("sentiment_label", "NEUTRAL") == "POSITIVE" else 0,
-                1 if sentiment.get("sentiment_label", "NEUTRAL") == "NEGATIVE" else 0,
+                [sentiment.get("compound_score", 0) for sentiment in sentiments],
+                [sentiment.get("positive_score", 0) for sentiment in sentiments],
+                [sentiment.get("negative_score", 0) for sentiment in sentiments],
+                [
+                    sentiment.get("sentiment_label", "NEUTRAL") == "POSITIVE"
+                    for sentiment in sentiments
+                ],
+                [
+                    sentiment.get("sentiment_label", "NEUTRAL") == "NEGATIVE"
+                    for sentiment in sentiments
+                ],
             ]
         )
 
         # Text complexity features
-        text_analysis = item.get("text_analysis", {})
-        readability = text_analysis.get("readability", {})
-        features.extend(
+        analyses = [item.get("text_analysis", {}) for item in items]
+        readabilities = [analysis.get("readability", {}) for analysis in analyses]
+        columns.extend(
             [
-                readability.get("avg_word_length", 0),
-                readability.get("avg_sentence_length", 0),
-                readability.get("readability_score", 0),
-                len(text_analysis.get("entities", [])),
-                len(text_analysis.get("keywords", [])),
+                [r.get("avg_word_length", 0) for r in readabilities],
+                [r.get("avg_sentence_length", 0) for r in readabilities],
+                [r.get("readability_score", 0) for r in readabilities],
+                [len(analysis.get("entities", [])) for analysis in analyses],
+                [len(analysis.get("keywords", [])) for analysis in analyses],
             ]
         )
 
-        return features
+        for j, column in enumerate(columns):
+            out[:, j] = column
 
-    def _extract_metadata_features(self, item: Dict[str, Any]) -> List[float]:
-        """Extract metadata features."""
-        features = [
-            1 if item.get("stickied", False) else 0,
-            1 if item.get("locked", False) else 0,
-            1 if item.get("over_18", False) else 0,
-            1 if item.get("spoiler", False) else 0,
-            1 if item.get("is_original_content", False) else 0,
+    def _numeric_values(self, item: Dict[str, Any]) -> Tuple[float, ...]:
+        """Raw values for the numeric metadata and engagement features."""
+        author = item.get("author", {})
+        if not isinstance(author, dict):
+            # Author features are zero when the author is not expanded
+            author = {}
+
+        return (
+            # Metadata flags
+            bool(item.get("stickied", False)),
+            bool(item.get("locked", False)),
+            bool(item.get("over_18", False)),
+            bool(item.get("spoiler", False)),
+            bool(item.get("is_original_content", False)),
             len(item.get("link_flair_text", "") or ""),
-            1 if item.get("is_self", True) else 0,
-        ]
+            bool(item.get("is_self", True)),
+            # Engagement; score, comments and karma are log-transformed later
+            item.get("score", 0),
+            item.get("upvote_ratio", 0.5),
+            item.get("num_comments", 0),
+            item.get("gilded", 0),
+            author.get("comment_karma", 0),
+            author.get("link_karma", 0),
+            bool(author.get("is_gold", False)),
+        )
+
+    def _extract_subreddit_features(self, item: Dict[str, Any]) -> List[float]:
+        """Extract subreddit characteristic flags."""
+        features = []
 
         # Subreddit characteristics
         subreddit = item.get("subreddit", {})
@@ -415,136 +723,61 @@ class ContentClassifier:
 
         return features
 
-    def _extract_engagement_features(self, item: Dict[str, Any]) -> List[float]:
-        """Extract engagement-based features."""
-        features = [
-            np.log1p(item.get("score", 0)),  # Log-transformed score
-            item.get("upvote_ratio", 0.5),
-            np.log1p(item.get("num_comments", 0)),  # Log-transformed comment count
-            item.get("gilded", 0),
-        ]
+    def _extract_labels(
+        self, items: List[Dict[str, Any]], text: pd.DataFrame
+    ) -> List[Optional[str]]:
+        """Extract ground truth labels, auto-labelling items without one."""
+        auto_labels = None
+        labels = []
 
-        # Author features
-        author = item.get("author", {})
-        if isinstance(author, dict):
-            features.extend(
-                [
-                    np.log1p(author.get("comment_karma", 0)),
-                    np.log1p(author.get("link_karma", 0)),
-                    1 if author.get("is_gold", False) else 0,
-                ]
-            )
-        else:
-            features.extend([0, 0, 0])
+        for i, item in enumerate(items):
+            # Explicitly provided labels win, even when None
+            label = item.get("category", _MISSING)
+            if label is _MISSING:
+                label = item.get("content_type", _MISSING)
 
-        return features
+            if label is _MISSING:
+                # Auto-labeling based on content analysis (for unlabeled data)
+                if auto_labels is None:
+                    auto_labels = self._auto_labels(text)
+                label = auto_labels[i]
 
-    def _extract_label(self, item: Dict[str, Any]) -> Optional[str]:
-        """Extract ground truth label from item."""
-        # Check if label is explicitly provided
-        if "category" in item:
-            return item["category"]
-
-        if "content_type" in item:
-            return item["content_type"]
-
-        # Auto-labeling based on content analysis (for unlabeled data)
-        return self._auto_label(item)
-
-    def _auto_label(self, item: Dict[str, Any]) -> str:
-        """Automatically assign a label based on content patterns."""
-        title = (item.get("title", "") or "").lower()
-        url = item.get("url", "") or ""
-
-        # Rule-based auto-labeling
-        if any(word in title for word in ["?", "how", "what", "why", "help me"]):
-            return "question"
-        elif any(word in title for word in ["meme", "funny", "lol", "humor"]):
-            return "meme"
-        elif any(word in title for word in ["breaking", "news", "report"]):
-            return "news"
-        elif any(word in title for word in ["advice", "suggestions", "help"]):
-            return "advice"
-        elif any(word in title for word in ["story", "happened", "experience"]):
-            return "story"
-        elif (
-            any(domain in url for domain in ["imgur", "i.redd.it"]) or "image" in title
-        ):
-            return "image"
-        elif (
-            any(domain in url for domain in ["youtube", "streamable"])
-            or "video" in title
-        ):
-            return "video"
-        elif url and not url.startswith("https://www.reddit.com"):
-            return "link"
-        elif any(word in title for word in ["discussion", "thoughts", "opinion"]):
-            return "discussion"
-        else:
-            return "discussion"  # Default category
+            labels.append(label)
 
-    def _get_feature_names(self) -> List[str]:
-        """Get names of all features."""
-        return [
-            # Content features
-            "title_length",
-            "content_length",
-            "title_word_count",
-            "content_word_count",
-            "title_questions",
-            "content_questions",
-            "has_question_words",
-            "starts_with_question",
-            "has_news_words",
-            "has_news_phrases",
-            "has_discussion_words",
-            "has_discussion_phrases",
-            "has_meme_words",
-            "exclamation_count",
-            "has_caps_words",
-            "has_advice_words",
-            "starts_with_advice",
-            "has_story_words",
-            "has_story_phrases",
-            "has_image_words",
-            "has_video_words",
-            "has_media_url",
-            "has_external_url",
-            # Sentiment features
-            "sentiment_compound",
-            "sentiment_positive",
-            "sentiment_negative",
-            "is_positive_sentiment",
-            "is_negative_sentiment",
-            # Text complexity
-            "avg_word_length",
-            "avg_sentence_length",
-            "readability_score",
-            "entity_count",
-            "keyword_count",
-            # Metadata features
-            "is_stickied",
-            "is_locked",
-            "is_nsfw",
-            "is_spoiler",
-            "is_oc",
-            "flair_length",
-            "is_self_post",
-            # Subreddit features
-            "subreddit_is_meme",
-            "subreddit_is_news",
-            "subreddit_is_help",
-            "subreddit_is_pics",
-            "subreddit_is_video",
-            # Engagement features
-            "log_score",
-            "upvote_ratio",
-            "log_comments",
-            "gilded",
-            "log_author_comment_karma",
-            "log_author_link_karma",
-            "author_is_gold",
+        return labels
+
+    def _auto_labels(self, text: pd.DataFrame) -> List[str]:
+        """Assign a label to every item based on content patterns."""
+        title_lower = text["title_lower"]
+        url = text["url"]
+
+        # Rule-based auto-labeling; np.select takes the first matching rule
+        conditions = [
+            title_lower.str.contains(pattern) for _, pattern in _AUTO_LABEL_TITLE_RULES
         ]
+        choices = [label for label, _ in _AUTO_LABEL_TITLE_RULES]
+
+        conditions.append(
+            url.str.contains(_IMAGE_URL_RE)
+            | title_lower.str.contains("image", regex=False)
+        )
+        choices.append("image")
+        conditions.append(
+            url.str.contains(_VIDEO_URL_RE)
+            | title_lower.str.contains("video", regex=False)
+        )
+        choices.append("video")
+        conditions.append(
+            (url.str.len() > 0) & ~url.str.startswith("https://www.reddit.com")
+        )
+        choices.append("link")
+
+        # Discussion keywords and anything unmatched
+        return np.select(conditions, choices, default="discussion").tolist()
+
+    def _get_feature_names(self) -> Tuple[str, ...]:
+        """Get names of all features."""
+        return FEATURE_NAMES
 
     def fit(
         self,
@@ -565,6 +798,9 @@ class ContentClassifier:
             f"Training {self.model_type} classifier with {len(self.categories)} categories"
         )
 
+        if self.model is None and self.bert_model is None:
+            self._initialize_model()
+
         # Prepare training features and labels
         X_train, y_train = self.prepare_features(training_data)
 
@@ -574,6 +810,7 @@ class ContentClassifier:
 
         # Encode labels
         y_train_encoded = self.label_encoder.fit_transform(y_train)
+        self._classes = tuple(self.label_encoder.classes_.tolist())
 
         # Normalize features if requested
         if self.normalize_features and self.scaler:
@@ -581,7 +818,7 @@ class ContentClassifier:
 
         # Train the model
         try:
-            if self.model_type == "bert" and self.transformer_pipeline:
+            if self.model_type == "bert" and self.bert_model:
                 # BERT training is different (fine-tuning would be needed)
                 # For now, we'll use the pre-trained model
                 self.is_fitted = True
@@ -589,6 +826,8 @@ class ContentClassifier:
             else:
                 self.model.fit(X_train, y_train_encoded)
                 self.is_fitted = True
+                self._ort_session = None
+                self._tl_predictor = self._compile_forest()
 
                 # Calculate training metrics
                 y_train_pred = self.model.predict(X_train)
@@ -652,17 +891,19 @@ class ContentClassifier:
             logger.warning("Model not fitted. Call fit() first.")
             return []
 
-        results = []
+        if self.model_type == "bert" and self.bert_model:
+            return self._predict_with_bert(data)
 
+        try:
+            return self._predict_with_traditional(data)
+        except Exception as e:
+            logger.warning(f"Batch classification failed, retrying per item: {e}")
+
+        # Isolate the items that cannot be classified
+        results = []
         for i, item in enumerate(data):
             try:
-                if self.model_type == "bert" and self.transformer_pipeline:
-                    result = self._predict_with_bert(item, i)
-                else:
-                    result = self._predict_with_traditional(item, i)
-
-                results.append(result)
-
+                results.extend(self._predict_with_traditional([item], i))
             except Exception as e:
                 logger.warning(f"Failed to classify item {i}: {e}")
                 results.append(self._empty_prediction(item, i))
@@ -670,91 +911,204 @@ class ContentClassifier:
         return results
 
     def _predict_with_traditional(
-        self, item: Dict[str, Any], index: int
-    ) -> Dict[str, Any]:
-        """Predict using traditional ML models."""
-        # Prepare features
-        X, _ = self.prepare_features([item])
+        self, items: List[Dict[str, Any]], offset: int = 0
+    ) -> List[Dict[str, Any]]:
+        """
+        Predict using traditional ML models.
 
-        if len(X) == 0:
-            return self._empty_prediction(item, index)
+        The whole slice goes through one scaler transform and one
+        predict_proba call; only result assembly is per item.
+
+        Args:
+            items: Items to classify
+            offset: Index of the first item, used for default item ids
+
+        Returns:
+            List of classification results
+        """
+        if not items:
+            return []
+
+        X = self._build_feature_matrix(items)
 
         # Normalize features if needed
         if self.normalize_features and self.scaler:
             X = self.scaler.transform(X)
 
         # Make prediction
-        prediction = self.model.predict(X[0].reshape(1, -1))[0]
-        probabilities = self.model.predict_proba(X[0].reshape(1, -1))[0]
+        predictions, probabilities = self._predict_arrays(X)
 
-        # Decode prediction
-        predicted_category = self.label_encoder.inverse_transform([prediction])[0]
+        # Decode predictions
+        classes = self._classes
+        predicted_categories = [classes[label] for label in predictions]
 
-        # Create probability distribution
-        prob_dist = {}
-        for i, category in enumerate(self.label_encoder.classes_):
-            prob_dist[self.label_encoder.inverse_transform([category])[0]] = float(
-                probabilities[i]
-            )
+        timestamp = datetime.now().isoformat()
+        results = []
+        for index, (item, predicted_category, item_probabilities) in enumerate(
+            zip(items, predicted_categories, probabilities), start=offset
+        ):
+            result = {
+                "item_id": item.get("id", f"item_{index}"),
+                "predicted_category": predicted_category,
+                "confidence": float(item_probabilities.max()),
+                "probability_distribution": dict(
+                    zip(classes, item_probabilities.tolist())
+                ),
+                "prediction_timestamp": timestamp,
+            }
 
-        result = {
-            "item_id": item.get("id", f"item_{index}"),
-            "predicted_category": predicted_category,
-            "confidence": float(max(probabilities)),
-            "probability_distribution": prob_dist,
-            "prediction_timestamp": datetime.now().isoformat(),
-        }
+            # Add actual category if available
+            actual = item.get("category") or item.get("content_type")
+            if actual:
+                result["actual_category"] = actual
+                result["correct"] = actual == predicted_category
 
-        # Add actual category if available
-        actual = item.get("category") or item.get("content_type")
-        if actual:
-            result["actual_category"] = actual
-            result["correct"] = actual == predicted_category
+            results.append(result)
 
-        return result
+        return results
 
-    def _predict_with_bert(self, item: Dict[str, Any], index: int) -> Dict[str, Any]:
-        """Predict using BERT model."""
-        # Combine title and content for BERT
-        title = item.get("title", "") or ""
-        content = item.get("selftext", "") or item.get("body", "") or ""
-        text = f"{title} {content}".strip()
+    def _predict_arrays(self, X: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Encoded predictions and class probabilities for a feature matrix."""
+        if self._ort_session is not None:
+            predictions, probabilities = self._ort_session.run(
+                ["label", "probabilities"], {"X": X.astype(np.float32, copy=False)}
+            )
+            return predictions, probabilities
+
+        if self._tl_predictor is not None:
+            probabilities = self._tl_predictor.predict(tl2cgen.DMatrix(X))
+            probabilities = probabilities.reshape(len(X), -1)
+            if probabilities.shape[1] == 1:
+                # Binary gradient boosting yields only the positive class
+                probabilities = np.hstack([1 - probabilities, probabilities])
+            return self.model.classes_[probabilities.argmax(axis=1)], probabilities
+
+        # predict() would recompute the probabilities just to argmax them
+        n_jobs = getattr(self.model, "n_jobs", None)
+        if n_jobs is not None and len(X) < PARALLEL_PREDICT_MIN_ROWS:
+            # Thread start-up outweighs the tree walks for small batches
+            self.model.n_jobs = 1
+            try:
+                probabilities = self._sklearn_proba(X)
+            finally:
+                self.model.n_jobs = n_jobs
+        else:
+            probabilities = self._sklearn_proba(X)
+        return self.model.classes_[probabilities.argmax(axis=1)], probabilities
+
+    def _sklearn_proba(self, X: np.ndarray) -> np.ndarray:
+        """Class probabilities from the sklearn model."""
+        if hasattr(self.model, "predict_proba"):
+            return self.model.predict_proba(X)
+
+        # SVC without probability=True: softmax over the one-vs-rest scores
+        scores = self.model.decision_function(X)
+        if scores.ndim == 1:
+            scores = np.column_stack([-scores, scores])
+        scores = np.exp(scores - scores.max(axis=1, keepdims=True))
+        return scores / scores.sum(axis=1, keepdims=True)
+
+    def _predict_with_bert(
+        self, items: List[Dict[str, Any]], offset: int = 0
+    ) -> List[Dict[str, Any]]:
+        """
+        Predict using BERT model.
 
-        if not text:
-            return self._empty_prediction(item, index)
+        All non-empty texts are run through the model ``batch_size`` at a
+        time; see ``_run_bert``.
 
-        # Truncate if too long
-        if len(text) > 500:
-            text = text[:500]
+        Args:
+            items: Items to classify
+            offset: Index of the first item, used for default item ids
 
-        try:
-            # Get BERT prediction
-            bert_result = self.transformer_pipeline(text)[0]
-
-            # Map BERT labels to our categories (this is simplified)
-            label_mapping = {
-                "POSITIVE": "discussion",
-                "NEGATIVE": "discussion",
-                "NEUTRAL": "discussion",
-            }
+        Returns:
+            List of classification results
+        """
+        results = [None] * len(items)
+        texts = []
+        positions = []
+
+        for i, item in enumerate(items):
+            text = self._bert_text(item)
+            if text:
+                texts.append(text)
+                positions.append(i)
+            else:
+                results[i] = self._empty_prediction(item, offset + i)
 
-            predicted_category = label_mapping.get(bert_result["label"], "discussion")
-            confidence = bert_result["score"]
+        bert_results = []
+        if texts:
+            try:
+                bert_results = self._run_bert(texts)
+            except Exception as e:
+                logger.warning(f"BERT prediction failed: {e}")
 
-            result = {
-                "item_id": item.get("id", f"item_{index}"),
-                "predicted_category": predicted_category,
-                "confidence": float(confidence),
-                "bert_label": bert_result["label"],
-                "bert_score": float(bert_result["score"]),
-                "prediction_timestamp": datetime.now().isoformat(),
+        # Map BERT labels to our categories (this is simplified)
+        label_mapping = {
+            "POSITIVE": "discussion",
+            "NEGATIVE": "discussion",
+            "NEUTRAL": "discussion",
+        }
+
+        timestamp = datetime.now().isoformat()
+        for i, (bert_label, bert_score) in zip(positions, bert_results):
+            results[i] = {
+                "item_id": items[i].get("id", f"item_{offset + i}"),
+                "predicted_category": label_mapping.get(bert_label, "discussion"),
+                "confidence": bert_score,
+                "bert_label": bert_label,
+                "bert_score": bert_score,
+                "prediction_timestamp": timestamp,
             }
 
-            return result
+        # Anything left unset failed inside the model call
+        return [
+            result if result is not None else self._empty_prediction(item, offset + i)
+            for i, (item, result) in enumerate(zip(items, results))
+        ]
+
+    def _run_bert(self, texts: List[str]) -> List[Tuple[str, float]]:
+        """
+        Classify texts with the BERT model.
 
-        except Exception as e:
-            logger.warning(f"BERT prediction failed: {e}")
-            return self._empty_prediction(item, index)
+        Texts are ordered by length before batching so each padded batch
+        holds similarly sized inputs, and each batch is tokenized straight
+        into tensors on the model's device.
+
+        Args:
+            texts: Non-empty texts to classify
+
+        Returns:
+            (label, score) for each text, in input order
+        """
+        id2label = self.bert_model.config.id2label
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+        results = [None] * len(texts)
+
+        with torch.inference_mode():
+            for start in range(0, len(order), self.batch_size):
+                batch = order[start : start + self.batch_size]
+                inputs = self.bert_tokenizer(
+                    [texts[i] for i in batch],
+                    padding=True,
+                    truncation=True,
+                    max_length=512,
+                    return_tensors="pt",
+                ).to(self.device)
+
+                logits = self.bert_model(**inputs).logits
+                scores, labels = logits.float().softmax(dim=-1).max(dim=-1)
+
+                for i, label, score in zip(batch, labels.tolist(), scores.tolist()):
+                    results[i] = (id2label[label], score)
+
+        return results
+
+    def _bert_text(self, item: Dict[str, Any]) -> str:
+        """Combined title and content for BERT, truncated to 500 characters."""
+        title = item.get("title", "") or ""
+        content = item.get("selftext", "") or item.get("body", "") or ""
+        return f"{title} {content}".strip()[:500]
 
     def _calculate_metrics(
         self, y_true: np.ndarray, y_pred: np.ndarray
@@ -820,12 +1174,12 @@ class ContentClassifier:
 
         y_pred = self.model.predict(X)
 
-        target_names = [
-            self.label_encoder.inverse_transform([i])[0]
-            for i in range(len(self.categories))
-        ]
-
-        return classification_report(y_true_encoded, y_pred, target_names=target_names)
+        return classification_report(
+            y_true_encoded,
+            y_pred,
+            labels=range(len(self._classes)),
+            target_names=list(self._classes),
+        )
 
     def save_model(self, filepath: str):
         """Save the trained model to file."""
@@ -845,7 +1199,16 @@ class ContentClassifier:
                 "validation_metrics": self.validation_metrics,
             }
 
-            joblib.dump(model_data, filepath)
+            # joblib.load detects the codec itself; protocol 5 pickles the
+            # NumPy arrays without extra copies
+            joblib.dump(
+                model_data,
+                filepath,
+                compress=("lz4", 3) if LZ4_AVAILABLE else ("zlib", 3),
+                protocol=5,
+            )
+            self._save_onnx(self._onnx_path(filepath))
+            self._save_forest(self._forest_lib_path(filepath))
             logger.info(f"Model saved to {filepath}")
 
         except Exception as e:
@@ -859,6 +1222,7 @@ class ContentClassifier:
             self.model = model_data["model"]
             self.scaler = model_data["scaler"]
             self.label_encoder = model_data["label_encoder"]
+            self._classes = tuple(self.label_encoder.classes_.tolist())
             self.model_type = model_data["model_type"]
             self.categories = model_data["categories"]
             self.feature_names = model_data["feature_names"]
@@ -866,7 +1230,117 @@ class ContentClassifier:
             self.validation_metrics = model_data["validation_metrics"]
 
             self.is_fitted = True
+            self._ort_session = self._load_onnx(self._onnx_path(filepath))
+            self._tl_predictor = (
+                None
+                if self._ort_session is not None
+                else self._load_forest(self._forest_lib_path(filepath))
+            )
             logger.info(f"Model loaded from {filepath}")
 
         except Exception as e:
             logger.error(f"Failed to load model: {e}")
+
+    @staticmethod
+    def _onnx_path(filepath: str) -> Path:
+        """Path of the ONNX copy of the model saved alongside filepath."""
+        return Path(filepath).with_suffix(".onnx")
+
+    def _save_onnx(self, onnx_path: Path):
+        """Export a tree-ensemble model to ONNX and switch predict over to it."""
+        # Never leave an export from an earlier model next to this one
+        onnx_path.unlink(missing_ok=True)
+        self._ort_session = None
+
+        if not ONNX_AVAILABLE or self.model_type not in _TREE_MODEL_TYPES:
+            return
+
+        try:
+            onnx_model = convert_sklearn(
+                self.model,
+                initial_types=[
+                    ("X", FloatTensorType([None, self.model.n_features_in_]))
+                ],
+                # Plain probability matrix instead of a list of dicts
+                options={id(self.model): {"zipmap": False}},
+            )
+            onnx_bytes = onnx_model.SerializeToString()
+            onnx_path.write_bytes(onnx_bytes)
+            self._ort_session = onnxruntime.InferenceSession(
+                onnx_bytes, providers=["CPUExecutionProvider"]
+            )
+            logger.info(f"ONNX model saved to {onnx_path}")
+        except Exception as e:
+            logger.warning(f"ONNX export failed, predicting with sklearn: {e}")
+
+    def _load_onnx(self, onnx_path: Path):
+        """Open an ONNX Runtime session for onnx_path if it can be used."""
+        if (
+            not ONNX_AVAILABLE
+            or self.model_type not in _TREE_MODEL_TYPES
+            or not onnx_path.exists()
+        ):
+            return None
+
+        try:
+            return onnxruntime.InferenceSession(
+                str(onnx_path), providers=["CPUExecutionProvider"]
+            )
+        except Exception as e:
+            logger.warning(f"Failed to load ONNX model, predicting with sklearn: {e}")
+            return None
+
+    @staticmethod
+    def _forest_lib_path(filepath: str) -> Path:
+        """Path of the compiled tree-ensemble library saved alongside filepath."""
+        return Path(filepath).with_suffix(".so")
+
+    def _save_forest(self, lib_path: Path):
+        """Write the library compiled at fit time next to the saved model."""
+        # Never leave a library from an earlier model next to this one
+        lib_path.unlink(missing_ok=True)
+        if self._ort_session is not None or self._tl_lib is None:
+            return
+
+        lib_path.write_bytes(self._tl_lib)
+        logger.info(f"Compiled model saved to {lib_path}")
+
+    def _load_forest(self, lib_path: Path):
+        """Load the library saved by save_model, compiling only if it is missing."""
+        if not TREELITE_AVAILABLE or self.model_type not in _TREE_MODEL_TYPES:
+            return None
+
+        if lib_path.exists():
+            try:
+                predictor = tl2cgen.Predictor(str(lib_path))
+                self._tl_lib = lib_path.read_bytes()
+                return predictor
+            except Exception as e:
+                logger.warning(f"Failed to load compiled model, recompiling: {e}")
+        return self._compile_forest()
+
+    def _compile_forest(self):
+        """Compile a fitted tree ensemble to a native predictor with treelite."""
+        self._tl_lib = None
+        if not TREELITE_AVAILABLE or self.model_type not in _TREE_MODEL_TYPES:
+            return None
+
+        try:
+            tl_model = treelite.sklearn.import_model(self.model)
+            # The loaded predictor keeps the library mapped, so the file is
+            # only needed until then; save_model writes out the kept bytes
+            with tempfile.TemporaryDirectory(prefix="content_clf_") as tmpdir:
+                libpath = Path(tmpdir) / "forest.so"
+                tl2cgen.export_lib(
+                    tl_model,
+                    toolchain="gcc",
+                    libpath=str(libpath),
+                    params={"parallel_comp": 32},
+                )
+                predictor = tl2cgen.Predictor(str(libpath))
+                self._tl_lib = libpath.read_bytes()
+            logger.info(f"Compiled {self.model_type} model with treelite")
+            return predictor
+        except Exception as e:
+            logger.warning(f"Treelite compilation failed, predicting with sklearn: {e}")
+            return None
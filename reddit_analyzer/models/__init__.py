@@ -1,7 +1,7 @@
 """Data models package."""
 
 from reddit_analyzer.database import Base
-from reddit_analyzer.models.base import BaseModel, TimestampMixin
+from reddit_analyzer.models.base import BaseModel, DescribeMixin, TimestampMixin
 from reddit_analyzer.models.user import User, UserRole
 from reddit_analyzer.models.subreddit import Subreddit
 from reddit_analyzer.models.post import Post
@@ -24,10 +24,20 @@ from reddit_analyzer.models.political_analysis import (
     PoliticalDimensionsAnalysis,
     SubredditPoliticalDimensions,
 )
+from reddit_analyzer.models.advanced_topic import (
+    AdvancedTopic,
+    TopicEvolution,
+    ArgumentStructure,
+)
+
+# Registers the commit hooks that invalidate cached User/Subreddit rows, so
+# every process writing these models keeps the cache consistent
+import reddit_analyzer.core.entity_cache  # noqa: E402,F401
 
 __all__ = [
     "Base",
     "BaseModel",
+    "DescribeMixin",
     "TimestampMixin",
     "User",
     "UserRole",
@@ -48,4 +58,7 @@ __all__ = [
     "CommunityOverlap",
     "PoliticalDimensionsAnalysis",
     "SubredditPoliticalDimensions",
+    "AdvancedTopic",
+    "TopicEvolution",
+    "ArgumentStructure",
 ]
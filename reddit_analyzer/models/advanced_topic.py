@@ -5,14 +5,27 @@ This module defines database models for storing results from
 advanced topic modeling techniques like BERTopic and neural models.
 """
 
-from sqlalchemy import Column, Integer, String, Float, DateTime, JSON, ForeignKey
-from sqlalchemy.orm import relationship
-from datetime import datetime
+import math
+from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, select
+from sqlalchemy.orm import aliased, deferred, relationship, undefer
+from typing import List, Optional, Sequence
 
 from reddit_analyzer.database import Base
+from reddit_analyzer.models.base import (
+    JSONB,
+    DescribeMixin,
+    brin_index,
+    gin_index,
+    hnsw_index,
+    vector_type,
+    utcnow,
+)
 
+# Output size of all-MiniLM-L6-v2, the default topic embedding model
+EMBEDDING_DIM = 384
 
-class AdvancedTopic(Base):
+
+class AdvancedTopic(Base, DescribeMixin):
     """
     Model for storing advanced topic modeling results.
 
@@ -21,6 +34,11 @@ class AdvancedTopic(Base):
     """
 
     __tablename__ = "advanced_topics"
+    __table_args__ = (
+        gin_index("ix_advanced_topics_top_words_gin", "top_words"),
+        hnsw_index("ix_advanced_topics_embedding_hnsw", "embedding"),
+        brin_index("ix_advanced_topics_created_at_brin", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
 
@@ -34,9 +52,12 @@ class AdvancedTopic(Base):
     model_version = Column(String(50), nullable=True)
 
     # Topic content
-    top_words = Column(JSON, nullable=False)  # List of top words with scores
-    representative_docs = Column(JSON, nullable=True)  # Sample documents
-    embedding = Column(JSON, nullable=True)  # Topic embedding vector
+    top_words = Column(JSONB, nullable=False)  # List of top words with scores
+    # Deferred: loaded on access, or with options(undefer(...)) when needed
+    representative_docs = deferred(Column(JSONB, nullable=True))  # Sample documents
+    embedding = deferred(
+        Column(vector_type(EMBEDDING_DIM), nullable=True)
+    )  # Topic embedding vector
 
     # Topic statistics
     document_count = Column(Integer, nullable=False)
@@ -52,17 +73,88 @@ class AdvancedTopic(Base):
     time_period_end = Column(DateTime, nullable=True)
 
     # Processing metadata
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=utcnow(), nullable=False)
 
     # Relationships
     subreddit = relationship("Subreddit", back_populates="advanced_topics")
-    topic_evolution = relationship("TopicEvolution", back_populates="topic")
+    # JSON-heavy; load explicitly with selectinload(AdvancedTopic.topic_evolution)
+    topic_evolution = relationship(
+        "TopicEvolution", back_populates="topic", lazy="raise_on_sql"
+    )
 
     def __repr__(self):
-        return f"<AdvancedTopic(id={self.id}, label={self.topic_label}, docs={self.document_count})>"
-
-
-class TopicEvolution(Base):
+        return f"<AdvancedTopic(id={self.id})>"
+
+    @classmethod
+    def find_similar(
+        cls,
+        session,
+        query_vector: Sequence[float],
+        k: int = 5,
+        subreddit_name: Optional[str] = None,
+    ) -> List["AdvancedTopic"]:
+        """
+        Find the ``k`` topics whose embeddings are closest to ``query_vector``.
+
+        On PostgreSQL an unfiltered search is served by the
+        HNSW index, so only about ``k`` rows are visited. The index cannot
+        apply a filter itself: it would return ``hnsw.ef_search`` candidates
+        and the subreddit filter would then drop most of them. With
+        ``subreddit_name`` the subreddit's topics are therefore ranked exactly
+        instead. Elsewhere the candidate embeddings are fetched and ranked in
+        Python.
+
+        Args:
+            session: SQLAlchemy session
+            query_vector: Embedding of length ``EMBEDDING_DIM``
+            k: Number of topics to return
+            subreddit_name: Only consider topics from this subreddit
+
+        Returns:
+            Topics ordered from most to least similar
+        """
+        if session.get_bind().dialect.name == "postgresql":
+            entity = cls
+            if subreddit_name:
+                # A materialized CTE keeps the planner from ordering through
+                # the HNSW index and filtering afterwards, which can return
+                # fewer than k rows
+                candidates = (
+                    select(cls.__table__)
+                    .where(cls.subreddit_name == subreddit_name)
+                    .cte("candidates")
+                    .prefix_with("MATERIALIZED")
+                )
+                entity = aliased(cls, candidates)
+            # pgvector's cosine distance operator, matching vector_cosine_ops
+            distance = entity.embedding.op("<=>", return_type=Float)(query_vector)
+            query = (
+                select(entity)
+                .where(entity.embedding.isnot(None))
+                .order_by(distance)
+                .limit(k)
+            )
+            return list(session.scalars(query))
+
+        query = select(cls).where(cls.embedding.isnot(None))
+        if subreddit_name:
+            query = query.where(cls.subreddit_name == subreddit_name)
+
+        # A JSON column stores None as JSON null, which IS NOT NULL lets through
+        query = query.options(undefer(cls.embedding))
+        topics = [t for t in session.scalars(query) if t.embedding]
+        topics.sort(key=lambda t: _cosine_distance(t.embedding, query_vector))
+        return topics[:k]
+
+
+def _cosine_distance(a: Sequence[float], b: Sequence[float]) -> float:
+    """Cosine distance as pgvector's ``<=>`` computes it."""
+    dot = sum(x * y for x, y in zip(a, b))
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    return 1.0 - dot / norm if norm else 1.0
+
+
+class TopicEvolution(Base, DescribeMixin):
     """
     Model for tracking topic evolution over time.
 
@@ -85,24 +177,24 @@ class TopicEvolution(Base):
     relative_frequency = Column(Float, nullable=False)  # Proportion of docs
 
     # Topic changes
-    word_changes = Column(JSON, nullable=True)  # Words added/removed
+    word_changes = Column(JSONB, nullable=True)  # Words added/removed
     sentiment_shift = Column(Float, nullable=True)  # Change in sentiment
 
     # Related topics
-    merged_with = Column(JSON, nullable=True)  # Topics merged into this
-    split_into = Column(JSON, nullable=True)  # Topics split from this
+    merged_with = Column(JSONB, nullable=True)  # Topics merged into this
+    split_into = Column(JSONB, nullable=True)  # Topics split from this
 
     # Metadata
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=utcnow(), nullable=False)
 
     # Relationships
     topic = relationship("AdvancedTopic", back_populates="topic_evolution")
 
     def __repr__(self):
-        return f"<TopicEvolution(id={self.id}, topic={self.topic_id}, time={self.timestamp})>"
+        return f"<TopicEvolution(id={self.id}, topic_id={self.topic_id})>"
 
 
-class ArgumentStructure(Base):
+class ArgumentStructure(Base, DescribeMixin):
     """
     Model for storing argument mining results.
 
@@ -119,8 +211,8 @@ class ArgumentStructure(Base):
     comment_id = Column(String(255), ForeignKey("comments.id"), nullable=True)
 
     # Argument components
-    components = Column(JSON, nullable=False)  # List of argument components
-    relationships = Column(JSON, nullable=True)  # Relations between components
+    components = Column(JSONB, nullable=False)  # List of argument components
+    relationships = Column(JSONB, nullable=True)  # Relations between components
 
     # Quality metrics
     overall_quality = Column(Float, nullable=True)
@@ -130,16 +222,21 @@ class ArgumentStructure(Base):
     clarity_score = Column(Float, nullable=True)
 
     # Argument summary
-    main_claims = Column(JSON, nullable=True)  # Primary claims
-    conclusions = Column(JSON, nullable=True)  # Conclusions reached
-    fallacies_detected = Column(JSON, nullable=True)  # Logical fallacies
+    main_claims = Column(JSONB, nullable=True)  # Primary claims
+    conclusions = Column(JSONB, nullable=True)  # Conclusions reached
+    fallacies_detected = Column(JSONB, nullable=True)  # Logical fallacies
 
     # Metadata
-    processed_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    processed_at = Column(DateTime, server_default=utcnow(), nullable=False)
 
     # Relationships
-    post = relationship("Post", backref="argument_structures")
-    comment = relationship("Comment", backref="argument_structures")
+    # Load explicitly (selectinload/joinedload) rather than one SELECT per row
+    post = relationship(
+        "Post", back_populates="argument_structures", lazy="raise_on_sql"
+    )
+    comment = relationship(
+        "Comment", back_populates="argument_structures", lazy="raise_on_sql"
+    )
 
     def __repr__(self):
-        return f"<ArgumentStructure(id={self.id}, quality={self.overall_quality})>"
+        return f"<ArgumentStructure(id={self.id})>"
@@ -1,19 +1,183 @@
 """Base model classes."""
 
-from datetime import datetime
-from sqlalchemy import Column, Integer, DateTime
+from pgvector.sqlalchemy import Vector
+from sqlalchemy import JSON, Column, Integer, DateTime, Index, inspect, text
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
+from sqlalchemy.types import TypeDecorator
+from sqlalchemy.orm.base import NO_VALUE
+from sqlalchemy.dialects import postgresql, sqlite
+
+# Plain JSON on SQLite (tests, local runs); binary JSONB on PostgreSQL so
+# containment/key lookups can use GIN indexes instead of sequential scans.
+JSONB = JSON().with_variant(postgresql.JSONB(), "postgresql")
+
+# Decimal places kept for scores, weights and probabilities stored as JSON
+SCORE_DECIMALS = 3
+
+
+def round_floats(value, ndigits: int = SCORE_DECIMALS):
+    """Round every float nested in dicts/lists/tuples to ``ndigits`` places."""
+    if isinstance(value, float):
+        return round(value, ndigits)
+    if isinstance(value, dict):
+        return {k: round_floats(v, ndigits) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [round_floats(v, ndigits) for v in value]
+    return value
+
+
+class ScoreJSONB(TypeDecorator):
+    """``JSONB`` for score maps/lists, with floats rounded before storage.
+
+    Model scores carry 15-17 significant digits, each serialized as 20-odd
+    characters of JSON text; three decimals is finer than the models' own
+    precision and roughly halves the stored size. Structure is unchanged,
+    so GIN indexes and key lookups keep working.
+    """
+
+    impl = JSON
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(postgresql.JSONB())
+        return dialect.type_descriptor(JSON())
+
+    def process_bind_param(self, value, dialect):
+        return round_floats(value)
+
+
+class utcnow(FunctionElement):
+    """Current UTC time as a naive timestamp, evaluated by the database.
+
+    Used as ``server_default``/``onupdate`` so inserts and bulk inserts leave
+    timestamp columns out instead of calling Python once per row. Values stay
+    naive UTC, matching the ``datetime.utcnow()`` comparisons in read paths.
+    """
+
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(utcnow, "postgresql")
+def _utcnow_postgresql(element, compiler, **kw):
+    # now() follows the session time zone; timestamp columns get UTC wall time
+    return "timezone('utc', now())"
+
+
+@compiles(utcnow)
+def _utcnow_default(element, compiler, **kw):
+    # SQLite's CURRENT_TIMESTAMP is already UTC
+    return "CURRENT_TIMESTAMP"
+
+
+def gin_index(name: str, column: str, path_ops: bool = True) -> Index:
+    """PostgreSQL-only GIN index on a JSONB column.
+
+    ``jsonb_path_ops`` is smaller and faster but only serves ``@>``
+    containment; pass ``path_ops=False`` for columns queried by key
+    existence (``?``, ``?|``, ``?&``).
+    """
+    ops = {column: "jsonb_path_ops"} if path_ops else {}
+    return Index(name, column, postgresql_using="gin", postgresql_ops=ops).ddl_if(
+        dialect="postgresql"
+    )
+
+
+def brin_index(name: str, column: str, pages_per_range: int = 32) -> Index:
+    """BRIN index on a timestamp that only grows with insert order.
+
+    On PostgreSQL it stores one min/max summary per ``pages_per_range`` heap
+    pages, a tiny fraction of a btree's size, and still serves range scans.
+    Other dialects ignore the ``postgresql_*`` options and build a btree.
+    """
+    return Index(
+        name,
+        column,
+        postgresql_using="brin",
+        postgresql_with={"pages_per_range": pages_per_range},
+    )
+
+
+def not_null_index(name: str, column: str) -> Index:
+    """Partial index over the rows where a mostly-NULL ``column`` is set.
+
+    NULL rows are never looked up by equality, so leaving them out keeps the
+    index small; ``column = :value`` lookups and joins still use it.
+    """
+    where = text(f"{column} IS NOT NULL")
+    return Index(name, column, postgresql_where=where, sqlite_where=where)
+
+
+def dialect_insert(connection):
+    """``insert()`` with ``on_conflict_do_update`` for the connection's dialect.
+
+    Accepts a Connection or Session; PostgreSQL and SQLite share the
+    ``ON CONFLICT`` upsert syntax.
+    """
+    dialect = getattr(connection, "dialect", None) or connection.get_bind().dialect
+    return postgresql.insert if dialect.name == "postgresql" else sqlite.insert
+
+
+def vector_type(dim: int):
+    """Column type for fixed-size embedding vectors.
+
+    Packed ``vector(dim)`` on PostgreSQL, so distances can be computed and
+    indexed server-side; a JSON list elsewhere. The PostgreSQL type must not
+    depend on the environment, since the schema is created from it.
+    """
+    return JSON().with_variant(Vector(dim), "postgresql")
+
+
+# HNSW build parameters: graph degree and candidate list size while building
+HNSW_BUILD_PARAMS = {"m": 16, "ef_construction": 64}
+
+
+def hnsw_index(name: str, column: str) -> Index:
+    """PostgreSQL-only HNSW cosine-distance index on a ``vector_type`` column."""
+    return Index(
+        name,
+        column,
+        postgresql_using="hnsw",
+        postgresql_ops={column: "vector_cosine_ops"},
+        postgresql_with=HNSW_BUILD_PARAMS,
+    ).ddl_if(dialect="postgresql")
+
+
+class DescribeMixin:
+    """Debug description built only from already-loaded attributes.
+
+    ``__repr__`` stays limited to key columns; ``describe()`` adds every other
+    column value the instance already holds, reading them through
+    ``loaded_value`` so it never emits SQL or lazy-loads anything.
+    """
+
+    def describe(self) -> str:
+        """Return every loaded column value; unloaded ones are left out."""
+        attrs = inspect(self).attrs
+        values = []
+        for key in self.__mapper__.column_attrs.keys():
+            value = attrs[key].loaded_value
+            if value is not NO_VALUE:
+                values.append(f"{key}={value!r}")
+        return f"<{self.__class__.__name__}({', '.join(values)})>"
 
 
 class TimestampMixin:
     """Mixin to add created_at and updated_at timestamps."""
 
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    # Fetch the server-side updated_at with RETURNING instead of expiring it,
+    # so instances stay readable once detached after commit
+    __mapper_args__ = {"eager_defaults": True}
+
+    created_at = Column(DateTime, server_default=utcnow(), nullable=False)
     updated_at = Column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+        DateTime, server_default=utcnow(), onupdate=utcnow(), nullable=False
     )
 
 
-class BaseModel(TimestampMixin):
+class BaseModel(TimestampMixin, DescribeMixin):
     """Base model class with common functionality."""
 
     __abstract__ = True
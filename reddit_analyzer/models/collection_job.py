@@ -1,27 +1,75 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text, Boolean, Float, JSON
+import re
+from datetime import date, datetime, time, timedelta
+from typing import List
+
+from sqlalchemy import (
+    Column,
+    Integer,
+    String,
+    DateTime,
+    Text,
+    Boolean,
+    Float,
+    Index,
+    case,
+    cast,
+    literal,
+    null,
+    select,
+    text,
+    union_all,
+)
 from sqlalchemy.sql import func
 from reddit_analyzer.database import Base
+from reddit_analyzer.models.base import (
+    JSONB,
+    DescribeMixin,
+    brin_index,
+    dialect_insert,
+    gin_index,
+    utcnow,
+)
 
 
-class CollectionJob(Base):
+class CollectionJob(Base, DescribeMixin):
     __tablename__ = "collection_jobs"
+    __table_args__ = (
+        gin_index("ix_collection_jobs_config_gin", "config"),
+        # Monitoring filters; the INCLUDEd counters let Postgres answer
+        # dashboard totals with index-only scans.
+        Index(
+            "ix_collection_jobs_status_type_created",
+            "status",
+            "job_type",
+            "created_at",
+            postgresql_include=["items_collected", "items_stored"],
+        ),
+        Index(
+            "ix_collection_jobs_subreddit_status_started",
+            "subreddit_name",
+            "status",
+            "started_at",
+        ),
+    )
+    # updated_at is set by the server; fetch it rather than expire it
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
     job_type = Column(String(50), nullable=False, index=True)
-    subreddit_name = Column(String(255), index=True)
-    status = Column(String(20), default="pending", index=True)
+    subreddit_name = Column(String(255))
+    status = Column(String(20), default="pending")
     started_at = Column(DateTime)
     completed_at = Column(DateTime)
     items_collected = Column(Integer, default=0)
     items_stored = Column(Integer, default=0)
     error_message = Column(Text)
-    config = Column(JSON)
+    config = Column(JSONB)
     task_id = Column(String(255), unique=True, index=True)
     worker_name = Column(String(100))
     retry_count = Column(Integer, default=0)
     priority = Column(Integer, default=5)
-    created_at = Column(DateTime, default=func.now())
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+    created_at = Column(DateTime, server_default=utcnow())
+    updated_at = Column(DateTime, server_default=utcnow(), onupdate=utcnow())
 
     def __repr__(self):
         return (
@@ -29,13 +77,23 @@ class CollectionJob(Base):
         )
 
 
-class APIRequest(Base):
+class APIRequest(Base, DescribeMixin):
     __tablename__ = "api_requests"
+    __table_args__ = (
+        Index(
+            "ix_api_requests_endpoint_created",
+            "endpoint",
+            "created_at",
+            postgresql_include=["response_time_ms"],
+        ),
+        Index("ix_api_requests_status_code_created", "status_code", "created_at"),
+        brin_index("ix_api_requests_created_at_brin", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    endpoint = Column(String(255), nullable=False, index=True)
+    endpoint = Column(String(255), nullable=False)
     method = Column(String(10), nullable=False)
-    status_code = Column(Integer, index=True)
+    status_code = Column(Integer)
     response_time_ms = Column(Integer)
     request_size_bytes = Column(Integer)
     response_size_bytes = Column(Integer)
@@ -45,14 +103,18 @@ class APIRequest(Base):
     cached_response = Column(Boolean, default=False)
     worker_name = Column(String(100))
     task_id = Column(String(255), index=True)
-    created_at = Column(DateTime, default=func.now(), index=True)
+    created_at = Column(DateTime, server_default=utcnow())
 
     def __repr__(self):
         return f"<APIRequest(id={self.id}, endpoint={self.endpoint}, status={self.status_code})>"
 
 
-class DataQualityMetric(Base):
+class DataQualityMetric(Base, DescribeMixin):
     __tablename__ = "data_quality_metrics"
+    __table_args__ = (
+        gin_index("ix_data_quality_metrics_tags_gin", "tags"),
+        brin_index("ix_data_quality_metrics_calculated_at_brin", "calculated_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     metric_name = Column(String(100), nullable=False, index=True)
@@ -60,20 +122,22 @@ class DataQualityMetric(Base):
     metric_type = Column(String(50), default="gauge")  # gauge, counter, histogram
     subreddit_name = Column(String(255), index=True)
     collection_job_id = Column(Integer, index=True)
-    tags = Column(JSON)  # Additional metadata tags
+    tags = Column(JSONB)  # Additional metadata tags
     description = Column(Text)
     threshold_warning = Column(Float)
     threshold_critical = Column(Float)
-    calculated_at = Column(DateTime, default=func.now(), index=True)
+    calculated_at = Column(DateTime, server_default=utcnow())
 
     def __repr__(self):
-        return (
-            f"<DataQualityMetric(name={self.metric_name}, value={self.metric_value})>"
-        )
+        return f"<DataQualityMetric(id={self.id})>"
 
 
-class SystemMetric(Base):
+class SystemMetric(Base, DescribeMixin):
     __tablename__ = "system_metrics"
+    __table_args__ = (
+        gin_index("ix_system_metrics_tags_gin", "tags"),
+        brin_index("ix_system_metrics_created_at_brin", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     metric_name = Column(String(100), nullable=False, index=True)
@@ -81,31 +145,231 @@ class SystemMetric(Base):
     metric_type = Column(String(50), default="gauge")
     component = Column(String(100), index=True)  # reddit_client, cache, database, etc.
     worker_name = Column(String(100), index=True)
-    tags = Column(JSON)
-    created_at = Column(DateTime, default=func.now(), index=True)
+    tags = Column(JSONB)
+    created_at = Column(DateTime, server_default=utcnow())
 
     def __repr__(self):
-        return f"<SystemMetric(name={self.metric_name}, component={self.component})>"
+        return f"<SystemMetric(id={self.id})>"
 
 
-class CollectionSummary(Base):
+class CollectionSummary(Base, DescribeMixin):
     __tablename__ = "collection_summaries"
+    __table_args__ = (
+        # Conflict target of the daily rollup upsert
+        Index(
+            "ix_collection_summaries_date_subreddit",
+            "date",
+            "subreddit_name",
+            unique=True,
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    date = Column(DateTime, nullable=False, index=True)
+    date = Column(DateTime, nullable=False)
     subreddit_name = Column(String(255), index=True)
     total_posts_collected = Column(Integer, default=0)
     total_comments_collected = Column(Integer, default=0)
     total_users_collected = Column(Integer, default=0)
     successful_jobs = Column(Integer, default=0)
     failed_jobs = Column(Integer, default=0)
+    # Median rather than mean on PostgreSQL, see rollup_collection_summary
     average_response_time_ms = Column(Float)
     total_api_requests = Column(Integer, default=0)
     rate_limited_requests = Column(Integer, default=0)
     cached_requests = Column(Integer, default=0)
     data_quality_score = Column(Float)
     collection_efficiency = Column(Float)  # ratio of successful to total attempts
-    created_at = Column(DateTime, default=func.now())
+    created_at = Column(DateTime, server_default=utcnow())
 
     def __repr__(self):
-        return f"<CollectionSummary(date={self.date}, subreddit={self.subreddit_name})>"
+        return f"<CollectionSummary(id={self.id})>"
+
+
+# Append-only time series that migration f3b9d6c2e8a5 turns into monthly RANGE
+# partitions on created_at (PostgreSQL only). Old data is removed by dropping
+# whole partitions instead of DELETE, which would leave bloat behind.
+PARTITIONED_METRIC_TABLES = ("api_requests", "system_metrics")
+
+_PARTITION_SUFFIX_RE = re.compile(r"_(\d{4})_(\d{2})$")
+
+
+def _month_start(day: date, offset: int = 0) -> date:
+    """First day of the month ``offset`` months after ``day``'s month."""
+    month = day.month - 1 + offset
+    return date(day.year + month // 12, month % 12 + 1, 1)
+
+
+def _is_postgresql(connection) -> bool:
+    """Whether a Connection or Session talks to PostgreSQL."""
+    dialect = getattr(connection, "dialect", None) or connection.get_bind().dialect
+    return dialect.name == "postgresql"
+
+
+def ensure_metric_partitions(connection, months_ahead: int = 2) -> List[str]:
+    """
+    Create the monthly metric partitions from this month to ``months_ahead``.
+
+    Args:
+        connection: SQLAlchemy connection or session
+        months_ahead: Number of future months to create partitions for
+
+    Returns:
+        Names of the partitions that now exist for that range; empty when the
+        database is not PostgreSQL
+    """
+    if not _is_postgresql(connection):
+        return []
+
+    today = datetime.utcnow().date()
+    partitions = []
+    for table in PARTITIONED_METRIC_TABLES:
+        for offset in range(months_ahead + 1):
+            start = _month_start(today, offset)
+            end = _month_start(today, offset + 1)
+            name = f"{table}_{start:%Y_%m}"
+            connection.execute(
+                text(
+                    f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {table} "
+                    f"FOR VALUES FROM ('{start}') TO ('{end}')"
+                )
+            )
+            partitions.append(name)
+    return partitions
+
+
+def drop_metric_partitions_before(connection, cutoff: datetime) -> List[str]:
+    """
+    Drop monthly metric partitions that end on or before ``cutoff``.
+
+    Args:
+        connection: SQLAlchemy connection or session
+        cutoff: Rows older than this may be discarded
+
+    Returns:
+        Names of the dropped partitions; empty when the database is not
+        PostgreSQL
+    """
+    if not _is_postgresql(connection):
+        return []
+
+    dropped = []
+    for table in PARTITIONED_METRIC_TABLES:
+        names = connection.execute(
+            text(
+                "SELECT child.relname FROM pg_inherits "
+                "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+                "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+                "WHERE parent.relname = :table"
+            ),
+            {"table": table},
+        ).scalars()
+        for name in names:
+            match = _PARTITION_SUFFIX_RE.search(name)
+            if not match:
+                continue  # e.g. the DEFAULT partition
+            start = date(int(match.group(1)), int(match.group(2)), 1)
+            if _month_start(start, 1) <= cutoff.date():
+                connection.execute(text(f"DROP TABLE IF EXISTS {name}"))
+                dropped.append(name)
+    return dropped
+
+
+# Summary row for API requests that no collection job can be attributed to.
+# Kept non-NULL so the (date, subreddit_name) unique index can match it.
+UNATTRIBUTED_SUBREDDIT = ""
+
+# Job type whose items_collected feeds each CollectionSummary total
+_COLLECTED_TOTALS = {
+    "total_posts_collected": "collect_subreddit_posts",
+    "total_comments_collected": "collect_post_comments",
+    "total_users_collected": "collect_user_data",
+}
+
+
+def rollup_collection_summary(connection, day: date) -> None:
+    """
+    Compute the ``CollectionSummary`` rows for one day in a single statement.
+
+    Jobs and API requests created that day are aggregated by the database in
+    one ``INSERT ... SELECT ... GROUP BY`` and upserted on
+    ``(date, subreddit_name)``, so rerunning a day replaces its rows. API
+    requests are attributed to a subreddit through their job's ``task_id``.
+
+    Args:
+        connection: SQLAlchemy connection or session
+        day: Day to summarize
+    """
+    start = datetime.combine(day, time.min)
+    end = start + timedelta(days=1)
+    job, request = CollectionJob.__table__, APIRequest.__table__
+    subreddit = func.coalesce(job.c.subreddit_name, UNATTRIBUTED_SUBREDDIT)
+
+    def flag(condition):
+        return case((condition, 1), else_=0)
+
+    # One row per job and per request, so all totals come from one GROUP BY
+    rows = union_all(
+        select(
+            subreddit.label("subreddit_name"),
+            job.c.job_type,
+            job.c.status,
+            job.c.items_collected.label("items"),
+            cast(null(), Integer).label("response_time_ms"),
+            literal(0).label("is_request"),
+            literal(0).label("rate_limited"),
+            literal(0).label("cached"),
+        ).where(job.c.created_at >= start, job.c.created_at < end),
+        select(
+            subreddit,
+            cast(null(), String),
+            cast(null(), String),
+            literal(0),
+            request.c.response_time_ms,
+            literal(1),
+            flag(request.c.rate_limited.is_(True)),
+            flag(request.c.cached_response.is_(True)),
+        )
+        .select_from(request.outerjoin(job, job.c.task_id == request.c.task_id))
+        .where(request.c.created_at >= start, request.c.created_at < end),
+    ).subquery()
+
+    successful = func.sum(flag(rows.c.status == "completed"))
+    failed = func.sum(flag(rows.c.status == "failed"))
+    if _is_postgresql(connection):
+        # Median; a few slow or timed-out requests skew the mean
+        response_time = func.percentile_cont(0.5).within_group(rows.c.response_time_ms)
+    else:
+        response_time = func.avg(rows.c.response_time_ms)
+
+    values = {
+        "date": literal(start, DateTime),
+        "subreddit_name": rows.c.subreddit_name,
+        **{
+            column: func.sum(
+                case((rows.c.job_type == job_type, rows.c["items"]), else_=0)
+            )
+            for column, job_type in _COLLECTED_TOTALS.items()
+        },
+        "successful_jobs": successful,
+        "failed_jobs": failed,
+        "average_response_time_ms": response_time,
+        "total_api_requests": func.sum(rows.c.is_request),
+        "rate_limited_requests": func.sum(rows.c.rate_limited),
+        "cached_requests": func.sum(rows.c.cached),
+        "collection_efficiency": cast(successful, Float)
+        / func.nullif(successful + failed, 0),
+    }
+    summary = select(*values.values()).group_by(rows.c.subreddit_name)
+
+    stmt = dialect_insert(connection)(CollectionSummary).from_select(
+        list(values), summary
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["date", "subreddit_name"],
+        set_={
+            column: stmt.excluded[column]
+            for column in values
+            if column not in ("date", "subreddit_name")
+        },
+    )
+    connection.execute(stmt)
@@ -1,31 +1,86 @@
 """Comment model."""
 
-from sqlalchemy import Column, String, Integer, Boolean, Text, DateTime, ForeignKey
+from typing import List
+
+from sqlalchemy import (
+    Column,
+    String,
+    Integer,
+    Boolean,
+    Text,
+    DateTime,
+    ForeignKey,
+    literal,
+    select,
+)
 from sqlalchemy.orm import relationship
 from reddit_analyzer.database import Base
-from reddit_analyzer.models.base import TimestampMixin
+from reddit_analyzer.models.base import DescribeMixin, TimestampMixin, not_null_index
 
 
-class Comment(Base, TimestampMixin):
+class Comment(Base, TimestampMixin, DescribeMixin):
     """Reddit comment model."""
 
     __tablename__ = "comments"
+    __table_args__ = (not_null_index("ix_comments_parent_id_not_null", "parent_id"),)
 
     id = Column(String(255), primary_key=True)
     post_id = Column(String(255), ForeignKey("posts.id"))
-    parent_id = Column(String(255))  # Can be another comment or post
+    # Parent comment id; None for top-level comments. Replies outlive a parent
+    # removed by cleanup, so deleting it detaches them instead of failing.
+    parent_id = Column(
+        String(255),
+        ForeignKey(
+            "comments.id", name="fk_comments_parent_id_comments", ondelete="SET NULL"
+        ),
+    )
     author_id = Column(Integer, ForeignKey("users.id"))
     body = Column(Text)
     score = Column(Integer, default=0)
     created_utc = Column(DateTime, nullable=False)
     is_deleted = Column(Boolean, default=False)
 
-    # Relationships
-    post = relationship("Post", backref="comments")
-    author = relationship("User", backref="comments")
+    # Relationships. Many-to-one sides stay lazy="select": comments are loaded
+    # after their posts/authors, so these resolve from the identity map.
+    post = relationship("Post", back_populates="comments", lazy="select")
+    author = relationship("User", back_populates="comments", lazy="select")
     text_analysis = relationship(
         "TextAnalysis", back_populates="comment", uselist=False
     )
+    argument_structures = relationship(
+        "ArgumentStructure", back_populates="comment", lazy="raise"
+    )
+
+    @classmethod
+    def thread(cls, session, root_id: str) -> List["Comment"]:
+        """
+        Load a comment and every reply below it with one recursive query.
+
+        The ``WITH RECURSIVE`` CTE walks ``parent_id`` one level per step,
+        each step an index lookup, instead of one query per level or reply.
+
+        Args:
+            session: SQLAlchemy session
+            root_id: Id of the comment at the top of the thread
+
+        Returns:
+            The root followed by its replies, level by level, oldest first
+            within a level
+        """
+        tree = (
+            select(cls.id, literal(0).label("depth"))
+            .where(cls.id == root_id)
+            .cte("thread", recursive=True)
+        )
+        tree = tree.union_all(
+            select(cls.id, tree.c.depth + 1).where(cls.parent_id == tree.c.id)
+        )
+        query = (
+            select(cls)
+            .join(tree, cls.id == tree.c.id)
+            .order_by(tree.c.depth, cls.created_utc)
+        )
+        return list(session.scalars(query))
 
     def __repr__(self):
         return f"<Comment(id='{self.id}', post_id='{self.post_id}')>"
@@ -5,13 +5,13 @@ This module defines the database model for storing ML model predictions
 including popularity predictions, content classification, and user categorization.
 """
 
-from sqlalchemy import Column, Integer, String, Float, DateTime, JSON
-from datetime import datetime
+from sqlalchemy import Column, Integer, String, Float, DateTime
 
 from reddit_analyzer.database import Base
+from reddit_analyzer.models.base import JSONB, DescribeMixin, gin_index, utcnow
 
 
-class MLPrediction(Base):
+class MLPrediction(Base, DescribeMixin):
     """
     Model for storing machine learning model predictions.
 
@@ -20,6 +20,7 @@ class MLPrediction(Base):
     """
 
     __tablename__ = "ml_predictions"
+    __table_args__ = (gin_index("ix_ml_predictions_prediction_gin", "prediction"),)
 
     id = Column(Integer, primary_key=True, index=True)
 
@@ -35,24 +36,24 @@ class MLPrediction(Base):
     input_type = Column(String(50), nullable=False)  # post, comment, user
 
     # Prediction results
-    prediction = Column(JSON, nullable=False)  # Main prediction result
+    prediction = Column(JSONB, nullable=False)  # Main prediction result
     confidence_score = Column(Float, nullable=True)  # Prediction confidence
-    probability_distribution = Column(JSON, nullable=True)  # Class probabilities
+    probability_distribution = Column(JSONB, nullable=True)  # Class probabilities
 
     # Feature importance (for explainable AI)
     feature_importance = Column(
-        JSON, nullable=True
+        JSONB, nullable=True
     )  # Important features for prediction
 
     # Performance metrics (if ground truth available)
-    actual_value = Column(JSON, nullable=True)  # Actual outcome
+    actual_value = Column(JSONB, nullable=True)  # Actual outcome
     prediction_error = Column(Float, nullable=True)  # Error measure
 
     # Processing metadata
-    predicted_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    predicted_at = Column(DateTime, server_default=utcnow(), nullable=False)
     processing_time_ms = Column(
         Integer, nullable=True
     )  # Processing time in milliseconds
 
     def __repr__(self):
-        return f"<MLPrediction(model={self.model_name}, input={self.input_data_id}, confidence={self.confidence_score})>"
+        return f"<MLPrediction(id={self.id})>"
@@ -5,14 +5,35 @@ This module defines database models for storing political topic analysis,
 multi-dimensional political analysis, and community dynamics.
 """
 
-from sqlalchemy import Column, Integer, String, Float, DateTime, JSON, ForeignKey
+from sqlalchemy import (
+    DDL,
+    Column,
+    Integer,
+    String,
+    Float,
+    DateTime,
+    ForeignKey,
+    column,
+    event,
+    table,
+    UniqueConstraint,
+    text,
+)
 from sqlalchemy.orm import relationship
-from datetime import datetime
+from typing import Any, Dict, Iterable
 
 from reddit_analyzer.database import Base
+from reddit_analyzer.models.base import (
+    JSONB,
+    ScoreJSONB,
+    DescribeMixin,
+    dialect_insert,
+    gin_index,
+    utcnow,
+)
 
 
-class SubredditTopicProfile(Base):
+class SubredditTopicProfile(Base, DescribeMixin):
     """
     Model for storing aggregate topic analysis for a subreddit.
 
@@ -21,6 +42,14 @@ class SubredditTopicProfile(Base):
     """
 
     __tablename__ = "subreddit_topic_profiles"
+    __table_args__ = (
+        gin_index("ix_subreddit_topic_profiles_dominant_topics_gin", "dominant_topics"),
+        gin_index(
+            "ix_subreddit_topic_profiles_topic_distribution_gin",
+            "topic_distribution",
+            path_ops=False,
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     subreddit_id = Column(
@@ -32,9 +61,11 @@ class SubredditTopicProfile(Base):
     analysis_end_date = Column(DateTime, nullable=False)
 
     # Topic metrics
-    dominant_topics = Column(JSON, nullable=True)  # Top 5 topics by prevalence
-    topic_distribution = Column(JSON, nullable=True)  # All topics with percentages
-    topic_sentiment_map = Column(JSON, nullable=True)  # Sentiment by topic
+    dominant_topics = Column(JSONB, nullable=True)  # Top 5 topics by prevalence
+    topic_distribution = Column(
+        ScoreJSONB, nullable=True
+    )  # All topics with percentages
+    topic_sentiment_map = Column(JSONB, nullable=True)  # Sentiment by topic
 
     # Discussion quality
     avg_discussion_quality = Column(Float, nullable=True)
@@ -48,22 +79,33 @@ class SubredditTopicProfile(Base):
     unique_users_analyzed = Column(Integer, default=0)
 
     # Metadata
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=utcnow(), nullable=False)
     confidence_level = Column(Float, nullable=True)  # Overall confidence in analysis
 
     # Relationships
     subreddit = relationship("Subreddit", back_populates="topic_profiles")
 
     def __repr__(self):
-        return f"<SubredditTopicProfile(subreddit_id={self.subreddit_id}, period={self.analysis_start_date}-{self.analysis_end_date})>"
+        return (
+            f"<SubredditTopicProfile(id={self.id}, subreddit_id={self.subreddit_id})>"
+        )
 
 
-class CommunityOverlap(Base):
+class CommunityOverlap(Base, DescribeMixin):
     """
     Model for tracking user overlap and engagement patterns between communities.
     """
 
     __tablename__ = "community_overlaps"
+    __table_args__ = (
+        # One snapshot per subreddit pair and analysis date; upsert target
+        UniqueConstraint(
+            "subreddit_a_id",
+            "subreddit_b_id",
+            "analysis_date",
+            name="uq_community_overlaps_pair_date",
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     subreddit_a_id = Column(
@@ -76,7 +118,7 @@ class CommunityOverlap(Base):
     # Overlap metrics
     user_overlap_count = Column(Integer, default=0)
     user_overlap_percentage = Column(Float, nullable=True)
-    shared_topics = Column(JSON, nullable=True)
+    shared_topics = Column(JSONB, nullable=True)
 
     # Engagement patterns
     cross_posting_count = Column(Integer, default=0)
@@ -84,17 +126,57 @@ class CommunityOverlap(Base):
         Float, nullable=True
     )  # How differently topics are discussed
 
-    analysis_date = Column(DateTime, default=datetime.utcnow, nullable=False)
+    analysis_date = Column(DateTime, server_default=utcnow(), nullable=False)
 
     # Relationships
     subreddit_a = relationship("Subreddit", foreign_keys=[subreddit_a_id])
     subreddit_b = relationship("Subreddit", foreign_keys=[subreddit_b_id])
 
     def __repr__(self):
-        return f"<CommunityOverlap(a={self.subreddit_a_id}, b={self.subreddit_b_id}, overlap={self.user_overlap_percentage})>"
+        return f"<CommunityOverlap(id={self.id}, a={self.subreddit_a_id}, b={self.subreddit_b_id})>"
+
+
+# Rows per upsert statement; about 14k bound parameters, inside the limits of
+# both SQLite and the PostgreSQL wire protocol
+OVERLAP_UPSERT_CHUNK_SIZE = 2000
+
+_OVERLAP_KEY = ("subreddit_a_id", "subreddit_b_id", "analysis_date")
+
+
+def upsert_community_overlaps(
+    session, rows: Iterable[Dict[str, Any]], chunk_size: int = OVERLAP_UPSERT_CHUNK_SIZE
+) -> int:
+    """
+    Insert or update ``CommunityOverlap`` snapshots in bulk.
+
+    Each chunk of rows is written with one ``INSERT ... ON CONFLICT DO
+    UPDATE`` on ``(subreddit_a_id, subreddit_b_id, analysis_date)`` instead of
+    a query and write per row. The caller commits.
 
+    Args:
+        session: SQLAlchemy session
+        rows: Column values per snapshot, all with the same keys, including
+            ``analysis_date``
+        chunk_size: Rows per statement
 
-class PoliticalDimensionsAnalysis(Base):
+    Returns:
+        Number of rows written
+    """
+    rows = list(rows)
+    insert = dialect_insert(session)
+    for start in range(0, len(rows), chunk_size):
+        stmt = insert(CommunityOverlap).values(rows[start : start + chunk_size])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=list(_OVERLAP_KEY),
+            set_={
+                key: stmt.excluded[key] for key in rows[0] if key not in _OVERLAP_KEY
+            },
+        )
+        session.execute(stmt)
+    return len(rows)
+
+
+class PoliticalDimensionsAnalysis(Base, DescribeMixin):
     """
     Model for storing multi-dimensional political analysis results.
 
@@ -103,6 +185,12 @@ class PoliticalDimensionsAnalysis(Base):
     """
 
     __tablename__ = "political_dimensions_analyses"
+    __table_args__ = (
+        gin_index(
+            "ix_political_dimensions_analyses_economic_evidence_gin",
+            "economic_evidence",
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     text_analysis_id = Column(
@@ -114,14 +202,14 @@ class PoliticalDimensionsAnalysis(Base):
     economic_confidence = Column(Float, nullable=True)  # 0.0 to 1.0
     economic_label = Column(String(50), nullable=True)
     economic_evidence = Column(
-        JSON, nullable=True
+        ScoreJSONB, nullable=True
     )  # Keywords/phrases that influenced score
 
     # Social dimension
     social_score = Column(Float, nullable=True)  # -1.0 (authority) to 1.0 (liberty)
     social_confidence = Column(Float, nullable=True)
     social_label = Column(String(50), nullable=True)
-    social_evidence = Column(JSON, nullable=True)
+    social_evidence = Column(JSONB, nullable=True)
 
     # Governance dimension
     governance_score = Column(
@@ -129,7 +217,7 @@ class PoliticalDimensionsAnalysis(Base):
     )  # -1.0 (centralized) to 1.0 (decentralized)
     governance_confidence = Column(Float, nullable=True)
     governance_label = Column(String(50), nullable=True)
-    governance_evidence = Column(JSON, nullable=True)
+    governance_evidence = Column(JSONB, nullable=True)
 
     # Overall metrics
     analysis_quality = Column(
@@ -139,16 +227,16 @@ class PoliticalDimensionsAnalysis(Base):
         String(20), nullable=True
     )  # Which dimension had strongest signal
 
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=utcnow(), nullable=False)
 
     # Relationships
     text_analysis = relationship("TextAnalysis", back_populates="political_dimensions")
 
     def __repr__(self):
-        return f"<PoliticalDimensionsAnalysis(id={self.id}, quality={self.analysis_quality})>"
+        return f"<PoliticalDimensionsAnalysis(id={self.id}, text_analysis_id={self.text_analysis_id})>"
 
 
-class SubredditPoliticalDimensions(Base):
+class SubredditPoliticalDimensions(Base, DescribeMixin):
     """
     Model for storing aggregate political dimensions for a subreddit.
 
@@ -157,6 +245,12 @@ class SubredditPoliticalDimensions(Base):
     """
 
     __tablename__ = "subreddit_political_dimensions"
+    __table_args__ = (
+        gin_index(
+            "ix_subreddit_political_dimensions_political_clusters_gin",
+            "political_clusters",
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     subreddit_id = Column(
@@ -170,35 +264,100 @@ class SubredditPoliticalDimensions(Base):
     # Aggregate scores for each dimension
     avg_economic_score = Column(Float, nullable=True)
     economic_std_dev = Column(Float, nullable=True)
-    economic_distribution = Column(JSON, nullable=True)  # Histogram data
+    economic_distribution = Column(JSONB, nullable=True)  # Histogram data
 
     avg_social_score = Column(Float, nullable=True)
     social_std_dev = Column(Float, nullable=True)
-    social_distribution = Column(JSON, nullable=True)
+    social_distribution = Column(JSONB, nullable=True)
 
     avg_governance_score = Column(Float, nullable=True)
     governance_std_dev = Column(Float, nullable=True)
-    governance_distribution = Column(JSON, nullable=True)
+    governance_distribution = Column(JSONB, nullable=True)
 
     # Political diversity metrics
     political_diversity_index = Column(Float, nullable=True)  # 0.0 to 1.0
     dimension_correlation = Column(
-        JSON, nullable=True
+        JSONB, nullable=True
     )  # Correlation between dimensions
 
     # Cluster analysis
-    political_clusters = Column(JSON, nullable=True)  # Identified political groupings
-    cluster_sizes = Column(JSON, nullable=True)  # Size of each cluster
+    political_clusters = Column(JSONB, nullable=True)  # Identified political groupings
+    cluster_sizes = Column(JSONB, nullable=True)  # Size of each cluster
 
     # Metadata
     total_posts_analyzed = Column(Integer, default=0)
     total_comments_analyzed = Column(Integer, default=0)
     avg_confidence_level = Column(Float, nullable=True)
 
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=utcnow(), nullable=False)
 
     # Relationships
     subreddit = relationship("Subreddit", back_populates="political_dimensions")
 
     def __repr__(self):
-        return f"<SubredditPoliticalDimensions(subreddit_id={self.subreddit_id}, diversity={self.political_diversity_index})>"
+        return f"<SubredditPoliticalDimensions(id={self.id}, subreddit_id={self.subreddit_id})>"
+
+
+# Scalar dashboard columns of subreddit_political_dimensions. On PostgreSQL they
+# are also kept in a materialized view, so dashboards read narrow rows instead
+# of rows carrying the JSON distribution/cluster blobs.
+POLITICAL_SUMMARY_VIEW = "mv_subreddit_political_summary"
+POLITICAL_SUMMARY_COLUMNS = (
+    "id",
+    "subreddit_id",
+    "analysis_start_date",
+    "analysis_end_date",
+    "avg_economic_score",
+    "avg_social_score",
+    "avg_governance_score",
+    "political_diversity_index",
+    "avg_confidence_level",
+    "created_at",
+)
+
+_POLITICAL_SUMMARY_DDL = (
+    f"CREATE MATERIALIZED VIEW IF NOT EXISTS {POLITICAL_SUMMARY_VIEW} AS "
+    f"SELECT {', '.join(POLITICAL_SUMMARY_COLUMNS)}, "
+    "(dimension_correlation->>'econ_soc')::float AS corr_econ_soc "
+    "FROM subreddit_political_dimensions",
+    # REFRESH ... CONCURRENTLY needs a unique index
+    f"CREATE UNIQUE INDEX IF NOT EXISTS ix_{POLITICAL_SUMMARY_VIEW}_id "
+    f"ON {POLITICAL_SUMMARY_VIEW} (id)",
+    f"CREATE INDEX IF NOT EXISTS ix_{POLITICAL_SUMMARY_VIEW}_subreddit_end "
+    f"ON {POLITICAL_SUMMARY_VIEW} (subreddit_id, analysis_end_date)",
+)
+
+# Keep create_all()/drop_all() in step with the migration
+for _statement in _POLITICAL_SUMMARY_DDL:
+    event.listen(
+        SubredditPoliticalDimensions.__table__,
+        "after_create",
+        DDL(_statement).execute_if(dialect="postgresql"),
+    )
+event.listen(
+    SubredditPoliticalDimensions.__table__,
+    "before_drop",
+    DDL(f"DROP MATERIALIZED VIEW IF EXISTS {POLITICAL_SUMMARY_VIEW}").execute_if(
+        dialect="postgresql"
+    ),
+)
+
+
+def political_summary_table(dialect_name: str):
+    """Selectable to read political dashboard scalars from on this dialect."""
+    if dialect_name == "postgresql":
+        return table(
+            POLITICAL_SUMMARY_VIEW,
+            *(column(name) for name in POLITICAL_SUMMARY_COLUMNS),
+        )
+    return SubredditPoliticalDimensions.__table__
+
+
+def refresh_political_summary(session) -> None:
+    """Bring the political summary view up to date after new analyses."""
+    if session.get_bind().dialect.name != "postgresql":
+        return
+    session.execute(
+        text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {POLITICAL_SUMMARY_VIEW}")
+    )
+    session.commit()
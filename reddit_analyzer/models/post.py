@@ -9,16 +9,22 @@ from sqlalchemy import (
     Text,
     DateTime,
     ForeignKey,
+    Index,
 )
 from sqlalchemy.orm import relationship
 from reddit_analyzer.database import Base
-from reddit_analyzer.models.base import TimestampMixin
+from reddit_analyzer.models.base import DescribeMixin, TimestampMixin
 
 
-class Post(Base, TimestampMixin):
+class Post(Base, TimestampMixin, DescribeMixin):
     """Reddit post model."""
 
     __tablename__ = "posts"
+    __table_args__ = (
+        # Serves "latest posts in a subreddit" (filter + ORDER BY created_utc
+        # DESC LIMIT n) as an index walk; Postgres scans it backwards for DESC.
+        Index("ix_posts_subreddit_id_created_utc", "subreddit_id", "created_utc"),
+    )
 
     id = Column(String(255), primary_key=True)
     title = Column(String(500), nullable=False)
@@ -35,9 +41,15 @@ class Post(Base, TimestampMixin):
     is_locked = Column(Boolean, default=False)
 
     # Relationships
-    author = relationship("User", backref="posts")
-    subreddit = relationship("Subreddit", backref="posts")
+    author = relationship("User", back_populates="posts", lazy="select")
+    subreddit = relationship("Subreddit", back_populates="posts", lazy="select")
     text_analysis = relationship("TextAnalysis", back_populates="post", uselist=False)
 
+    # Unbounded collections: query them explicitly, never via lazy access
+    comments = relationship("Comment", back_populates="post", lazy="raise")
+    argument_structures = relationship(
+        "ArgumentStructure", back_populates="post", lazy="raise"
+    )
+
     def __repr__(self):
-        return f"<Post(id='{self.id}', title='{self.title[:50]}...')>"
+        return f"<Post(id='{self.id}')>"
@@ -18,6 +18,12 @@ class Subreddit(Base, BaseModel):
     created_utc = Column(DateTime)
     is_nsfw = Column(Boolean, default=False)
 
+    # Unbounded collections: query them explicitly, never via lazy access
+    posts = relationship("Post", back_populates="subreddit", lazy="raise")
+    advanced_topics = relationship(
+        "AdvancedTopic", back_populates="subreddit", lazy="raise"
+    )
+
     # Relationships for political analysis
     topic_profiles = relationship("SubredditTopicProfile", back_populates="subreddit")
     political_dimensions = relationship(
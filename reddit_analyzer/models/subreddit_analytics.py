@@ -5,13 +5,13 @@ This module defines the database model for storing aggregated subreddit
 analytics including health metrics, growth indicators, and community analysis.
 """
 
-from sqlalchemy import Column, Integer, String, Float, DateTime, JSON, Date
-from datetime import datetime
+from sqlalchemy import Column, Integer, String, Float, DateTime, Date
 
 from reddit_analyzer.database import Base
+from reddit_analyzer.models.base import JSONB, DescribeMixin, gin_index, utcnow
 
 
-class SubredditAnalytics(Base):
+class SubredditAnalytics(Base, DescribeMixin):
     """
     Model for storing comprehensive subreddit analytics.
 
@@ -20,6 +20,7 @@ class SubredditAnalytics(Base):
     """
 
     __tablename__ = "subreddit_analytics"
+    __table_args__ = (gin_index("ix_subreddit_analytics_top_topics_gin", "top_topics"),)
 
     id = Column(Integer, primary_key=True, index=True)
 
@@ -68,14 +69,14 @@ class SubredditAnalytics(Base):
     removal_rate = Column(Float, nullable=True)  # Content removal rate
 
     # Detailed analytics (JSON format)
-    top_topics = Column(JSON, nullable=True)  # Top topics for period
-    engagement_metrics = Column(JSON, nullable=True)  # Detailed engagement data
-    growth_metrics = Column(JSON, nullable=True)  # Detailed growth data
-    user_distribution = Column(JSON, nullable=True)  # User activity distribution
-    content_distribution = Column(JSON, nullable=True)  # Content type distribution
+    top_topics = Column(JSONB, nullable=True)  # Top topics for period
+    engagement_metrics = Column(JSONB, nullable=True)  # Detailed engagement data
+    growth_metrics = Column(JSONB, nullable=True)  # Detailed growth data
+    user_distribution = Column(JSONB, nullable=True)  # User activity distribution
+    content_distribution = Column(JSONB, nullable=True)  # Content type distribution
 
     # Processing metadata
-    calculated_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    calculated_at = Column(DateTime, server_default=utcnow(), nullable=False)
 
     def __repr__(self):
-        return f"<SubredditAnalytics(subreddit={self.subreddit_name}, period={self.period_start}-{self.period_end}, health={self.health_score})>"
+        return f"<SubredditAnalytics(id={self.id})>"
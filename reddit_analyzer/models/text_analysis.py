@@ -5,14 +5,22 @@ This module defines the database model for storing text analysis results
 including sentiment analysis, topic modeling, and NLP feature extraction.
 """
 
-from sqlalchemy import Column, Integer, String, Float, DateTime, JSON, ForeignKey
-from sqlalchemy.orm import relationship
-from datetime import datetime
+from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey
+from sqlalchemy.orm import deferred, relationship
 
 from reddit_analyzer.database import Base
-
-
-class TextAnalysis(Base):
+from reddit_analyzer.models.base import (
+    JSONB,
+    ScoreJSONB,
+    DescribeMixin,
+    brin_index,
+    gin_index,
+    not_null_index,
+    utcnow,
+)
+
+
+class TextAnalysis(Base, DescribeMixin):
     """
     Model for storing comprehensive text analysis results.
 
@@ -21,42 +29,60 @@ class TextAnalysis(Base):
     """
 
     __tablename__ = "text_analysis"
+    __table_args__ = (
+        gin_index("ix_text_analysis_keywords_gin", "keywords"),
+        gin_index("ix_text_analysis_entities_gin", "entities"),
+        gin_index("ix_text_analysis_topics_gin", "topics"),
+        gin_index(
+            "ix_text_analysis_emotion_scores_gin", "emotion_scores", path_ops=False
+        ),
+        brin_index("ix_text_analysis_processed_at_brin", "processed_at"),
+        not_null_index("ix_text_analysis_post_id_not_null", "post_id"),
+        not_null_index("ix_text_analysis_comment_id_not_null", "comment_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
 
     # References to source content
-    post_id = Column(String(255), ForeignKey("posts.id"), nullable=True, index=True)
-    comment_id = Column(
-        String(255), ForeignKey("comments.id"), nullable=True, index=True
-    )
+    post_id = Column(String(255), ForeignKey("posts.id"), nullable=True)
+    comment_id = Column(String(255), ForeignKey("comments.id"), nullable=True)
 
     # Text analysis results
     sentiment_score = Column(Float, nullable=True)  # Compound sentiment score
     sentiment_label = Column(String(20), nullable=True)  # POSITIVE, NEGATIVE, NEUTRAL
-    emotion_scores = Column(JSON, nullable=True)  # Joy, anger, fear, etc.
+    emotion_scores = Column(ScoreJSONB, nullable=True)  # Joy, anger, fear, etc.
 
     # Language and basic features
     language = Column(String(10), nullable=True)  # Language code
     confidence_score = Column(Float, nullable=True)  # Analysis confidence
 
-    # Text features
-    keywords = Column(JSON, nullable=True)  # Extracted keywords with scores
-    entities = Column(JSON, nullable=True)  # Named entities
-    topics = Column(JSON, nullable=True)  # Topic modeling results
+    # Text features; deferred as one group, loaded together on first access
+    # or up front with options(undefer_group("features"))
+    keywords = deferred(
+        Column(JSONB, nullable=True), group="features"
+    )  # Extracted keywords with scores
+    entities = deferred(Column(JSONB, nullable=True), group="features")
+    topics = deferred(
+        Column(JSONB, nullable=True), group="features"
+    )  # Topic modeling results
 
     # Quality metrics
     quality_score = Column(Float, nullable=True)  # Overall content quality
     readability_score = Column(Float, nullable=True)  # Text readability
 
     # Processing metadata
-    processed_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    processed_at = Column(DateTime, server_default=utcnow(), nullable=False)
 
     # Relationships
     post = relationship("Post", back_populates="text_analysis")
     comment = relationship("Comment", back_populates="text_analysis")
+    # JSON-heavy; load explicitly with selectinload(TextAnalysis.political_dimensions)
     political_dimensions = relationship(
-        "PoliticalDimensionsAnalysis", back_populates="text_analysis", uselist=False
+        "PoliticalDimensionsAnalysis",
+        back_populates="text_analysis",
+        uselist=False,
+        lazy="raise_on_sql",
     )
 
     def __repr__(self):
-        return f"<TextAnalysis(id={self.id}, sentiment={self.sentiment_label}, quality={self.quality_score})>"
+        return f"<TextAnalysis(id={self.id})>"
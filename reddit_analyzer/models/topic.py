@@ -5,13 +5,21 @@ This module defines the database model for storing topic modeling results
 including LDA and BERT-based topic discovery and analysis.
 """
 
-from sqlalchemy import Column, Integer, String, Float, DateTime, JSON, Date
-from datetime import datetime
+from sqlalchemy import Column, Integer, String, Float, DateTime, Date
+from sqlalchemy.orm import deferred
 
 from reddit_analyzer.database import Base
+from reddit_analyzer.models.base import (
+    JSONB,
+    ScoreJSONB,
+    DescribeMixin,
+    gin_index,
+    not_null_index,
+    utcnow,
+)
 
 
-class Topic(Base):
+class Topic(Base, DescribeMixin):
     """
     Model for storing topic modeling results.
 
@@ -20,6 +28,11 @@ class Topic(Base):
     """
 
     __tablename__ = "topics"
+    __table_args__ = (
+        gin_index("ix_topics_topic_words_gin", "topic_words"),
+        not_null_index("ix_topics_subreddit_name_not_null", "subreddit_name"),
+        not_null_index("ix_topics_time_period_not_null", "time_period"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
 
@@ -28,16 +41,16 @@ class Topic(Base):
     topic_name = Column(String(255), nullable=True)  # Human-readable topic name
 
     # Scope and context
-    subreddit_name = Column(String(255), nullable=True, index=True)
+    subreddit_name = Column(String(255), nullable=True)
     model_type = Column(String(50), nullable=False)  # lda, bert, combined
 
     # Topic content
-    topic_words = Column(JSON, nullable=False)  # Top words with weights
+    topic_words = Column(ScoreJSONB, nullable=False)  # Top words with weights
     topic_probability = Column(Float, nullable=True)  # Overall topic strength
     document_count = Column(Integer, default=0)  # Number of documents in topic
 
     # Temporal analysis
-    time_period = Column(Date, nullable=True, index=True)  # Time period for topic
+    time_period = Column(Date, nullable=True)  # Time period for topic
     trend_score = Column(Float, nullable=True)  # Trending strength
 
     # Topic characteristics
@@ -45,11 +58,13 @@ class Topic(Base):
     diversity_score = Column(Float, nullable=True)  # Topic diversity measure
 
     # Representative content
-    representative_posts = Column(JSON, nullable=True)  # Sample posts for topic
+    representative_posts = deferred(
+        Column(JSONB, nullable=True)
+    )  # Sample posts for topic, loaded on access
 
     # Processing metadata
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=utcnow(), nullable=False)
     model_version = Column(String(50), nullable=True)  # Model version used
 
     def __repr__(self):
-        return f"<Topic(id={self.topic_id}, subreddit={self.subreddit_name}, words={len(self.topic_words) if self.topic_words else 0})>"
+        return f"<Topic(id={self.id}, topic_id={self.topic_id})>"
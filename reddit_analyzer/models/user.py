@@ -39,6 +39,10 @@ class User(Base, BaseModel):
     # Relationships
     metrics = relationship("UserMetric", back_populates="user")
 
+    # Unbounded collections: query them explicitly, never via lazy access
+    posts = relationship("Post", back_populates="author", lazy="raise")
+    comments = relationship("Comment", back_populates="author", lazy="raise")
+
     def set_password(self, password: str) -> None:
         """Hash and set user password."""
         self.password_hash = pwd_context.hash(password)
@@ -58,4 +62,7 @@ class User(Base, BaseModel):
         return bool(self.role == UserRole.ADMIN)
 
     def __repr__(self):
+        # role is only set once the row is flushed or assigned explicitly
+        if self.role is None:
+            return f"<User(id={self.id}, username='{self.username}')>"
         return f"<User(id={self.id}, username='{self.username}', role='{self.role.value}')>"
@@ -5,14 +5,20 @@ This module defines the database model for storing calculated user metrics
 including activity scores, influence measures, and behavioral analysis.
 """
 
-from sqlalchemy import Column, Integer, String, Float, DateTime, JSON, ForeignKey
+from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey
 from sqlalchemy.orm import relationship
-from datetime import datetime
 
 from reddit_analyzer.database import Base
+from reddit_analyzer.models.base import (
+    JSONB,
+    DescribeMixin,
+    gin_index,
+    not_null_index,
+    utcnow,
+)
 
 
-class UserMetric(Base):
+class UserMetric(Base, DescribeMixin):
     """
     Model for storing comprehensive user metrics and analysis.
 
@@ -21,13 +27,19 @@ class UserMetric(Base):
     """
 
     __tablename__ = "user_metrics"
+    __table_args__ = (
+        gin_index(
+            "ix_user_metrics_detailed_metrics_gin", "detailed_metrics", path_ops=False
+        ),
+        not_null_index("ix_user_metrics_subreddit_name_not_null", "subreddit_name"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
 
     # User reference
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     subreddit_name = Column(
-        String(255), nullable=True, index=True
+        String(255), nullable=True
     )  # Metrics for specific subreddit
 
     # Core metrics
@@ -58,17 +70,17 @@ class UserMetric(Base):
     crosspost_ratio = Column(Float, nullable=True)  # Cross-posting behavior
 
     # Detailed metrics (JSON format)
-    detailed_metrics = Column(JSON, nullable=True)  # Additional detailed metrics
+    detailed_metrics = Column(JSONB, nullable=True)  # Additional detailed metrics
 
     # Time period for metrics
     period_start = Column(DateTime, nullable=True)
     period_end = Column(DateTime, nullable=True)
 
     # Processing metadata
-    calculated_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    calculated_at = Column(DateTime, server_default=utcnow(), nullable=False)
 
     # Relationships
     user = relationship("User", back_populates="metrics")
 
     def __repr__(self):
-        return f"<UserMetric(user_id={self.user_id}, activity={self.activity_score:.2f}, influence={self.influence_score:.2f})>"
+        return f"<UserMetric(id={self.id}, user_id={self.user_id})>"
@@ -0,0 +1,87 @@
+"""Buffered, batched writes for the monitoring metric tables."""
+
+import logging
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Type
+
+from sqlalchemy import insert
+
+from reddit_analyzer.database import SessionLocal
+from reddit_analyzer.models import APIRequest, DataQualityMetric, SystemMetric
+
+logger = logging.getLogger(__name__)
+
+# Timestamp column per metric table, stamped client-side when a row is buffered
+TIMESTAMP_COLUMNS = {
+    APIRequest: "created_at",
+    SystemMetric: "created_at",
+    DataQualityMetric: "calculated_at",
+}
+
+
+class MetricsBuffer:
+    """
+    Collects metric rows and writes each table's rows with one INSERT.
+
+    Metric rows are small and frequent; adding them to a session one by one
+    makes the unit of work flush a separate INSERT round-trip per row. The
+    buffer instead hands each table's rows to a single executemany INSERT.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable = SessionLocal,
+        max_rows: int = 500,
+    ):
+        """
+        Initialize the buffer.
+
+        Args:
+            session_factory: Callable returning a new database session
+            max_rows: Buffered row count that triggers an automatic flush
+        """
+        self.session_factory = session_factory
+        self.max_rows = max_rows
+        self._rows: Dict[Type, List[Dict[str, Any]]] = defaultdict(list)
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def add(self, model: Type, **values) -> None:
+        """Buffer one row for ``model`` (APIRequest, SystemMetric, ...)."""
+        # Stamped now rather than at flush, so the time is when it happened
+        values.setdefault(TIMESTAMP_COLUMNS[model], datetime.utcnow())
+        self._rows[model].append(values)
+        self._count += 1
+
+        if self._count >= self.max_rows:
+            self.flush()
+
+    def flush(self) -> int:
+        """
+        Write all buffered rows.
+
+        Returns:
+            Number of rows written
+        """
+        if not self._count:
+            return 0
+
+        pending, self._rows = self._rows, defaultdict(list)
+        written, self._count = self._count, 0
+
+        session = self.session_factory()
+        try:
+            for model, rows in pending.items():
+                session.execute(insert(model), rows)
+            session.commit()
+        except Exception as e:
+            session.rollback()
+            logger.error(f"Failed to write {written} metric rows: {e}")
+            raise
+        finally:
+            session.close()
+
+        return written
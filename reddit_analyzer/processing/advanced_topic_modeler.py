@@ -5,8 +5,9 @@ This module provides advanced topic modeling beyond basic LDA, including
 neural topic models, dynamic topic modeling, and hierarchical topic structures.
 """
 
+import hashlib
 import logging
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 import numpy as np
 from sklearn.feature_extraction.text import TfidfVectorizer, CountVectorizer
 from sklearn.decomposition import NMF, LatentDirichletAllocation
@@ -21,6 +22,12 @@ import umap
 
 logger = logging.getLogger(__name__)
 
+# Corpora whose document embeddings are kept between fits
+EMBEDDING_CACHE_SIZE = 4
+
+# Tokens per document fed to the sentence transformer; longer posts are cut
+MAX_SEQ_LENGTH = 128
+
 
 class AdvancedTopicModeler:
     """Advanced topic modeling with multiple algorithms and techniques."""
@@ -31,6 +38,7 @@ class AdvancedTopicModeler:
         embedding_model: str = "all-MiniLM-L6-v2",
         use_gpu: bool = False,
         min_topic_size: int = 10,
+        encode_batch_size: int = 128,
     ):
         """
         Initialize advanced topic modeler.
@@ -40,13 +48,20 @@ class AdvancedTopicModeler:
             embedding_model: Model for document embeddings
             use_gpu: Whether to use GPU
             min_topic_size: Minimum documents per topic
+            encode_batch_size: Documents per sentence transformer batch
         """
         self.method = method
         self.embedding_model_name = embedding_model
         self.use_gpu = use_gpu
         self.min_topic_size = min_topic_size
+        self.encode_batch_size = encode_batch_size
         self.model = None
         self.embedder = None
+        # Document embeddings per corpus key, oldest first
+        self._embedding_cache: Dict[bytes, np.ndarray] = {}
+        # Corpus key and (topics, probs) of the last BERTopic fit
+        self._fitted_key: Optional[bytes] = None
+        self._fit_result: Optional[Tuple[List[int], Any]] = None
         self._initialize_models()
 
     def _initialize_models(self):
@@ -76,6 +91,10 @@ class AdvancedTopicModeler:
             self.embedder = SentenceTransformer(
                 self.embedding_model_name, device=device
             )
+            self.embedder.max_seq_length = MAX_SEQ_LENGTH
+            if device == "cuda":
+                # fp16 halves activation memory and uses tensor cores
+                self.embedder.half()
 
             # Configure UMAP for dimensionality reduction
             umap_model = umap.UMAP(
@@ -157,12 +176,56 @@ class AdvancedTopicModeler:
             logger.error(f"Error in topic modeling: {e}")
             return {"topics": [], "document_topics": [], "topic_words": {}}
 
+    @staticmethod
+    def _corpus_key(documents: List[str]) -> bytes:
+        """Digest identifying a document list, order included."""
+        return hashlib.blake2b(b"\0".join(d.encode() for d in documents)).digest()
+
+    def _embed(self, documents: List[str], key: bytes) -> np.ndarray:
+        """Encode documents once per corpus; repeat calls reuse the result."""
+        embeddings = self._embedding_cache.get(key)
+        if embeddings is None:
+            # encode() already batches documents sorted by length and restores
+            # the input order, so padding stays close to each batch's longest
+            embeddings = self.embedder.encode(
+                documents,
+                batch_size=self.encode_batch_size,
+                show_progress_bar=False,
+                convert_to_numpy=True,
+            )
+            # A half-precision model returns float16; UMAP works in float32
+            embeddings = embeddings.astype(np.float32, copy=False)
+            if len(self._embedding_cache) >= EMBEDDING_CACHE_SIZE:
+                self._embedding_cache.pop(next(iter(self._embedding_cache)))
+            self._embedding_cache[key] = embeddings
+        return embeddings
+
+    def _ensure_fit(self, documents: List[str]) -> Tuple[List[int], Any]:
+        """
+        Fit BERTopic on ``documents`` unless it is already fit on them.
+
+        Embeddings are computed up front and passed to BERTopic, so the
+        sentence transformer runs once per corpus rather than once per
+        analysis method.
+
+        Returns:
+            Topic assignment and probabilities per document
+        """
+        key = self._corpus_key(documents)
+        if key != self._fitted_key:
+            embeddings = self._embed(documents, key)
+            self._fit_result = self.model.fit_transform(
+                documents, embeddings=embeddings
+            )
+            self._fitted_key = key
+        return self._fit_result
+
     def _fit_transform_bertopic(
         self, documents: List[str], metadata: Optional[List[Dict]] = None
     ) -> Dict[str, Any]:
         """Fit and transform using BERTopic."""
-        # Fit the model
-        topics, probs = self.model.fit_transform(documents)
+        # Fit the model (reused if already fit on these documents)
+        topics, probs = self._ensure_fit(documents)
 
         # Get topic information
         topic_info = self.model.get_topic_info()
@@ -275,8 +338,8 @@ class AdvancedTopicModeler:
             return {}
 
         try:
-            # Fit the model first
-            topics, probs = self.model.fit_transform(documents)
+            # Fit the model first, or reuse the fit on these documents
+            topics, probs = self._ensure_fit(documents)
 
             # Get hierarchical topics
             hierarchical_topics = self.model.hierarchical_topics(documents)
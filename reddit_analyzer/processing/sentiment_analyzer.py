@@ -451,23 +451,35 @@ class SentimentAnalyzer:
         if not sentiment_results or len(sentiment_results) < window_size:
             return []
 
-        trend_data = []
-
-        for i in range(window_size - 1, len(sentiment_results)):
-            window = sentiment_results[i - window_size + 1 : i + 1]
+        # Gather the per-result scores into one (n, 4) array and compute every
+        # window mean at once from prefix sums instead of re-averaging each
+        # window in Python.
+        scores = np.array(
+            [
+                (
+                    r.get("compound_score", 0),
+                    r.get("positive_score", 0),
+                    r.get("negative_score", 0),
+                    r.get("confidence", 0),
+                )
+                for r in sentiment_results
+            ],
+            dtype=np.float64,
+        )
+        cumulative = np.vstack([np.zeros((1, 4)), np.cumsum(scores, axis=0)])
+        window_means = (
+            cumulative[window_size:] - cumulative[:-window_size]
+        ) / window_size
 
-            # Calculate moving averages
-            avg_compound = np.mean([r.get("compound_score", 0) for r in window])
-            avg_positive = np.mean([r.get("positive_score", 0) for r in window])
-            avg_negative = np.mean([r.get("negative_score", 0) for r in window])
-            avg_confidence = np.mean([r.get("confidence", 0) for r in window])
+        trend_data = []
 
+        for offset, means in enumerate(window_means):
             trend_point = {
-                "index": i,
-                "avg_compound": avg_compound,
-                "avg_positive": avg_positive,
-                "avg_negative": avg_negative,
-                "avg_confidence": avg_confidence,
+                "index": offset + window_size - 1,
+                "avg_compound": means[0],
+                "avg_positive": means[1],
+                "avg_negative": means[2],
+                "avg_confidence": means[3],
                 "window_size": window_size,
             }
 
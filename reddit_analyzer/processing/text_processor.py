@@ -5,6 +5,7 @@ This module provides comprehensive text processing capabilities including
 cleaning, tokenization, language detection, and feature extraction.
 """
 
+import os
 import re
 import logging
 from typing import Dict, List, Any
@@ -14,6 +15,32 @@ import nltk
 
 logger = logging.getLogger(__name__)
 
+# Parts of speech that qualify a token as a keyword candidate
+KEYWORD_POS_TAGS = frozenset({"NOUN", "VERB", "ADJ", "PROPN"})
+
+# Below this many texts, worker start-up and IPC cost more than parallel parsing saves
+PARALLEL_PIPE_MIN_TEXTS = 100
+
+# Patterns used by TextProcessor.clean_text, compiled once at import
+_HTTP_URL_RE = re.compile(
+    r"http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+"
+)
+_WWW_URL_RE = re.compile(
+    r"www\.(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+"
+)
+_AT_MENTION_RE = re.compile(r"@[A-Za-z0-9_]+")
+_USER_LINK_RE = re.compile(r"/u/[A-Za-z0-9_]+")
+_USER_MENTION_RE = re.compile(r"u/[A-Za-z0-9_]+")
+_HASHTAG_RE = re.compile(r"#[A-Za-z0-9_]+")
+_SUBREDDIT_LINK_RE = re.compile(r"/r/[A-Za-z0-9_]+")
+_SUBREDDIT_MENTION_RE = re.compile(r"r/[A-Za-z0-9_]+")
+_BOLD_RE = re.compile(r"\*\*(.*?)\*\*")
+_ITALIC_RE = re.compile(r"\*(.*?)\*")
+_STRIKETHROUGH_RE = re.compile(r"~~(.*?)~~")
+_CODE_RE = re.compile(r"`(.*?)`")
+_SPECIAL_CHARS_RE = re.compile(r"[^a-zA-Z\\s\\.\\!\\?\\,\\;\\:]")
+_WHITESPACE_RE = re.compile(r"\\s+")
+
 
 class TextProcessor:
     """
@@ -92,41 +119,33 @@ class TextProcessor:
 
         # Remove URLs
         if remove_urls:
-            text = re.sub(
-                r"http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+",
-                "",
-                text,
-            )
-            text = re.sub(
-                r"www\.(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+",
-                "",
-                text,
-            )
+            text = _HTTP_URL_RE.sub("", text)
+            text = _WWW_URL_RE.sub("", text)
 
         # Remove mentions
         if remove_mentions:
-            text = re.sub(r"@[A-Za-z0-9_]+", "", text)
-            text = re.sub(r"/u/[A-Za-z0-9_]+", "", text)
-            text = re.sub(r"u/[A-Za-z0-9_]+", "", text)
+            text = _AT_MENTION_RE.sub("", text)
+            text = _USER_LINK_RE.sub("", text)
+            text = _USER_MENTION_RE.sub("", text)
 
         # Remove hashtags
         if remove_hashtags:
-            text = re.sub(r"#[A-Za-z0-9_]+", "", text)
+            text = _HASHTAG_RE.sub("", text)
 
         # Remove Reddit-specific formatting
-        text = re.sub(r"/r/[A-Za-z0-9_]+", "", text)  # Subreddit links
-        text = re.sub(r"r/[A-Za-z0-9_]+", "", text)  # Subreddit mentions
-        text = re.sub(r"\*\*(.*?)\*\*", r"\\1", text)  # Bold formatting
-        text = re.sub(r"\*(.*?)\*", r"\\1", text)  # Italic formatting
-        text = re.sub(r"~~(.*?)~~", r"\\1", text)  # Strikethrough
-        text = re.sub(r"`(.*?)`", r"\\1", text)  # Code formatting
+        text = _SUBREDDIT_LINK_RE.sub("", text)  # Subreddit links
+        text = _SUBREDDIT_MENTION_RE.sub("", text)  # Subreddit mentions
+        text = _BOLD_RE.sub(r"\\1", text)  # Bold formatting
+        text = _ITALIC_RE.sub(r"\\1", text)  # Italic formatting
+        text = _STRIKETHROUGH_RE.sub(r"\\1", text)  # Strikethrough
+        text = _CODE_RE.sub(r"\\1", text)  # Code formatting
 
         # Remove special characters and numbers (keep some punctuation)
-        text = re.sub(r"[^a-zA-Z\\s\\.\\!\\?\\,\\;\\:]", "", text)
+        text = _SPECIAL_CHARS_RE.sub("", text)
 
         # Remove extra whitespace
         if remove_extra_whitespace:
-            text = re.sub(r"\\s+", " ", text).strip()
+            text = _WHITESPACE_RE.sub(" ", text).strip()
 
         return text
 
@@ -160,12 +179,13 @@ class TextProcessor:
                 # Simple split as last resort
                 tokens = text.lower().split()
 
-        # Remove stopwords
+        # Remove stopwords and very short tokens in one pass
         if remove_stopwords:
-            tokens = [token for token in tokens if token not in STOP_WORDS]
-
-        # Filter out very short tokens
-        tokens = [token for token in tokens if len(token) > 2]
+            tokens = [
+                token for token in tokens if len(token) > 2 and token not in STOP_WORDS
+            ]
+        else:
+            tokens = [token for token in tokens if len(token) > 2]
 
         return tokens
 
@@ -185,22 +205,33 @@ class TextProcessor:
             return entities
 
         try:
-            doc = self.nlp(text)
-            for ent in doc.ents:
-                entities.append(
-                    {
-                        "text": ent.text,
-                        "label": ent.label_,
-                        "start": ent.start_char,
-                        "end": ent.end_char,
-                        "description": spacy.explain(ent.label_),
-                    }
-                )
+            entities = self.entities_from_doc(self.nlp(text))
         except Exception as e:
             logger.warning(f"Entity extraction failed: {e}")
 
         return entities
 
+    def entities_from_doc(self, doc) -> List[Dict[str, Any]]:
+        """
+        Extract named entities from an already parsed spaCy doc.
+
+        Args:
+            doc: spaCy Doc, e.g. from ``pipe``
+
+        Returns:
+            List of entity dictionaries with text, label, and start/end positions
+        """
+        return [
+            {
+                "text": ent.text,
+                "label": ent.label_,
+                "start": ent.start_char,
+                "end": ent.end_char,
+                "description": spacy.explain(ent.label_),
+            }
+            for ent in doc.ents
+        ]
+
     def extract_keywords(
         self, text: str, max_keywords: int = 10
     ) -> List[Dict[str, float]]:
@@ -220,38 +251,71 @@ class TextProcessor:
             return keywords
 
         try:
-            doc = self.nlp(text)
-
-            # Calculate term frequency for content words
-            word_freq = {}
-            for token in doc:
-                if (
-                    not token.is_stop
-                    and not token.is_punct
-                    and not token.is_space
-                    and len(token.text) > 2
-                    and token.pos_ in ["NOUN", "VERB", "ADJ", "PROPN"]
-                ):
-                    lemma = token.lemma_.lower()
-                    word_freq[lemma] = word_freq.get(lemma, 0) + 1
-
-            # Sort by frequency and return top keywords
-            sorted_words = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)
-
-            for word, freq in sorted_words[:max_keywords]:
-                keywords.append(
-                    {
-                        "keyword": word,
-                        "frequency": freq,
-                        "score": freq / len(doc),  # Normalized score
-                    }
-                )
-
+            keywords = self.keywords_from_doc(self.nlp(text), max_keywords)
         except Exception as e:
             logger.warning(f"Keyword extraction failed: {e}")
 
         return keywords
 
+    def keywords_from_doc(self, doc, max_keywords: int = 10) -> List[Dict[str, float]]:
+        """
+        Extract keywords from an already parsed spaCy doc.
+
+        Args:
+            doc: spaCy Doc, e.g. from ``pipe``
+            max_keywords: Maximum number of keywords to return
+
+        Returns:
+            List of keyword dictionaries with text and importance scores
+        """
+        # Calculate term frequency for content words
+        word_freq = {}
+        for token in doc:
+            if (
+                not token.is_stop
+                and not token.is_punct
+                and not token.is_space
+                and len(token.text) > 2
+                and token.pos_ in KEYWORD_POS_TAGS
+            ):
+                lemma = token.lemma_.lower()
+                word_freq[lemma] = word_freq.get(lemma, 0) + 1
+
+        # Sort by frequency and return top keywords
+        sorted_words = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)
+
+        return [
+            {
+                "keyword": word,
+                "frequency": freq,
+                "score": freq / len(doc),  # Normalized score
+            }
+            for word, freq in sorted_words[:max_keywords]
+        ]
+
+    def pipe(self, texts: List[str], batch_size: int = 32) -> List[Any]:
+        """
+        Parse many texts with spaCy's batched ``nlp.pipe``.
+
+        Large inputs are spread over ``cpu_count - 1`` worker processes.
+
+        Args:
+            texts: Texts to parse
+            batch_size: Number of texts spaCy processes per batch
+
+        Returns:
+            List of spaCy Docs in input order, or ``None`` for every text when
+            no spaCy model is loaded
+        """
+        if not self._nlp:
+            return [None] * len(texts)
+
+        n_process = 1
+        if len(texts) >= PARALLEL_PIPE_MIN_TEXTS:
+            n_process = max(1, (os.cpu_count() or 1) - 1)
+
+        return list(self.nlp.pipe(texts, batch_size=batch_size, n_process=n_process))
+
     def detect_language(self, text: str) -> str:
         """
         Detect the language of the text.
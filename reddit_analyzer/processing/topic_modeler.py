@@ -7,6 +7,7 @@ comprehensive topic discovery and analysis.
 """
 
 import logging
+import os
 from typing import Dict, List, Optional, Any
 import numpy as np
 from datetime import datetime
@@ -41,6 +42,10 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Corpora larger than this fit LDA with one E-step worker per spare core;
+# smaller ones are cheaper to fit in-process
+LDA_PARALLEL_MIN_DOCS = 100
+
 
 class TopicModeler:
     """
@@ -166,13 +171,18 @@ class TopicModeler:
             # Vectorize texts
             doc_term_matrix = self.vectorizer.fit_transform(texts)
 
-            # Fit LDA model
+            # Fit LDA model, spreading the E-step over cores for large corpora
+            n_jobs = None
+            if doc_term_matrix.shape[0] > LDA_PARALLEL_MIN_DOCS:
+                n_jobs = max(1, (os.cpu_count() or 1) - 1)
+
             self.lda_model = LatentDirichletAllocation(
                 n_components=self.n_topics,
                 max_iter=20,
                 learning_method="online",
                 learning_offset=50.0,
                 random_state=self.random_state,
+                n_jobs=n_jobs,
             )
 
             self.lda_model.fit(doc_term_matrix)
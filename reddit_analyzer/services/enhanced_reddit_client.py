@@ -105,7 +105,7 @@ class EnhancedRedditClient(LoggerMixin):
     ) -> Any:
         """Execute a request with caching."""
         # Try cache first
-        cached_result = await self.cache.get(cache_key)
+        cached_result = self.cache.get(cache_key)
         if cached_result is not None:
             self.logger.debug(f"Cache hit for key: {cache_key}")
             return cached_result
@@ -119,7 +119,7 @@ class EnhancedRedditClient(LoggerMixin):
             )
 
         # Cache the result
-        await self.cache.set(cache_key, result, ttl=cache_ttl)
+        self.cache.set(cache_key, result, ttl=cache_ttl)
         return result
 
     async def get_subreddit_info(
@@ -484,7 +484,7 @@ class EnhancedRedditClient(LoggerMixin):
             health_status["overall"] = "degraded"
 
         # Test cache
-        cache_health = await self.cache.health_check()
+        cache_health = self.cache.health_check()
         health_status["cache"] = cache_health["status"]
         if cache_health["status"] != "healthy":
             health_status["overall"] = "degraded"
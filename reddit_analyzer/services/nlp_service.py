@@ -7,6 +7,8 @@ sentiment analysis, topic modeling, keyword extraction, and emotion detection.
 
 import time
 import logging
+import threading
+from functools import lru_cache
 from typing import List, Dict, Any, Optional, Union
 from datetime import datetime
 
@@ -22,6 +24,12 @@ from pathlib import Path
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=4096)
+def _preprocess(text: str) -> str:
+    """Clean text, memoized since titles, crossposts and bot text repeat a lot."""
+    return NLPService().text_processor.clean_text(text)
+
+
 class NLPService:
     """Service for coordinating NLP analysis operations."""
 
@@ -33,6 +41,10 @@ class NLPService:
     _text_processor = None
     _emotion_analyzer = None
 
+    # Guards lazy model loading so a background preload and a caller never
+    # construct the same model twice
+    _load_lock = threading.RLock()
+
     def __new__(cls):
         """Implement singleton pattern for model caching."""
         if cls._instance is None:
@@ -52,42 +64,74 @@ class NLPService:
     def sentiment_analyzer(self) -> SentimentAnalyzer:
         """Lazy-load sentiment analyzer."""
         if NLPService._sentiment_analyzer is None:
-            logger.info("Loading sentiment analyzer...")
-            NLPService._sentiment_analyzer = SentimentAnalyzer()
+            with NLPService._load_lock:
+                if NLPService._sentiment_analyzer is None:
+                    logger.info("Loading sentiment analyzer...")
+                    NLPService._sentiment_analyzer = SentimentAnalyzer()
         return NLPService._sentiment_analyzer
 
     @property
     def topic_modeler(self) -> TopicModeler:
         """Lazy-load topic modeler."""
         if NLPService._topic_modeler is None:
-            logger.info("Loading topic modeler...")
-            NLPService._topic_modeler = TopicModeler()
+            with NLPService._load_lock:
+                if NLPService._topic_modeler is None:
+                    logger.info("Loading topic modeler...")
+                    NLPService._topic_modeler = TopicModeler()
         return NLPService._topic_modeler
 
     @property
     def feature_extractor(self) -> FeatureExtractor:
         """Lazy-load feature extractor."""
         if NLPService._feature_extractor is None:
-            logger.info("Loading feature extractor...")
-            NLPService._feature_extractor = FeatureExtractor()
+            with NLPService._load_lock:
+                if NLPService._feature_extractor is None:
+                    logger.info("Loading feature extractor...")
+                    NLPService._feature_extractor = FeatureExtractor()
         return NLPService._feature_extractor
 
     @property
     def text_processor(self) -> TextProcessor:
         """Lazy-load text processor."""
         if NLPService._text_processor is None:
-            logger.info("Loading text processor...")
-            NLPService._text_processor = TextProcessor()
+            with NLPService._load_lock:
+                if NLPService._text_processor is None:
+                    logger.info("Loading text processor...")
+                    NLPService._text_processor = TextProcessor()
         return NLPService._text_processor
 
     @property
     def emotion_analyzer(self) -> EmotionAnalyzer:
         """Lazy-load emotion analyzer."""
         if NLPService._emotion_analyzer is None:
-            logger.info("Loading emotion analyzer...")
-            NLPService._emotion_analyzer = EmotionAnalyzer()
+            with NLPService._load_lock:
+                if NLPService._emotion_analyzer is None:
+                    logger.info("Loading emotion analyzer...")
+                    NLPService._emotion_analyzer = EmotionAnalyzer()
         return NLPService._emotion_analyzer
 
+    def preload_in_background(self) -> threading.Thread:
+        """
+        Start loading the spaCy-backed text processor on a daemon thread.
+
+        Lets commands overlap the model load with their database queries.
+
+        Returns:
+            The started preload thread
+        """
+        thread = threading.Thread(
+            target=self._preload_text_processor, name="nlp-preload", daemon=True
+        )
+        thread.start()
+        return thread
+
+    def _preload_text_processor(self) -> None:
+        """Load the text processor, logging rather than raising on failure."""
+        try:
+            self.text_processor
+        except Exception as e:
+            logger.warning(f"Background model preload failed: {e}")
+
     def analyze_text(
         self, text: str, post_id: Optional[str] = None, comment_id: Optional[str] = None
     ) -> Dict[str, Any]:
@@ -112,18 +156,55 @@ class NLPService:
 
         try:
             # Clean and process text
-            processed_text = self.text_processor.clean_text(text)
+            processed_text = _preprocess(text)
+        except Exception as e:
+            logger.error(f"Error analyzing text: {e}")
+            return self._error_analysis(str(e))
+
+        return self._analyze_processed(
+            text, processed_text, None, start_time, post_id, comment_id
+        )
+
+    def _analyze_processed(
+        self,
+        text: str,
+        processed_text: str,
+        doc: Any,
+        start_time: float,
+        post_id: Optional[str] = None,
+        comment_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Run the analysis pipeline on an already cleaned text.
 
+        Args:
+            text: Original text
+            processed_text: Output of ``TextProcessor.clean_text``
+            doc: spaCy Doc for ``processed_text``, or None to parse on demand
+            start_time: Timestamp used to compute processing time
+            post_id: Optional post ID for database storage
+            comment_id: Optional comment ID for database storage
+
+        Returns:
+            Dictionary containing all analysis results
+        """
+        try:
             # Sentiment analysis
             sentiment_result = self.sentiment_analyzer.analyze(processed_text)
 
             # Extract keywords and entities
-            keyword_data = self.text_processor.extract_keywords(
-                processed_text, max_keywords=10
-            )
+            if doc is not None:
+                keyword_data = self.text_processor.keywords_from_doc(
+                    doc, max_keywords=10
+                )
+                entities = self.text_processor.entities_from_doc(doc)
+            else:
+                keyword_data = self.text_processor.extract_keywords(
+                    processed_text, max_keywords=10
+                )
+                entities = self.text_processor.extract_entities(processed_text)
             # Extract just the keyword text
             keywords = [kw["keyword"] for kw in keyword_data] if keyword_data else []
-            entities = self.text_processor.extract_entities(processed_text)
 
             # Language detection
             language = self.text_processor.detect_language(processed_text)
@@ -181,14 +262,22 @@ class NLPService:
             return self._error_analysis(str(e))
 
     def analyze_batch(
-        self, texts: List[str], post_ids: Optional[List[str]] = None
+        self,
+        texts: List[str],
+        post_ids: Optional[List[str]] = None,
+        batch_size: int = 32,
     ) -> List[Dict[str, Any]]:
         """
         Analyze multiple texts in batch for efficiency.
 
+        All texts are cleaned first and then parsed together with spaCy's
+        ``nlp.pipe`` so the tokenizer and tagger run over whole batches instead
+        of once per text.
+
         Args:
             texts: List of texts to analyze
             post_ids: Optional list of corresponding post IDs
+            batch_size: Number of texts spaCy parses per batch
 
         Returns:
             List of analysis results
@@ -201,11 +290,33 @@ class NLPService:
             logger.warning("post_ids length doesn't match texts length")
             post_ids = None
 
-        results = []
+        results: List[Optional[Dict[str, Any]]] = [None] * len(texts)
+        pending = []
         for i, text in enumerate(texts):
-            post_id = post_ids[i] if post_ids else None
-            result = self.analyze_text(text, post_id)
-            results.append(result)
+            if not text or not text.strip():
+                results[i] = self.analyze_text(text, post_ids[i] if post_ids else None)
+                continue
+            try:
+                pending.append((i, _preprocess(text)))
+            except Exception as e:
+                logger.error(f"Error analyzing text: {e}")
+                results[i] = self._error_analysis(str(e))
+
+        processed = [processed_text for _, processed_text in pending]
+        try:
+            docs = self.text_processor.pipe(processed, batch_size=batch_size)
+        except Exception as e:
+            logger.warning(f"Batch parsing failed, parsing texts one by one: {e}")
+            docs = [None] * len(processed)
+
+        for (i, processed_text), doc in zip(pending, docs):
+            results[i] = self._analyze_processed(
+                texts[i],
+                processed_text,
+                doc,
+                time.time(),
+                post_ids[i] if post_ids else None,
+            )
 
         return results
 
@@ -228,7 +339,7 @@ class NLPService:
                 # Skip if already analyzed and not reanalyzing
                 if not reanalyze:
                     existing = (
-                        db.query(TextAnalysis)
+                        db.query(TextAnalysis.id)
                         .filter(TextAnalysis.post_id == post.id)
                         .first()
                     )
@@ -254,6 +365,11 @@ class NLPService:
 
         return analyzed_count
 
+    def clear_preprocess_cache(self) -> None:
+        """Log hit statistics for the text preprocessing cache and empty it."""
+        logger.debug(f"Preprocess cache: {_preprocess.cache_info()}")
+        _preprocess.cache_clear()
+
     def fit_topic_model(self, texts: List[str], num_topics: int = 10) -> bool:
         """
         Fit topic model on a collection of texts.
@@ -267,7 +383,7 @@ class NLPService:
         """
         try:
             # Clean texts
-            processed_texts = [self.text_processor.clean_text(text) for text in texts]
+            processed_texts = [_preprocess(text) for text in texts]
 
             # Fit topic model
             self.topic_modeler.fit(processed_texts, num_topics=num_topics)
@@ -1,7 +1,9 @@
 """Reddit API client using PRAW."""
 
+import threading
+
 import praw
-from typing import List, Optional, Dict, Any
+from typing import Iterator, List, Optional, Dict, Any
 from datetime import datetime
 
 from reddit_analyzer.config import get_config
@@ -29,6 +31,15 @@ class RedditClient(LoggerMixin):
             password=config.REDDIT_PASSWORD,
         )
 
+        # Per-client memo of subreddit/user lookups so repeated authors in a
+        # collection run don't trigger another API round-trip
+        self._subreddit_info_cache: Dict[str, Dict[str, Any]] = {}
+        self._user_info_cache: Dict[str, Dict[str, Any]] = {}
+
+        # PRAW isn't thread-safe; serializes API access when a listing is
+        # being consumed from a background thread (see iter_subreddit_posts)
+        self._api_lock = threading.RLock()
+
         # Test authentication
         try:
             # This will raise an exception if authentication fails
@@ -40,10 +51,14 @@ class RedditClient(LoggerMixin):
 
     def get_subreddit_info(self, subreddit_name: str) -> Dict[str, Any]:
         """Get subreddit information."""
+        cached = self._subreddit_info_cache.get(subreddit_name)
+        if cached is not None:
+            return cached
+
         try:
             subreddit = self.reddit.subreddit(subreddit_name)
 
-            return {
+            info = {
                 "name": subreddit.display_name,
                 "display_name": subreddit.display_name_prefixed,
                 "description": subreddit.description,
@@ -51,6 +66,8 @@ class RedditClient(LoggerMixin):
                 "created_utc": datetime.fromtimestamp(subreddit.created_utc),
                 "is_nsfw": subreddit.over18,
             }
+            self._subreddit_info_cache[subreddit_name] = info
+            return info
         except Exception as e:
             self.logger.error(
                 f"Error fetching subreddit info for {subreddit_name}: {e}"
@@ -65,6 +82,26 @@ class RedditClient(LoggerMixin):
         time_filter: str = "all",
     ) -> List[Dict[str, Any]]:
         """Get posts from a subreddit."""
+        post_data = list(
+            self.iter_subreddit_posts(
+                subreddit_name, sort=sort, limit=limit, time_filter=time_filter
+            )
+        )
+        self.logger.info(f"Fetched {len(post_data)} posts from r/{subreddit_name}")
+        return post_data
+
+    def iter_subreddit_posts(
+        self,
+        subreddit_name: str,
+        sort: str = "hot",
+        limit: int = 100,
+        time_filter: str = "all",
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield posts from a subreddit as PRAW pages them in.
+
+        Lets callers start processing the first page while later pages are
+        still being fetched.
+        """
         try:
             subreddit = self.reddit.subreddit(subreddit_name)
 
@@ -80,27 +117,30 @@ class RedditClient(LoggerMixin):
             else:
                 raise ValueError(f"Invalid sort method: {sort}")
 
-            post_data = []
-            for post in posts:
-                post_dict = {
-                    "id": post.id,
-                    "title": post.title,
-                    "selftext": post.selftext,
-                    "url": post.url,
-                    "author": post.author.name if post.author else "[deleted]",
-                    "subreddit": post.subreddit.display_name,
-                    "score": post.score,
-                    "upvote_ratio": post.upvote_ratio,
-                    "num_comments": post.num_comments,
-                    "created_utc": datetime.fromtimestamp(post.created_utc),
-                    "is_self": post.is_self,
-                    "is_nsfw": post.over_18,
-                    "is_locked": post.locked,
-                }
-                post_data.append(post_dict)
-
-            self.logger.info(f"Fetched {len(post_data)} posts from r/{subreddit_name}")
-            return post_data
+            posts = iter(posts)
+            while True:
+                with self._api_lock:
+                    post = next(posts, None)
+                    if post is None:
+                        break
+
+                    post_dict = {
+                        "id": post.id,
+                        "title": post.title,
+                        "selftext": post.selftext,
+                        "url": post.url,
+                        "author": post.author.name if post.author else "[deleted]",
+                        "subreddit": post.subreddit.display_name,
+                        "score": post.score,
+                        "upvote_ratio": post.upvote_ratio,
+                        "num_comments": post.num_comments,
+                        "created_utc": datetime.fromtimestamp(post.created_utc),
+                        "is_self": post.is_self,
+                        "is_nsfw": post.over_18,
+                        "is_locked": post.locked,
+                    }
+
+                yield post_dict
 
         except Exception as e:
             self.logger.error(f"Error fetching posts from r/{subreddit_name}: {e}")
@@ -133,44 +173,46 @@ class RedditClient(LoggerMixin):
 
             comment_data = []
 
-            def process_comment(comment, current_depth=0):
-                """Recursively process comments and their replies."""
+            # Walk the comment tree depth-first with an explicit stack rather
+            # than recursion; children are pushed in reverse so they are
+            # visited in the same order PRAW returns them.
+            stack = [(comment, 0) for comment in reversed(list(submission.comments))]
+            while stack and len(comment_data) < limit:
+                comment, current_depth = stack.pop()
+
                 if current_depth > depth:
-                    return
+                    continue
 
                 if not hasattr(comment, "body"):
-                    return
+                    continue
 
                 # Apply min_score filter
                 if min_score is not None and comment.score < min_score:
-                    return
-
-                comment_dict = {
-                    "id": comment.id,
-                    "post_id": post_id,
-                    "parent_id": comment.parent_id,
-                    "author": (comment.author.name if comment.author else "[deleted]"),
-                    "body": comment.body,
-                    "score": comment.score,
-                    "created_utc": datetime.fromtimestamp(comment.created_utc),
-                    "edited": bool(comment.edited),
-                    "is_deleted": comment.body == "[deleted]",
-                    "depth": current_depth,
-                }
-                comment_data.append(comment_dict)
+                    continue
 
-                # Process replies
-                if hasattr(comment, "replies"):
-                    for reply in comment.replies:
-                        if len(comment_data) >= limit:
-                            break
-                        process_comment(reply, current_depth + 1)
-
-            # Process all top-level comments
-            for comment in submission.comments:
-                if len(comment_data) >= limit:
-                    break
-                process_comment(comment)
+                comment_data.append(
+                    {
+                        "id": comment.id,
+                        "post_id": post_id,
+                        "parent_id": comment.parent_id,
+                        "author": (
+                            comment.author.name if comment.author else "[deleted]"
+                        ),
+                        "body": comment.body,
+                        "score": comment.score,
+                        "created_utc": datetime.fromtimestamp(comment.created_utc),
+                        "edited": bool(comment.edited),
+                        "is_deleted": comment.body == "[deleted]",
+                        "depth": current_depth,
+                    }
+                )
+
+                # Queue replies
+                if current_depth < depth and hasattr(comment, "replies"):
+                    stack.extend(
+                        (reply, current_depth + 1)
+                        for reply in reversed(list(comment.replies))
+                    )
 
             self.logger.info(
                 f"Fetched {len(comment_data)} comments for post {post_id} "
@@ -235,18 +277,25 @@ class RedditClient(LoggerMixin):
 
     def get_user_info(self, username: str) -> Dict[str, Any]:
         """Get user information."""
+        cached = self._user_info_cache.get(username)
+        if cached is not None:
+            return cached
+
         try:
-            redditor = self.reddit.redditor(username)
-
-            return {
-                "username": redditor.name,
-                "created_utc": datetime.fromtimestamp(redditor.created_utc),
-                "comment_karma": redditor.comment_karma,
-                "link_karma": redditor.link_karma,
-                "is_verified": (
-                    redditor.verified if hasattr(redditor, "verified") else False
-                ),
-            }
+            with self._api_lock:
+                redditor = self.reddit.redditor(username)
+
+                info = {
+                    "username": redditor.name,
+                    "created_utc": datetime.fromtimestamp(redditor.created_utc),
+                    "comment_karma": redditor.comment_karma,
+                    "link_karma": redditor.link_karma,
+                    "is_verified": (
+                        redditor.verified if hasattr(redditor, "verified") else False
+                    ),
+                }
+            self._user_info_cache[username] = info
+            return info
         except Exception as e:
             self.logger.error(f"Error fetching user info for {username}: {e}")
             raise
@@ -13,6 +13,7 @@ from sqlalchemy.orm import Session
 from sqlalchemy import func
 
 from reddit_analyzer.database import get_db
+from reddit_analyzer.dataloaders import load_first
 from reddit_analyzer.models import (
     Post,
     Comment,
@@ -399,10 +400,12 @@ def detect_trending_topics(
         trending_topics.sort(key=lambda x: x["trend_score"], reverse=True)
 
         # Update trend scores in database
-        for i, topic_data in enumerate(trending_topics[:20]):  # Top 20
-            topic = (
-                db.query(Topic).filter(Topic.topic_id == topic_data["topic_id"]).first()
-            )
+        top_trending = trending_topics[:20]  # Top 20
+        topics_by_id = load_first(
+            db, Topic.topic_id, [topic_data["topic_id"] for topic_data in top_trending]
+        )
+        for topic_data in top_trending:
+            topic = topics_by_id.get(topic_data["topic_id"])
             if topic:
                 topic.trend_score = topic_data["trend_score"]
 
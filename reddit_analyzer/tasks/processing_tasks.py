@@ -10,8 +10,10 @@ from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta
 from celery import current_app
 
+from reddit_analyzer.core.entity_cache import get_users
 from reddit_analyzer.database import get_db
-from reddit_analyzer.models import Post, Comment, TextAnalysis, Topic, UserMetric, User
+from reddit_analyzer.dataloaders import load_first, load_grouped
+from reddit_analyzer.models import Post, Comment, TextAnalysis, Topic, UserMetric
 from reddit_analyzer.processing.text_processor import TextProcessor
 from reddit_analyzer.processing.sentiment_analyzer import SentimentAnalyzer
 from reddit_analyzer.processing.topic_modeler import TopicModeler
@@ -87,6 +89,13 @@ def process_text_batch(
         else:
             content_items = db.query(Comment).filter(Comment.id.in_(content_ids)).all()
 
+        # Existing analyses for the whole batch, keyed by content id
+        existing_analyses = load_first(
+            db,
+            getattr(TextAnalysis, f"{content_type}_id"),
+            [item.id for item in content_items],
+        )
+
         for item in content_items:
             try:
                 # Extract text content
@@ -103,11 +112,7 @@ def process_text_batch(
                 sentiment_results = sentiment_analyzer.analyze(text)
 
                 # Store results in database
-                existing_analysis = (
-                    db.query(TextAnalysis)
-                    .filter(getattr(TextAnalysis, f"{content_type}_id") == item.id)
-                    .first()
-                )
+                existing_analysis = existing_analyses.get(item.id)
 
                 if existing_analysis:
                     # Update existing analysis
@@ -454,7 +459,7 @@ def train_ml_models(
 
         elif model_type == "classification":
             model = ContentClassifier(
-                model_type=training_config.get("algorithm", "random_forest"),
+                model_type=training_config.get("algorithm"),
                 categories=training_config.get("categories"),
             )
 
@@ -509,27 +514,29 @@ def calculate_user_metrics(
 
         cutoff_date = datetime.utcnow() - timedelta(days=time_period_days)
 
+        # Load users, their recent content and existing metrics for the whole
+        # batch up front instead of four queries per user
+        users = get_users(db, user_ids)
+        posts_by_user = load_grouped(
+            db, Post.author_id, user_ids, Post.created_utc >= cutoff_date
+        )
+        comments_by_user = load_grouped(
+            db, Comment.author_id, user_ids, Comment.created_utc >= cutoff_date
+        )
+        existing_metrics = load_first(
+            db, UserMetric.user_id, user_ids, UserMetric.period_start >= cutoff_date
+        )
+
         for user_id in user_ids:
             try:
                 # Get user data
-                user = db.query(User).filter(User.id == user_id).first()
+                user = users.get(user_id)
                 if not user:
                     continue
 
                 # Get user's posts and comments
-                posts = (
-                    db.query(Post)
-                    .filter(Post.author_id == user_id, Post.created_utc >= cutoff_date)
-                    .all()
-                )
-
-                comments = (
-                    db.query(Comment)
-                    .filter(
-                        Comment.author_id == user_id, Comment.created_utc >= cutoff_date
-                    )
-                    .all()
-                )
+                posts = posts_by_user.get(user_id, [])
+                comments = comments_by_user.get(user_id, [])
 
                 # Prepare data for metrics calculation
                 user_data = {
@@ -569,14 +576,7 @@ def calculate_user_metrics(
                 metrics = metrics_calc.calculate_user_metrics(user_data)
 
                 # Store metrics in database
-                existing_metric = (
-                    db.query(UserMetric)
-                    .filter(
-                        UserMetric.user_id == user_id,
-                        UserMetric.period_start >= cutoff_date,
-                    )
-                    .first()
-                )
+                existing_metric = existing_metrics.get(user_id)
 
                 if existing_metric:
                     # Update existing metrics
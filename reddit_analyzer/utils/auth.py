@@ -2,6 +2,7 @@
 
 import jwt
 import secrets
+from functools import lru_cache
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
 from reddit_analyzer.models.user import User, UserRole
@@ -146,5 +147,11 @@ def get_auth_service(secret_key: Optional[str] = None) -> AuthService:
     if secret_key is None:
         secret_key = config.SECRET_KEY
 
+    return _build_auth_service(secret_key)
+
+
+@lru_cache(maxsize=8)
+def _build_auth_service(secret_key: Optional[str]) -> AuthService:
+    """Build one stateless authentication service per secret key."""
     token_manager = AuthTokenManager(secret_key)
     return AuthService(token_manager)
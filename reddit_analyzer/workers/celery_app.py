@@ -1,6 +1,7 @@
 """Celery application configuration for Reddit Analyzer."""
 
 from celery import Celery
+from celery.schedules import crontab
 from reddit_analyzer.config import get_settings
 
 settings = get_settings()
@@ -65,6 +66,14 @@ celery_app.conf.update(
             "task": "app.workers.tasks.cleanup_old_results",
             "schedule": 3600.0,  # Every hour
         },
+        "maintain-metric-partitions": {
+            "task": "app.workers.tasks.maintain_metric_partitions",
+            "schedule": 86400.0,  # Daily
+        },
+        "rollup-collection-summaries": {
+            "task": "app.workers.tasks.rollup_collection_summaries",
+            "schedule": crontab(hour=0, minute=15),  # Daily, after midnight UTC
+        },
     },
 )
 
@@ -1,7 +1,7 @@
 """Celery tasks for Reddit data collection."""
 
 import asyncio
-from datetime import datetime
+from datetime import date, datetime, timedelta
 from typing import Dict, List, Any
 import structlog
 
@@ -10,10 +10,18 @@ from reddit_analyzer.services.enhanced_reddit_client import EnhancedRedditClient
 from reddit_analyzer.core.rate_limiter import RateLimitConfig
 from reddit_analyzer.database import get_db_session
 from reddit_analyzer.models import Post, Comment, User, Subreddit
+from reddit_analyzer.models.collection_job import (
+    drop_metric_partitions_before,
+    ensure_metric_partitions,
+    rollup_collection_summary,
+)
 
 # Configure structured logging
 logger = structlog.get_logger(__name__)
 
+# How long API request and system metric rows are kept, in days
+METRIC_RETENTION_DAYS = 90
+
 
 def get_reddit_client() -> EnhancedRedditClient:
     """Get configured Reddit client instance."""
@@ -565,3 +573,53 @@ def cleanup_old_results() -> Dict[str, Any]:
     except Exception as exc:
         logger.error("Cleanup failed", error=str(exc))
         return {"status": "failed", "error": str(exc)}
+
+
+@celery_app.task
+def maintain_metric_partitions() -> Dict[str, Any]:
+    """Create upcoming metric partitions and drop the expired ones."""
+    try:
+        cutoff = datetime.utcnow() - timedelta(days=METRIC_RETENTION_DAYS)
+
+        with get_db_session() as db:
+            created = ensure_metric_partitions(db)
+            dropped = drop_metric_partitions_before(db, cutoff)
+            db.commit()
+
+        logger.info(
+            "Metric partitions maintained",
+            partitions=len(created),
+            dropped=dropped,
+        )
+
+        return {
+            "status": "success",
+            "partitions": created,
+            "dropped": dropped,
+        }
+
+    except Exception as exc:
+        logger.error("Metric partition maintenance failed", error=str(exc))
+        return {"status": "failed", "error": str(exc)}
+
+
+@celery_app.task
+def rollup_collection_summaries(day: str = None) -> Dict[str, Any]:
+    """Compute the daily collection summaries, by default for yesterday."""
+    try:
+        if day:
+            summary_day = date.fromisoformat(day)
+        else:
+            summary_day = datetime.utcnow().date() - timedelta(days=1)
+
+        with get_db_session() as db:
+            rollup_collection_summary(db, summary_day)
+            db.commit()
+
+        logger.info("Collection summaries rolled up", day=summary_day.isoformat())
+
+        return {"status": "success", "day": summary_day.isoformat()}
+
+    except Exception as exc:
+        logger.error("Collection summary rollup failed", error=str(exc))
+        return {"status": "failed", "error": str(exc)}
@@ -3,8 +3,8 @@
 import os
 import glob
 import pytest
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import raiseload, sessionmaker
 from sqlalchemy.pool import StaticPool
 
 # Import all models first to ensure they're registered with Base
@@ -61,6 +61,23 @@ def override_get_db(test_db):
     return _override_get_db
 
 
+@pytest.fixture(scope="function")
+def strict_db(test_db):
+    """Test session where every relationship must be loaded explicitly.
+
+    Adds ``raiseload("*")`` to each ORM query, so any lazy load the code under
+    test relies on raises instead of silently issuing one SELECT per row.
+    """
+
+    @event.listens_for(test_db, "do_orm_execute")
+    def _raiseload_all(state):
+        if state.is_select and not state.is_relationship_load:
+            state.statement = state.statement.options(raiseload("*"))
+
+    yield test_db
+    event.remove(test_db, "do_orm_execute", _raiseload_all)
+
+
 # Alias for compatibility with existing tests
 @pytest.fixture(scope="function")
 def db_session(test_db):
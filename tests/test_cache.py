@@ -1,8 +1,15 @@
 """Tests for Redis cache functionality."""
 
+import json
+import subprocess
+import sys
 import pytest
 from unittest.mock import Mock, patch
 from reddit_analyzer.core.cache import RedisCache, CacheConfig
+from reddit_analyzer.core import entity_cache as entity_cache_module
+from reddit_analyzer.core.entity_cache import EntityCache
+from reddit_analyzer.models import User
+from reddit_analyzer.models.user import UserRole
 
 
 class TestRedisCache:
@@ -11,7 +18,7 @@ class TestRedisCache:
     @pytest.fixture
     def mock_redis(self):
         """Create a mock Redis client."""
-        with patch("app.core.cache.redis.from_url") as mock_redis_client:
+        with patch("reddit_analyzer.core.cache.redis.Redis") as mock_redis_client:
             mock_client = Mock()
             mock_redis_client.return_value = mock_client
             mock_client.ping.return_value = True
@@ -30,72 +37,65 @@ class TestRedisCache:
     @pytest.fixture
     def redis_cache(self, mock_redis, cache_config):
         """Create Redis cache instance for testing."""
-        with patch("app.core.cache.get_settings") as mock_settings:
+        with patch("reddit_analyzer.core.cache.get_settings") as mock_settings:
             mock_settings.return_value.redis_url = "redis://localhost:6379/1"
             cache = RedisCache(cache_config)
             return cache
 
-    @pytest.mark.asyncio
-    async def test_cache_set_get(self, redis_cache, mock_redis):
+    def test_cache_set_get(self, redis_cache, mock_redis):
         """Test basic cache set/get operations."""
         # Mock Redis responses
         mock_redis.set.return_value = True
         mock_redis.get.return_value = b'{"test": "data"}'
 
         # Test set operation
-        result = await redis_cache.set("test_key", {"test": "data"}, ttl=300)
+        result = redis_cache.set("test_key", {"test": "data"}, ttl=300)
         assert result is True
 
         # Test get operation
-        cached_data = await redis_cache.get("test_key")
+        cached_data = redis_cache.get("test_key")
         assert cached_data == {"test": "data"}
 
-    @pytest.mark.asyncio
-    async def test_cache_delete(self, redis_cache, mock_redis):
+    def test_cache_delete(self, redis_cache, mock_redis):
         """Test cache delete operation."""
         mock_redis.delete.return_value = 1
 
-        result = await redis_cache.delete("test_key")
+        result = redis_cache.delete("test_key")
         assert result is True
 
-    @pytest.mark.asyncio
-    async def test_cache_exists(self, redis_cache, mock_redis):
+    def test_cache_exists(self, redis_cache, mock_redis):
         """Test cache key existence check."""
         mock_redis.exists.return_value = 1
 
-        result = await redis_cache.exists("test_key")
+        result = redis_cache.exists("test_key")
         assert result is True
 
-    @pytest.mark.asyncio
-    async def test_cache_ttl(self, redis_cache, mock_redis):
+    def test_cache_ttl(self, redis_cache, mock_redis):
         """Test TTL functionality."""
         mock_redis.ttl.return_value = 300
 
-        ttl = await redis_cache.ttl("test_key")
+        ttl = redis_cache.ttl("test_key")
         assert ttl == 300
 
-    @pytest.mark.asyncio
-    async def test_cache_expire(self, redis_cache, mock_redis):
+    def test_cache_expire(self, redis_cache, mock_redis):
         """Test cache expiration setting."""
         mock_redis.expire.return_value = True
 
-        result = await redis_cache.expire("test_key", 600)
+        result = redis_cache.expire("test_key", 600)
         assert result is True
 
-    @pytest.mark.asyncio
-    async def test_cache_increment(self, redis_cache, mock_redis):
+    def test_cache_increment(self, redis_cache, mock_redis):
         """Test cache increment operation."""
         mock_redis.incrby.return_value = 5
 
-        result = await redis_cache.increment("counter_key", 2)
+        result = redis_cache.increment("counter_key", 2)
         assert result == 5
 
-    @pytest.mark.asyncio
-    async def test_cache_get_many(self, redis_cache, mock_redis):
+    def test_cache_get_many(self, redis_cache, mock_redis):
         """Test batch get operation."""
         mock_redis.mget.return_value = [b'{"data": 1}', b'{"data": 2}', None]
 
-        result = await redis_cache.get_many(["key1", "key2", "key3"])
+        result = redis_cache.get_many(["key1", "key2", "key3"])
 
         assert "key1" in result
         assert "key2" in result
@@ -103,25 +103,52 @@ class TestRedisCache:
         assert result["key1"] == {"data": 1}
         assert result["key2"] == {"data": 2}
 
-    @pytest.mark.asyncio
-    async def test_cache_set_many(self, redis_cache, mock_redis):
+    def test_recent_reads_served_in_process(self, redis_cache, mock_redis):
+        """Test repeated reads skip Redis until the key is written."""
+        mock_redis.get.return_value = b'{"test": "data"}'
+
+        assert redis_cache.get("hot_key") == {"test": "data"}
+        assert redis_cache.get("hot_key") == {"test": "data"}
+        assert mock_redis.get.call_count == 1
+
+        # get_many only fetches what isn't held locally
+        mock_redis.mget.return_value = [b'{"data": 2}']
+        result = redis_cache.get_many(["hot_key", "cold_key"])
+        assert result == {"hot_key": {"test": "data"}, "cold_key": {"data": 2}}
+        mock_redis.mget.assert_called_once_with(["test_cache:cold_key"])
+
+        # Writes drop the local copy
+        mock_redis.set.return_value = True
+        redis_cache.set("hot_key", {"test": "new"})
+        redis_cache.get("hot_key")
+        assert mock_redis.get.call_count == 2
+
+    def test_cache_set_many(self, redis_cache, mock_redis):
         """Test batch set operation."""
-        mock_pipeline = Mock()
-        mock_pipeline.execute.return_value = [True, True, True]
-        mock_redis.pipeline.return_value = mock_pipeline
+        set_many_script = mock_redis.register_script.return_value
+        set_many_script.return_value = 3
 
         mapping = {"key1": {"data": 1}, "key2": {"data": 2}, "key3": {"data": 3}}
 
-        result = await redis_cache.set_many(mapping, ttl=300)
+        result = redis_cache.set_many(mapping, ttl=300)
         assert result is True
 
-    @pytest.mark.asyncio
-    async def test_cache_flush_pattern(self, redis_cache, mock_redis):
+        _, kwargs = set_many_script.call_args
+        assert kwargs["keys"] == [
+            "test_cache:key1",
+            "test_cache:key2",
+            "test_cache:key3",
+        ]
+        assert kwargs["args"][0] == 300
+
+    def test_cache_flush_pattern(self, redis_cache, mock_redis):
         """Test pattern-based cache clearing."""
-        mock_redis.keys.return_value = ["test_cache:key1", "test_cache:key2"]
-        mock_redis.delete.return_value = 2
+        mock_redis.scan.return_value = (0, ["test_cache:key1", "test_cache:key2"])
+        mock_pipeline = Mock()
+        mock_pipeline.execute.return_value = [2]
+        mock_redis.pipeline.return_value = mock_pipeline
 
-        result = await redis_cache.flush_pattern("*")
+        result = redis_cache.flush_pattern("*")
         assert result == 2
 
     def test_cache_key_generation(self, redis_cache):
@@ -164,14 +191,13 @@ class TestRedisCache:
         assert "used_memory" in stats
         assert "keyspace_hits" in stats
 
-    @pytest.mark.asyncio
-    async def test_health_check(self, redis_cache, mock_redis):
+    def test_health_check(self, redis_cache, mock_redis):
         """Test cache health check."""
         mock_redis.set.return_value = True
         mock_redis.get.return_value = b'{"timestamp": 1234567890, "test": true}'
         mock_redis.delete.return_value = 1
 
-        health_result = await redis_cache.health_check()
+        health_result = redis_cache.health_check()
 
         assert health_result["status"] == "healthy"
         assert "response_time_ms" in health_result
@@ -190,3 +216,84 @@ class TestRedisCache:
             # Compression was applied
             deserialized = redis_cache._deserialize_value(serialized)
             assert deserialized == large_data
+
+
+class _DictCache:
+    """In-memory stand-in for RedisCache's batch interface."""
+
+    def __init__(self):
+        self.data = {}
+
+    def get_many(self, keys):
+        return {k: json.loads(self.data[k]) for k in keys if k in self.data}
+
+    def set_many(self, mapping, ttl=None):
+        self.data.update({k: json.dumps(v) for k, v in mapping.items()})
+        return True
+
+    def delete(self, key):
+        return self.data.pop(key, None) is not None
+
+
+class TestEntityCache:
+    """Test the Subreddit/User read-through cache."""
+
+    def test_get_many_reads_through_and_invalidates(self, test_db):
+        """Test misses load from the database and writes drop the key."""
+        user = User(username="cached", role=UserRole.MODERATOR)
+        test_db.add(user)
+        test_db.commit()
+        user_id = user.id
+
+        backend = _DictCache()
+        entity_cache = EntityCache(backend)
+
+        # Miss: loaded from the database and written back
+        loaded = entity_cache.get_many(test_db, User, [user_id, 999])
+        assert list(loaded) == [user_id]
+        assert f"user:{user_id}" in backend.data
+        assert "password_hash" not in json.loads(backend.data[f"user:{user_id}"])
+
+        # Hit: rebuilt from the cached values without a query
+        test_db.expunge_all()
+        cached = entity_cache.get_many(test_db, User, [user_id])[user_id]
+        assert cached.username == "cached"
+        assert cached.role is UserRole.MODERATOR
+        assert cached.created_at == user.created_at
+
+        # Committed updates delete the cached key
+        with patch(
+            "reddit_analyzer.core.entity_cache.get_entity_cache",
+            return_value=entity_cache,
+        ):
+            stored = test_db.get(User, user_id)
+            stored.comment_karma = 10
+            test_db.commit()
+        assert f"user:{user_id}" not in backend.data
+
+    def test_models_import_registers_invalidation(self):
+        """Test the commit hooks are active without importing this module."""
+        code = (
+            "import sys; import reddit_analyzer.models; "
+            "from sqlalchemy import event; from sqlalchemy.orm import Session; "
+            "hooks = sys.modules['reddit_analyzer.core.entity_cache']; "
+            "assert event.contains("
+            "Session, 'after_commit', hooks._invalidate_changed_entities)"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_failed_setup_is_not_retried_per_call(self, monkeypatch):
+        """Test an unavailable Redis is remembered until the retry window ends."""
+        monkeypatch.setattr(entity_cache_module, "_entity_cache", None)
+        monkeypatch.setattr(entity_cache_module, "_disabled_until", 0.0)
+        get_cache = Mock(side_effect=ConnectionError("down"))
+        monkeypatch.setattr(entity_cache_module, "get_cache", get_cache)
+
+        assert entity_cache_module.get_entity_cache() is None
+        assert entity_cache_module.get_entity_cache() is None
+        assert get_cache.call_count == 1
+
+        # Once the window has passed, setup is attempted again
+        monkeypatch.setattr(entity_cache_module, "_disabled_until", 0.0)
+        assert entity_cache_module.get_entity_cache() is None
+        assert get_cache.call_count == 2
@@ -1,7 +1,7 @@
 """Tests for enhanced Reddit client functionality."""
 
 import pytest
-from unittest.mock import Mock, patch, AsyncMock
+from unittest.mock import Mock, patch
 from reddit_analyzer.services.enhanced_reddit_client import EnhancedRedditClient
 from reddit_analyzer.core.rate_limiter import RateLimitConfig
 
@@ -41,9 +41,9 @@ class TestEnhancedRedditClient:
         """Mock cache."""
         with patch("app.services.enhanced_reddit_client.get_cache") as mock_cache:
             cache = Mock()
-            cache.get = AsyncMock(return_value=None)
-            cache.set = AsyncMock(return_value=True)
-            cache.health_check = AsyncMock(return_value={"status": "healthy"})
+            cache.get.return_value = None
+            cache.set.return_value = True
+            cache.health_check.return_value = {"status": "healthy"}
             cache.get_stats.return_value = {"keyspace_hits": 100}
             cache.close.return_value = None
 
@@ -1,8 +1,30 @@
 """Test model classes."""
 
-from datetime import datetime
-
-from reddit_analyzer.models import User, Subreddit, Post, Comment
+from datetime import date, datetime
+
+import pytest
+from sqlalchemy import select, text
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import selectinload, sessionmaker
+
+from reddit_analyzer.dataloaders import load_first, load_grouped
+from reddit_analyzer.models.collection_job import rollup_collection_summary
+from reddit_analyzer.models.political_analysis import upsert_community_overlaps
+from reddit_analyzer.models import (
+    User,
+    Subreddit,
+    Post,
+    Comment,
+    APIRequest,
+    CollectionJob,
+    CollectionSummary,
+    CommunityOverlap,
+    SystemMetric,
+    TextAnalysis,
+    PoliticalDimensionsAnalysis,
+    AdvancedTopic,
+)
+from reddit_analyzer.monitoring.metrics_buffer import MetricsBuffer
 
 
 class TestUser:
@@ -24,12 +46,38 @@ class TestUser:
         assert user.is_verified is True
         assert user.created_at is not None
 
+    def test_updated_at_readable_after_detach(self, test_engine):
+        """Test updated_at is loaded by the UPDATE, not left expired."""
+        Session = sessionmaker(bind=test_engine, expire_on_commit=False)
+        with Session() as session:
+            user = User(username="detached")
+            session.add(user)
+            session.commit()
+            user.comment_karma = 5
+            session.commit()
+
+        assert user.updated_at is not None
+
     def test_user_repr(self):
         """Test user string representation."""
         user = User(username="testuser")
         user.id = 1
         assert repr(user) == "<User(id=1, username='testuser')>"
 
+    def test_user_describe_skips_unloaded(self, test_db):
+        """Test describe() reports loaded columns without loading others."""
+        user = User(username="testuser", comment_karma=100)
+        test_db.add(user)
+        test_db.commit()
+
+        # Commit expired every attribute; describe() must not refresh them
+        assert user.describe() == "<User()>"
+
+        test_db.refresh(user)
+        description = user.describe()
+        assert "username='testuser'" in description
+        assert "comment_karma=100" in description
+
 
 class TestSubreddit:
     """Test Subreddit model."""
@@ -193,3 +241,294 @@ class TestComment:
         # Test relationships
         assert comment.post.title == "Test Post"
         assert comment.author.username == "testuser"
+
+    def test_comment_thread(self, test_db):
+        """Test a thread is loaded level by level from its root."""
+        subreddit = Subreddit(name="python")
+        test_db.add(subreddit)
+        test_db.commit()
+        test_db.add(
+            Post(
+                id="abc123",
+                title="Test Post",
+                subreddit_id=subreddit.id,
+                created_utc=datetime.utcnow(),
+            )
+        )
+        for comment_id, parent_id, minute in [
+            ("root", None, 0),
+            ("other", None, 1),
+            ("reply2", "root", 3),
+            ("reply1", "root", 2),
+            ("nested", "reply1", 4),
+        ]:
+            test_db.add(
+                Comment(
+                    id=comment_id,
+                    post_id="abc123",
+                    parent_id=parent_id,
+                    created_utc=datetime(2026, 1, 15, 12, minute),
+                )
+            )
+        test_db.commit()
+
+        thread = Comment.thread(test_db, "root")
+        assert [c.id for c in thread] == ["root", "reply1", "reply2", "nested"]
+
+    def test_deleting_parent_detaches_replies(self, test_db):
+        """Test deleting a parent comment leaves its replies top level."""
+        test_db.execute(text("PRAGMA foreign_keys=ON"))
+        test_db.add(Post(id="abc123", title="Test Post", created_utc=datetime.utcnow()))
+        test_db.add(Comment(id="root", post_id="abc123", created_utc=datetime.utcnow()))
+        test_db.add(
+            Comment(
+                id="reply",
+                post_id="abc123",
+                parent_id="root",
+                created_utc=datetime.utcnow(),
+            )
+        )
+        test_db.commit()
+
+        test_db.query(Comment).filter(Comment.id == "root").delete()
+        test_db.commit()
+
+        assert test_db.scalar(select(Comment.parent_id)) is None
+
+
+class TestTextAnalysis:
+    """Test TextAnalysis model."""
+
+    def test_emotion_scores_are_rounded(self, test_db):
+        """Test score floats are stored with three decimals."""
+        analysis = TextAnalysis(emotion_scores={"joy": 0.123456789, "anger": 1})
+        test_db.add(analysis)
+        test_db.commit()
+        test_db.expire_all()
+
+        assert analysis.emotion_scores == {"joy": 0.123, "anger": 1}
+
+    def test_feature_columns_are_deferred(self, test_db):
+        """Test JSON feature columns are only loaded when accessed."""
+        test_db.add(TextAnalysis(sentiment_score=0.5, keywords=["python"]))
+        test_db.commit()
+        test_db.expunge_all()
+
+        analysis = test_db.query(TextAnalysis).one()
+        assert "keywords" not in analysis.__dict__
+        assert "sentiment_score" in analysis.__dict__
+        assert analysis.keywords == ["python"]
+
+
+class TestExplicitLoading:
+    """Test relationships that must be loaded explicitly."""
+
+    def test_political_dimensions_require_explicit_load(self, strict_db):
+        """Test heavy relationships raise instead of lazy loading."""
+        analysis = TextAnalysis(sentiment_label="neutral")
+        strict_db.add(analysis)
+        strict_db.flush()
+        strict_db.add(
+            PoliticalDimensionsAnalysis(
+                text_analysis_id=analysis.id, economic_evidence={"tax": 1}
+            )
+        )
+        strict_db.commit()
+        strict_db.expunge_all()
+
+        analysis = strict_db.query(TextAnalysis).one()
+        with pytest.raises(InvalidRequestError):
+            analysis.political_dimensions
+
+        strict_db.expunge_all()
+        analysis = (
+            strict_db.query(TextAnalysis)
+            .options(selectinload(TextAnalysis.political_dimensions))
+            .one()
+        )
+        assert analysis.political_dimensions.economic_evidence == {"tax": 1}
+
+
+class TestAdvancedTopic:
+    """Test AdvancedTopic model."""
+
+    def test_find_similar(self, test_db):
+        """Test topics are ranked by cosine distance to the query."""
+        for topic_id, subreddit, embedding in [
+            (1, None, [1.0, 0.0]),
+            (2, None, [0.0, 1.0]),
+            (3, None, [0.7, 0.7]),
+            (4, None, None),
+        ]:
+            test_db.add(
+                AdvancedTopic(
+                    topic_id=topic_id,
+                    subreddit_name=subreddit,
+                    model_type="bertopic",
+                    top_words=[],
+                    document_count=1,
+                    embedding=embedding,
+                )
+            )
+        test_db.commit()
+
+        similar = AdvancedTopic.find_similar(test_db, [1.0, 0.1], k=2)
+        assert [t.topic_id for t in similar] == [1, 3]
+
+
+class TestCollectionSummary:
+    """Test the daily collection summary rollup."""
+
+    def test_rollup_collection_summary(self, test_db):
+        """Test jobs and requests are aggregated per subreddit and upserted."""
+        day = datetime(2026, 1, 15, 12)
+        test_db.add_all(
+            [
+                CollectionJob(
+                    job_type="collect_subreddit_posts",
+                    subreddit_name="python",
+                    status="completed",
+                    items_collected=10,
+                    task_id="t1",
+                    created_at=day,
+                ),
+                CollectionJob(
+                    job_type="collect_post_comments",
+                    subreddit_name="python",
+                    status="failed",
+                    items_collected=3,
+                    task_id="t2",
+                    created_at=day,
+                ),
+                APIRequest(
+                    endpoint="/r/python",
+                    method="GET",
+                    response_time_ms=100,
+                    rate_limited=True,
+                    task_id="t1",
+                    created_at=day,
+                ),
+                APIRequest(
+                    endpoint="/r/python",
+                    method="GET",
+                    response_time_ms=300,
+                    task_id="t2",
+                    created_at=day,
+                ),
+            ]
+        )
+        test_db.commit()
+
+        # A rerun replaces the day's rows instead of duplicating them
+        rollup_collection_summary(test_db, date(2026, 1, 15))
+        rollup_collection_summary(test_db, date(2026, 1, 15))
+        test_db.commit()
+
+        summary = test_db.query(CollectionSummary).one()
+        assert summary.date == datetime(2026, 1, 15)
+        assert summary.subreddit_name == "python"
+        assert summary.total_posts_collected == 10
+        assert summary.total_comments_collected == 3
+        assert summary.successful_jobs == 1
+        assert summary.failed_jobs == 1
+        assert summary.total_api_requests == 2
+        assert summary.rate_limited_requests == 1
+        assert summary.average_response_time_ms == 200
+        assert summary.collection_efficiency == 0.5
+
+
+class TestCommunityOverlap:
+    """Test CommunityOverlap snapshots."""
+
+    def test_upsert_community_overlaps(self, test_db):
+        """Test snapshots are inserted once and updated on conflict."""
+        subreddits = [Subreddit(name=f"sub{i}") for i in range(3)]
+        test_db.add_all(subreddits)
+        test_db.commit()
+        day = datetime(2026, 1, 15)
+
+        rows = [
+            {
+                "subreddit_a_id": subreddits[0].id,
+                "subreddit_b_id": other.id,
+                "analysis_date": day,
+                "user_overlap_count": 1,
+            }
+            for other in subreddits[1:]
+        ]
+        assert upsert_community_overlaps(test_db, rows, chunk_size=1) == 2
+
+        rows[0]["user_overlap_count"] = 5
+        upsert_community_overlaps(test_db, rows)
+        test_db.commit()
+
+        counts = {
+            o.subreddit_b_id: o.user_overlap_count
+            for o in test_db.query(CommunityOverlap).all()
+        }
+        assert counts == {subreddits[1].id: 5, subreddits[2].id: 1}
+
+
+class TestDataloaders:
+    """Test batched IN (...) loaders."""
+
+    def test_load_grouped_and_first(self, test_db):
+        """Test rows are grouped by key and unmatched keys are omitted."""
+        alice = User(username="alice")
+        bob = User(username="bob")
+        subreddit = Subreddit(name="python")
+        test_db.add_all([alice, bob, subreddit])
+        test_db.commit()
+
+        for i, author in enumerate([alice, bob, alice]):
+            test_db.add(
+                Post(
+                    id=f"post{i}",
+                    title=f"Post {i}",
+                    author_id=author.id,
+                    subreddit_id=subreddit.id,
+                    created_utc=datetime.utcnow(),
+                )
+            )
+        test_db.commit()
+
+        keys = [alice.id, bob.id, None, 9999]
+        grouped = load_grouped(test_db, Post.author_id, keys)
+        assert {k: [p.id for p in v] for k, v in grouped.items()} == {
+            alice.id: ["post0", "post2"],
+            bob.id: ["post1"],
+        }
+
+        first = load_first(test_db, Post.author_id, keys, Post.id != "post0")
+        assert first[alice.id].id == "post2"
+        assert first[bob.id].id == "post1"
+
+
+class TestMetricsBuffer:
+    """Test batched metric writes."""
+
+    def test_flush_writes_buffered_rows(self, test_db):
+        """Test rows are held until flush and stamped when buffered."""
+        buffer = MetricsBuffer(session_factory=lambda: test_db, max_rows=10)
+        buffer.add(APIRequest, endpoint="/r/python/hot", method="GET")
+        buffer.add(APIRequest, endpoint="/r/python/new", method="GET", status_code=200)
+        buffer.add(SystemMetric, metric_name="queue_depth", metric_value=3.0)
+
+        assert len(buffer) == 3
+        assert test_db.query(APIRequest).count() == 0
+
+        assert buffer.flush() == 3
+        assert len(buffer) == 0
+        assert test_db.query(APIRequest).count() == 2
+        metric = test_db.query(SystemMetric).one()
+        assert metric.metric_value == 3.0
+        assert metric.created_at is not None
+
+    def test_flushes_automatically_at_max_rows(self, test_db):
+        """Test reaching max_rows triggers a flush."""
+        buffer = MetricsBuffer(session_factory=lambda: test_db, max_rows=2)
+        buffer.add(SystemMetric, metric_name="a", metric_value=1.0)
+        buffer.add(SystemMetric, metric_name="b", metric_value=2.0)
+
+        assert len(buffer) == 0
+        assert test_db.query(SystemMetric).count() == 2
@@ -2,6 +2,10 @@
 
 import pytest
 import json
+import jwt
+import time
+import typer
+from datetime import datetime, timedelta
 from unittest.mock import patch, MagicMock
 from typer.testing import CliRunner
 from sqlalchemy.orm import Session
@@ -155,6 +159,92 @@ class TestCLIAuthManager:
                 "valid_token", mock_db
             )
 
+    def test_stored_tokens_are_memoized(self, cli_auth):
+        """Test the token file is only re-parsed after it changes."""
+        cli_auth._store_tokens({"access_token": "first"})
+        assert cli_auth.get_access_token() == "first"
+
+        # Unchanged file is served from the cache without reopening it
+        with patch("builtins.open", side_effect=AssertionError("file reread")):
+            assert cli_auth.get_stored_tokens() == {"access_token": "first"}
+
+        cli_auth._store_tokens({"access_token": "second-token"})
+        assert cli_auth.get_access_token() == "second-token"
+
+        cli_auth.token_file.unlink()
+        assert cli_auth.get_stored_tokens() is None
+
+    def test_current_user_is_cached_per_token(self, cli_auth, test_user):
+        """Test repeated lookups with the same token skip the database."""
+        token = jwt.encode(
+            {"sub": "1", "exp": datetime.utcnow() + timedelta(minutes=30)}, "x" * 32
+        )
+        cli_auth._store_tokens({"access_token": token})
+        cli_auth.auth_service.get_current_user.return_value = test_user
+
+        with patch("reddit_analyzer.cli.utils.auth_manager.get_db") as mock_get_db:
+            mock_get_db.return_value = iter([MagicMock(), MagicMock()])
+
+            assert cli_auth.get_current_user() == test_user
+            assert cli_auth.get_current_user() == test_user
+            assert cli_auth.auth_service.get_current_user.call_count == 1
+
+            cli_auth.logout()
+            assert cli_auth.get_current_user() is None
+
+    def test_cached_user_expires_with_token(self, cli_auth, test_user):
+        """Test a cached lookup is redone once the token's exp has passed."""
+        token = jwt.encode(
+            {"sub": "1", "exp": datetime.utcnow() + timedelta(minutes=30)}, "x" * 32
+        )
+        cli_auth._store_tokens({"access_token": token})
+        cli_auth.auth_service.get_current_user.return_value = test_user
+
+        with patch("reddit_analyzer.cli.utils.auth_manager.get_db") as mock_get_db:
+            mock_get_db.return_value = iter([MagicMock(), MagicMock()])
+            assert cli_auth.get_current_user() == test_user
+
+            # The token expires; the auth service now rejects it
+            cli_auth.auth_service.get_current_user.return_value = None
+            with patch(
+                "reddit_analyzer.cli.utils.auth_manager.time.time",
+                return_value=time.time() + 3600,
+            ):
+                assert cli_auth.get_current_user() is None
+            assert cli_auth.auth_service.get_current_user.call_count == 2
+
+    def test_require_auth_reuses_recent_verification(self, cli_auth):
+        """Test nested decorated calls skip re-verifying a fresh login."""
+        user = User(username="nested", role=UserRole.USER)
+        token = jwt.encode(
+            {"sub": "1", "exp": datetime.utcnow() + timedelta(minutes=30)}, "x" * 32
+        )
+        cli_auth.skip_auth = False
+        cli_auth._store_tokens({"access_token": token})
+        cli_auth.auth_service.get_current_user.return_value = user
+
+        @cli_auth.require_auth()
+        def inner():
+            return "inner"
+
+        @cli_auth.require_auth()
+        def outer():
+            return inner()
+
+        with patch("reddit_analyzer.cli.utils.auth_manager.get_db") as mock_get_db:
+            mock_get_db.return_value = iter([MagicMock()])
+
+            with patch.object(
+                cli_auth, "get_current_user", wraps=cli_auth.get_current_user
+            ) as get_current_user:
+                assert outer() == "inner"
+                assert get_current_user.call_count == 1
+
+            # Logging out drops the shortcut
+            cli_auth.logout()
+            with pytest.raises(typer.Exit):
+                outer()
+
     def test_require_auth_decorator(self, cli_auth, test_user):
         """Test authentication requirement decorator."""
 
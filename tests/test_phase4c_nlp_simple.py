@@ -56,6 +56,18 @@ class TestNLPService:
         result = nlp.analyze_text(None)
         assert result["sentiment"]["compound"] == 0.0
 
+    def test_analyze_batch_matches_input_order(self):
+        """Test batch analysis returns one result per text, in order."""
+        nlp = get_nlp_service()
+
+        texts = ["I love this!", "", "This is terrible."]
+        results = nlp.analyze_batch(texts)
+
+        assert len(results) == len(texts)
+        assert results[1]["sentiment"]["compound"] == 0.0
+        assert results[0]["text"] == texts[0]
+        assert results[2]["text"] == texts[2]
+
     def test_sentiment_analysis_vader(self):
         """Test VADER sentiment analysis specifically."""
         nlp = get_nlp_service()
@@ -110,7 +110,9 @@ def mock_db_session():
             elif model == Post:
                 # For Post queries
                 filter_mock = Mock()
-                filter_mock.order_by.return_value.limit.return_value.all.return_value = test_posts
+                filter_mock.order_by.return_value.limit.return_value.all.return_value = (
+                    test_posts
+                )
                 filter_mock.order_by.return_value.all.return_value = test_posts
                 query_mock.filter.return_value = filter_mock
             elif model == Comment:
@@ -417,3 +419,22 @@ class TestErrorHandling:
         finally:
             # Restore test mode
             auth_manager.cli_auth.skip_auth = original_skip_auth
+
+
+class TestKeywordCounting:
+    """Test keyword counting for the nlp keywords command."""
+
+    @pytest.mark.parametrize("use_automaton", [False, True])
+    def test_counts_match_str_count(self, use_automaton):
+        """Test both counting paths count non-overlapping, case-folded matches."""
+        from reddit_analyzer.cli import nlp
+
+        if use_automaton and not nlp.AHOCORASICK_AVAILABLE:
+            pytest.skip("pyahocorasick not installed")
+
+        with patch.object(nlp, "AHOCORASICK_AVAILABLE", use_automaton):
+            counts = nlp._count_keyword_occurrences(
+                "aaaa python", ["aa", "Python", "python"]
+            )
+
+        assert counts == {"aa": 2, "Python": 1, "python": 1}
@@ -69,6 +69,30 @@ class TestRedditClient:
         # Verify subreddit was requested correctly
         mock_reddit_instance.subreddit.assert_called_with("python")
 
+    @patch("reddit_analyzer.services.reddit_client.config")
+    @patch("reddit_analyzer.services.reddit_client.praw.Reddit")
+    def test_user_info_is_memoized(self, mock_reddit, mock_config):
+        """Test repeated user lookups reuse the first API response."""
+        mock_reddit_instance = Mock()
+        mock_reddit.return_value = mock_reddit_instance
+        mock_reddit_instance.user.me.return_value = Mock()
+
+        mock_redditor = Mock()
+        mock_redditor.name = "testuser"
+        mock_redditor.created_utc = 1234567890
+        mock_redditor.comment_karma = 10
+        mock_redditor.link_karma = 20
+        mock_redditor.verified = True
+        mock_reddit_instance.redditor.return_value = mock_redditor
+
+        client = RedditClient()
+        first = client.get_user_info("testuser")
+        second = client.get_user_info("testuser")
+
+        assert first == second
+        assert first["link_karma"] == 20
+        mock_reddit_instance.redditor.assert_called_once_with("testuser")
+
     @patch("app.services.reddit_client.praw.Reddit")
     def test_get_subreddit_posts(self, mock_reddit):
         """Test getting subreddit posts."""